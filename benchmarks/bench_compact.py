@@ -0,0 +1,65 @@
+"""Compares the curve memory of wells loaded as LAS objects and as a compact store,
+for the tutorial LAS files in the docs folder replicated N times.
+
+    python benchmarks/bench_compact.py --copies 500
+
+"""
+import argparse
+import pathlib
+import shutil
+import tempfile
+import time
+
+import pphys
+
+DOCS = pathlib.Path(__file__).parents[1] / "docs"
+
+def replicate(source_path:pathlib.Path,copies:int):
+	"""Copies tutorial LAS files into the source path, returns number of files."""
+	count = 0
+
+	for las_file in sorted(DOCS.glob("tutorial_*.LAS")):
+		for index in range(copies):
+			shutil.copy(las_file,source_path / f"{las_file.stem}_{index:04d}.las")
+			count += 1
+
+	return count
+
+def main():
+
+	parser = argparse.ArgumentParser(description=__doc__)
+
+	parser.add_argument("--copies",type=int,default=100)
+
+	args = parser.parse_args()
+
+	with tempfile.TemporaryDirectory() as temp:
+
+		source_path = pathlib.Path(temp) / "source"
+		cache_path = pathlib.Path(temp) / "cache"
+
+		source_path.mkdir()
+
+		count = replicate(source_path,args.copies)
+
+		pphys.load(source_path,cache_path) # warms the cache
+
+		start = time.perf_counter()
+		las_files = pphys.load(source_path,cache_path)
+		plain = time.perf_counter()-start
+
+		nbytes = sum(curve.data.nbytes for las in las_files.values() for curve in las.curves)
+
+		del las_files
+
+		start = time.perf_counter()
+		store = pphys.load(source_path,cache_path,compact=True)
+		compact = time.perf_counter()-start
+
+	print(f"{count} wells, {len(store.grids)} distinct depth grids")
+	print(f"plain   : {nbytes/1e6:9.1f} MB  ({plain:6.2f} s)")
+	print(f"compact : {store.nbytes/1e6:9.1f} MB  ({compact:6.2f} s)")
+	print(f"ratio   : {store.nbytes/nbytes:9.2f}")
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,66 @@
+"""Compares serial and parallel ingestion of the tutorial LAS files in the docs
+folder replicated N times, each run starts from an empty cache.
+
+    python benchmarks/bench_load.py --copies 50 --workers 4
+
+"""
+import argparse
+import pathlib
+import shutil
+import tempfile
+import time
+
+import pphys
+
+DOCS = pathlib.Path(__file__).parents[1] / "docs"
+
+def replicate(source_path:pathlib.Path,copies:int):
+	"""Copies tutorial LAS files into the source path, returns number of files."""
+	count = 0
+
+	for las_file in sorted(DOCS.glob("tutorial_*.LAS")):
+		for index in range(copies):
+			shutil.copy(las_file,source_path / f"{las_file.stem}_{index:04d}.las")
+			count += 1
+
+	return count
+
+def ingest(source_path:pathlib.Path,cache_path:pathlib.Path,**kwargs):
+	"""Loads the source path into an empty cache, returns elapsed seconds."""
+	shutil.rmtree(cache_path,ignore_errors=True)
+
+	start = time.perf_counter()
+
+	las_files = pphys.load(source_path,cache_path,**kwargs)
+
+	return time.perf_counter()-start,len(las_files)
+
+def main():
+
+	parser = argparse.ArgumentParser(description=__doc__)
+
+	parser.add_argument("--copies",type=int,default=20)
+	parser.add_argument("--workers",type=int,default=4)
+	parser.add_argument("--backend",default="pickle")
+
+	args = parser.parse_args()
+
+	with tempfile.TemporaryDirectory() as temp:
+
+		source_path = pathlib.Path(temp) / "source"
+		cache_path = pathlib.Path(temp) / "cache"
+
+		source_path.mkdir()
+
+		count = replicate(source_path,args.copies)
+
+		serial,_ = ingest(source_path,cache_path,backend=args.backend)
+		parallel,_ = ingest(source_path,cache_path,backend=args.backend,workers=args.workers)
+
+	print(f"{count} files, backend={args.backend}")
+	print(f"serial              : {serial:8.3f} s  ({count/serial:8.1f} files/s)")
+	print(f"parallel ({args.workers:2d} workers): {parallel:8.3f} s  ({count/parallel:8.1f} files/s)")
+	print(f"speedup             : {serial/parallel:8.2f}x")
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,64 @@
+"""Compares parse throughput (MB/s) of the lasio engine and the fast engine of LASIO
+on the tutorial LAS files in the docs folder, their data sections repeated N times.
+
+    python benchmarks/bench_parse.py --scale 100 --workers 4
+
+"""
+import argparse
+import pathlib
+import tempfile
+import time
+
+from pphys._lasio import LASIO
+
+DOCS = pathlib.Path(__file__).parents[1] / "docs"
+
+def scale(las_file:pathlib.Path,target:pathlib.Path,times:int):
+	"""Writes the LAS file with its data section repeated, returns the size in MB."""
+	text = las_file.read_text()
+
+	start = text.index("\n",text.upper().index("~A"))+1
+
+	target.write_text(text[:start]+text[start:]*times)
+
+	return target.stat().st_size/1e6
+
+def throughput(las_file:pathlib.Path,size:float,repeat:int,**kwargs):
+	"""Returns the best parse throughput in MB/s."""
+	elapsed = []
+
+	for _ in range(repeat):
+		start = time.perf_counter()
+		LASIO(str(las_file),**kwargs)
+		elapsed.append(time.perf_counter()-start)
+
+	return size/min(elapsed)
+
+def main():
+
+	parser = argparse.ArgumentParser(description=__doc__)
+
+	parser.add_argument("--scale",type=int,default=50)
+	parser.add_argument("--workers",type=int,default=4)
+	parser.add_argument("--repeat",type=int,default=3)
+
+	args = parser.parse_args()
+
+	print(f"{'file':40s} {'MB':>7s} {'lasio':>9s} {'fast x1':>9s} {'fast x'+str(args.workers):>9s}")
+
+	with tempfile.TemporaryDirectory() as temp:
+
+		for las_file in sorted(DOCS.glob("tutorial_*.LAS")):
+
+			target = pathlib.Path(temp) / las_file.name
+
+			size = scale(las_file,target,args.scale)
+
+			normal = throughput(target,size,args.repeat)
+			single = throughput(target,size,args.repeat,engine="fast",workers=1)
+			multi = throughput(target,size,args.repeat,engine="fast",workers=args.workers)
+
+			print(f"{las_file.name:40s} {size:7.1f} {normal:9.1f} {single:9.1f} {multi:9.1f}")
+
+if __name__ == "__main__":
+	main()
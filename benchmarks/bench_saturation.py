@@ -0,0 +1,76 @@
+"""Times the vectorized Simandoux and total shale saturations over 10^4-10^7 samples
+against solving each sample with scipy's root_scalar, the per-sample loop is timed on
+the smallest size only.
+
+    python benchmarks/bench_saturation.py --sizes 4 5 6 7
+
+"""
+import argparse
+import time
+
+import numpy
+
+from scipy.optimize import root_scalar
+
+from pphys.insight.saturation._archie import archie
+from pphys.insight.saturation.shalyform import simandoux, totalshale
+
+def logs(size:int,seed:int=0):
+	"""Returns random porosity, shale volume, water, shale and true resistivity logs."""
+	rng = numpy.random.default_rng(seed)
+
+	return (
+		rng.uniform(0.05,0.35,size),
+		rng.uniform(0.,0.6,size),
+		rng.uniform(0.01,0.2,size),
+		rng.uniform(1.,5.,size),
+		rng.uniform(0.5,200.,size),
+		)
+
+def per_sample(model,porosity,vshale,rwater,rshale,rtotal):
+	"""Reference solution, one root_scalar call per sample."""
+	a,m,n = model.archie.a,model.archie.m,model.archie.n
+
+	saturation = numpy.empty(porosity.size)
+
+	for index,args in enumerate(zip(porosity,vshale,rwater,rshale,rtotal)):
+		saturation[index] = root_scalar(model.sw_forward,method="newton",x0=1,
+			fprime=model.sw_derivative,args=(*args,a,m,n)).root
+
+	return saturation
+
+def main():
+
+	parser = argparse.ArgumentParser(description=__doc__)
+
+	parser.add_argument("--sizes",type=int,nargs="+",default=[4,5,6,7])
+
+	args = parser.parse_args()
+
+	for n in (2.,2.3):
+
+		for model in (simandoux(archie(n=n)),totalshale(archie(n=n))):
+
+			name = f"{model.__class__.__name__} n={n}"
+
+			for power in args.sizes:
+
+				values = logs(10**power)
+
+				start = time.perf_counter()
+				saturation = model.sw(*values,lower=None,upper=None)
+				vectorized = time.perf_counter()-start
+
+				line = f"{name:20s} 10^{power}: {vectorized:8.3f} s"
+
+				if power == min(args.sizes):
+					start = time.perf_counter()
+					reference = per_sample(model,*values)
+					loop = time.perf_counter()-start
+					error = numpy.max(numpy.abs(saturation-reference)/reference)
+					line += f"  per-sample {loop:8.3f} s  speedup {loop/vectorized:8.0f}x  max rel. diff {error:.1e}"
+
+				print(line)
+
+if __name__ == "__main__":
+	main()
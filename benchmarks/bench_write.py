@@ -0,0 +1,91 @@
+"""Compares LAS writing throughput (MB/s) of a per-sample formatting writer and
+pphys.write against writing the same bytes to disk, for a field of synthetic wells.
+
+    python benchmarks/bench_write.py --wells 100 --samples 20000 --curves 12
+
+"""
+import argparse
+import pathlib
+import tempfile
+import time
+
+import numpy
+
+import pphys
+
+def per_sample(file_path:pathlib.Path,values:numpy.ndarray,mnemonics:list,null:float=-999.25):
+	"""Reference writer formatting every sample with a Python function."""
+	def fmt(value:float) -> str:
+		if not numpy.isfinite(value):
+			return f"{null:.4f}"
+		return f"{value:.4f}"
+
+	lines = ["~Version","~Well","~Curve",*[f" {mnemonic}.  : " for mnemonic in mnemonics],"~ASCII"]
+
+	for row in values:
+		lines.append(" ".join(fmt(float(value)) for value in row))
+
+	with open(file_path,"w") as f:
+		f.write("\n".join(lines)+"\n")
+
+def field(wells:int,samples:int,curves:int,seed:int=0):
+	"""Yields synthetic interpreted wells, depth followed by curves with gaps."""
+	rng = numpy.random.default_rng(seed)
+
+	for _ in range(wells):
+		values = numpy.empty((samples,curves+1))
+		values[:,0] = 1000+0.1524*numpy.arange(samples)
+		values[:,1:] = rng.random((samples,curves))
+		values[rng.random(values.shape)<0.01] = numpy.nan
+		values[:,0] = 1000+0.1524*numpy.arange(samples)
+		yield values
+
+def main():
+
+	parser = argparse.ArgumentParser(description=__doc__)
+
+	parser.add_argument("--wells",type=int,default=20)
+	parser.add_argument("--samples",type=int,default=20000)
+	parser.add_argument("--curves",type=int,default=12)
+
+	args = parser.parse_args()
+
+	mnemonics = ["DEPT",*[f"C{index:02d}" for index in range(args.curves)]]
+
+	timings = dict(reference=0.,pphys=0.,gzip=0.,disk=0.)
+
+	nbytes = 0
+
+	with tempfile.TemporaryDirectory() as temp:
+
+		temp = pathlib.Path(temp)
+
+		for index,values in enumerate(field(args.wells,args.samples,args.curves)):
+
+			start = time.perf_counter()
+			per_sample(temp / "reference.las",values,mnemonics)
+			timings["reference"] += time.perf_counter()-start
+
+			start = time.perf_counter()
+			pphys.write(temp / f"well_{index:04d}.las",values,mnemonics=mnemonics)
+			timings["pphys"] += time.perf_counter()-start
+
+			start = time.perf_counter()
+			pphys.write(temp / f"well_{index:04d}.las.gz",values,mnemonics=mnemonics,compresslevel=1)
+			timings["gzip"] += time.perf_counter()-start
+
+			content = (temp / f"well_{index:04d}.las").read_bytes()
+
+			start = time.perf_counter()
+			(temp / "disk.las").write_bytes(content)
+			timings["disk"] += time.perf_counter()-start
+
+			nbytes += len(content)
+
+	print(f"{args.wells} wells, {args.samples} samples, {args.curves} curves, {nbytes/1e6:.1f} MB")
+
+	for name,elapsed in timings.items():
+		print(f"{name:10s}: {elapsed:8.3f} s  ({nbytes/1e6/elapsed:8.1f} MB/s)")
+
+if __name__ == "__main__":
+	main()
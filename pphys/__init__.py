@@ -1,4 +1,11 @@
 from . import onepage
 
 from ._read import read
-from ._load import load
\ No newline at end of file
+from ._load import load, LazyLoad
+from ._scan import scan, WellIndex
+from ._chunks import ChunkReader
+from ._write import write
+from ._compact import compact, CompactStore
+from ._dataset import export, Dataset
+
+from ._manager import CacheManager
\ No newline at end of file
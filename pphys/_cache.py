@@ -0,0 +1,219 @@
+import contextlib
+import hashlib
+import json
+import os
+import pathlib
+import secrets
+import time
+
+import lasio
+
+FORMAT = 1
+
+PARSER = f"pphys-cache-{FORMAT}/lasio-{lasio.__version__}"
+
+CHUNK = 1<<20
+
+@contextlib.contextmanager
+def atomic(cache_file:str,mode:str="wb"):
+	"""Opens a temporary file next to the cache file and renames it onto the cache
+	file when writing is done. Readers never see a partially written cache, and two
+	processes writing the same cache file do not corrupt each other, the last rename
+	wins. The file gets the permissions of a file created by open, i.e. the umask of
+	the process applies, so that caches shared by several users stay readable."""
+	cache_file = pathlib.Path(cache_file)
+
+	handle,temp_file = _create(cache_file)
+
+	try:
+		with os.fdopen(handle,mode) as f:
+			yield f
+		os.replace(temp_file,cache_file)
+	except BaseException:
+		with contextlib.suppress(FileNotFoundError):
+			os.remove(temp_file)
+		raise
+
+def _create(cache_file:pathlib.Path):
+	"""Creates a new temporary file next to the cache file with mode 0o666 less the
+	umask (tempfile.mkstemp would create it with 0o600), returns its handle and path."""
+	flags = os.O_WRONLY|os.O_CREAT|os.O_EXCL|getattr(os,"O_BINARY",0)
+
+	while True:
+		temp_file = cache_file.with_name(f".{cache_file.name}.{secrets.token_hex(6)}.tmp")
+		try:
+			return os.open(temp_file,flags,0o666),temp_file
+		except FileExistsError:
+			continue
+
+def get_key(file_path:str) -> str:
+	"""Returns the cache key of the LAS file: its name followed by a short digest of its
+	absolute path, so wells with the same name in different folders do not collide."""
+	file_path = pathlib.Path(file_path).resolve()
+
+	digest = hashlib.blake2b(str(file_path).encode(),digest_size=6).hexdigest()
+
+	return f"{file_path.stem}-{digest}"
+
+def get_checksum(file_path:str,algorithm:str="blake2") -> str:
+	"""Returns the content hash of the file, algorithm is "blake2" or "xxhash"."""
+	if algorithm == "blake2":
+		hasher = hashlib.blake2b(digest_size=16)
+	elif algorithm == "xxhash":
+		try:
+			import xxhash
+		except ImportError as error:
+			raise ImportError("The 'xxhash' checksum requires the xxhash package.") from error
+		hasher = xxhash.xxh3_128()
+	else:
+		raise ValueError(f"Unknown checksum algorithm '{algorithm}', use 'blake2' or 'xxhash'.")
+
+	with open(file_path,"rb") as f:
+		for chunk in iter(lambda: f.read(CHUNK),b""):
+			hasher.update(chunk)
+
+	return f"{algorithm}:{hasher.hexdigest()}"
+
+def get_record_file(cache_file:str) -> pathlib.Path:
+	"""Returns the path of the manifest record of the cache file."""
+	cache_file = pathlib.Path(cache_file)
+
+	return cache_file.with_name(f"{cache_file.name}.manifest")
+
+def fingerprint(file_path:str,kwargs:dict=None,checksum:str=None) -> dict:
+	"""Returns the manifest record of the LAS file: absolute path, size, modification
+	time, optional content hash, parser version and the keyword arguments of LASIO."""
+	file_path = pathlib.Path(file_path).resolve()
+
+	stat = file_path.stat()
+
+	return dict(
+		path = str(file_path),
+		size = stat.st_size,
+		mtime = stat.st_mtime_ns,
+		checksum = None if checksum is None else get_checksum(file_path,checksum),
+		parser = PARSER,
+		kwargs = json.dumps({} if kwargs is None else kwargs,sort_keys=True,default=repr),
+		)
+
+def get_record(cache_file:str) -> dict:
+	"""Returns the manifest record of the cache file, None if it is missing or unreadable."""
+	try:
+		with open(get_record_file(cache_file),"r") as f:
+			return json.load(f)
+	except (OSError,ValueError):
+		return None
+
+def get_entry_files(cache_file:str) -> list:
+	"""Returns all files of the cache entry, the manifest record being the first."""
+	cache_file = pathlib.Path(cache_file)
+
+	entry_files = [get_record_file(cache_file),cache_file]
+
+	if cache_file.suffix == ".json":
+		entry_files.append(cache_file.with_suffix(".npy"))
+
+	return entry_files
+
+def record(file_path:str,cache_file:str,kwargs:dict=None,checksum:str=None,entry:dict=None,parsed:bool=True) -> dict:
+	"""Writes the manifest record of the cache file, it marks the cache entry as complete.
+	Access statistics of the previous record are carried over, misses counting the number
+	of times the file was parsed into the cache."""
+	if entry is None:
+		entry = fingerprint(file_path,kwargs,checksum)
+
+	previous = get_record(cache_file) or {}
+
+	entry["hits"] = previous.get("hits",0)
+	entry["misses"] = previous.get("misses",0)+int(parsed)
+	entry["accessed"] = time.time()
+
+	with atomic(get_record_file(cache_file),"w") as f:
+		json.dump(entry,f)
+
+	return entry
+
+def touch(cache_file:str) -> dict:
+	"""Updates the access time and hit count in the manifest record of the cache file.
+	It is best-effort: nothing is written to a cache directory that is not writable,
+	e.g. a shared read-only cache, and a failed write leaves the record as it is, so a
+	cache hit never fails because of its statistics. Readers updating the same record
+	at once may lose a hit, the last rename wins."""
+	record_file = get_record_file(cache_file)
+
+	if not os.access(record_file.parent,os.W_OK):
+		return
+
+	entry = get_record(cache_file)
+
+	if entry is None:
+		return
+
+	entry["hits"] = entry.get("hits",0)+1
+	entry["accessed"] = time.time()
+
+	try:
+		with atomic(record_file,"w") as f:
+			json.dump(entry,f)
+	except OSError:
+		return
+
+	return entry
+
+def is_fresh(file_path:str,cache_file:str,kwargs:dict=None,checksum:str=None) -> bool:
+	"""Returns True if the cache file exists and was written for the current content
+	of the LAS file, with the same parser version and LASIO keyword arguments.
+
+	Size and modification time are compared first. If they differ but the record has
+	a content hash, the file is hashed, and an unchanged content (e.g. a file copied
+	again by a vendor delivery) refreshes the record instead of invalidating the cache.
+	"""
+	if not pathlib.Path(cache_file).exists():
+		return False
+
+	entry = get_record(cache_file)
+
+	if entry is None:
+		return False
+
+	current = fingerprint(file_path,kwargs)
+
+	for key in ("path","parser","kwargs"):
+		if entry.get(key) != current[key]:
+			return False
+
+	if entry.get("size") == current["size"] and entry.get("mtime") == current["mtime"]:
+		return True
+
+	if checksum is None or entry.get("checksum") is None:
+		return False
+
+	if not entry["checksum"].startswith(f"{checksum}:"):
+		return False
+
+	current["checksum"] = get_checksum(file_path,checksum)
+
+	if entry["checksum"] != current["checksum"]:
+		return False
+
+	record(file_path,cache_file,entry=current,parsed=False)
+
+	return True
+
+def manifest(cache_path:str) -> dict:
+	"""Returns the manifest of the cache directory: records of all cache entries keyed
+	by the absolute path of their LAS files."""
+	entries = {}
+
+	for record_file in sorted(pathlib.Path(cache_path).glob("*.manifest")):
+
+		entry = get_record(record_file.with_suffix(""))
+
+		if entry is None:
+			continue
+
+		entry["cache_file"] = str(record_file.with_suffix(""))
+
+		entries.setdefault(entry["path"],[]).append(entry)
+
+	return entries
@@ -0,0 +1,148 @@
+import itertools
+import warnings
+
+import numpy
+
+from ._lasio import LASIO, DELIMITERS
+
+from ._parse import convert
+
+class ChunkReader():
+
+	def __init__(self,file_path:str,window:float=None,rows:int=10000,**kwargs):
+		"""Streaming reader of the `~A` section of a LAS file. Iterating over it yields
+		two-dimensional numpy arrays (samples x curves, the index being the first
+		column) without materializing the whole data section.
+
+		file_path 	: Path to the LAS file.
+		window 		: Depth length of each chunk, chunk boundaries are multiples of the
+					  window from the first depth. If None, chunks are yielded every
+					  `rows` lines.
+		rows 		: Number of lines parsed at once, it bounds the memory used for
+					  parsing together with the window.
+		**kwargs 	: Keyword arguments passed to LASIO when parsing the header.
+
+		Wrapped and unwrapped files are supported, NULL values are replaced by NaN.
+		The header (a LASIO object without data) is available as `header`.
+		"""
+		self.file_path = file_path
+		self.window = window
+		self.rows = rows
+
+		self.header = LASIO(self._read_header(),ignore_data=True,**kwargs)
+
+		dlm = self.header.version.DLM.value if "DLM" in self.header.version else "SPACE"
+
+		self.delimiter = DELIMITERS.get(str(dlm).strip().upper())
+
+		self.null = self.header.well.NULL.value if "NULL" in self.header.well else None
+
+	def _read_header(self) -> str:
+		"""Returns the text of the header sections, up to and including the `~A` line."""
+		lines = []
+
+		with open(self.file_path,"r",errors="replace") as f:
+			for line in f:
+				lines.append(line)
+				if line.lstrip().upper().startswith("~A"):
+					break
+
+		return "".join(lines)
+
+	def keys(self) -> list:
+		"""Returns the curve mnemonics, the column order of the chunks."""
+		return self.header.keys()
+
+	def __iter__(self):
+
+		if self.window is None:
+			yield from self._blocks()
+			return
+
+		buffer = numpy.empty((0,len(self.keys())))
+
+		origin,sign = None,1
+
+		for block in self._blocks():
+
+			if origin is None:
+				origin = block[0,0]
+				if block.shape[0]>1 and block[-1,0]<block[0,0]:
+					sign = -1 # depths are decreasing
+
+			buffer = numpy.concatenate((buffer,block)) if buffer.size else block
+
+			chunk_ids = numpy.floor(sign*(buffer[:,0]-origin)/self.window)
+
+			# all chunks but the last one are complete, as depths are monotonic
+			complete = numpy.searchsorted(chunk_ids,chunk_ids[-1],side="left")
+
+			for chunk in self._split(buffer[:complete],chunk_ids[:complete]):
+				yield chunk
+
+			buffer = buffer[complete:]
+
+		if buffer.size:
+			chunk_ids = numpy.floor(sign*(buffer[:,0]-origin)/self.window)
+			yield from self._split(buffer,chunk_ids)
+
+	@staticmethod
+	def _split(buffer:numpy.ndarray,chunk_ids:numpy.ndarray):
+		"""Splits the buffer into chunks of equal ids."""
+		if buffer.shape[0]==0:
+			return
+
+		bounds = numpy.flatnonzero(numpy.diff(chunk_ids))+1
+
+		yield from numpy.split(buffer,bounds)
+
+	def _blocks(self):
+		"""Yields the data section parsed in blocks of complete samples."""
+		ncurves = len(self.keys())
+
+		remainder = numpy.empty(0)
+
+		with open(self.file_path,"r",errors="replace") as f:
+
+			for line in f:
+				if line.lstrip().upper().startswith("~A"):
+					break
+
+			while True:
+
+				lines = list(itertools.islice(f,self.rows))
+
+				if not lines:
+					break
+
+				values = self._parse(lines)
+
+				if remainder.size:
+					values = numpy.concatenate((remainder,values))
+
+				# a wrapped sample may continue in the next block
+				count = values.size-values.size%ncurves
+
+				remainder = values[count:]
+
+				if count:
+					yield self._nullify(values[:count].reshape((-1,ncurves)))
+
+		if remainder.size:
+			raise ValueError(f"The data section of {self.file_path} ends with an incomplete sample.")
+
+	def _parse(self,lines:list) -> numpy.ndarray:
+		"""Converts data lines into a flat float array, comment lines are skipped."""
+		with warnings.catch_warnings():
+			warnings.simplefilter("error",DeprecationWarning)
+			try:
+				return convert("".join(lines),self.delimiter)
+			except DeprecationWarning as error:
+				raise ValueError(f"Non-numeric value in the data section of {self.file_path}.") from error
+
+	def _nullify(self,block:numpy.ndarray) -> numpy.ndarray:
+		"""Replaces NULL values of the block with NaN in place."""
+		if self.null is not None:
+			block[block==self.null] = numpy.nan
+
+		return block
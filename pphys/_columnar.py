@@ -0,0 +1,180 @@
+import json
+import pathlib
+
+import lasio
+import numpy
+
+from ._cache import atomic
+from ._lasio import LASIO
+
+FORMAT = 1
+
+class CurveItem(lasio.CurveItem):
+	"""A lasio.CurveItem whose data is read from the columnar cache on first access."""
+
+	def __init__(self,mnemonic="",unit="",value="",descr="",data=None,loader=None):
+
+		super().__init__(mnemonic,unit,value,descr,data)
+
+		if loader is not None:
+			self._data = None
+
+		self._loader = loader
+
+	@property
+	def data(self):
+
+		if self._data is None:
+			self._data = self._loader()
+
+		return self._data
+
+	@data.setter
+	def data(self,value):
+
+		self._data = value
+
+def dump(las:lasio.LASFile,cache_file:str):
+	"""Writes LAS object as a columnar cache: numeric curves are stored as rows of
+	a single `.npy` array (each curve contiguous on disk), and header sections
+	with curve items go into a small `.json` sidecar.
+
+	Parameters:
+	----------
+	las 		: LAS object to be cached.
+	cache_file 	: Path of the `.json` sidecar, the array is stored next to it
+				  with the `.npy` suffix.
+
+	"""
+	cache_file = pathlib.Path(cache_file)
+
+	columns,curves = [],[]
+
+	for curve in las.curves:
+
+		data = numpy.asarray(curve.data)
+
+		item = _item(curve)
+
+		item["dtype"] = data.dtype.str
+
+		if data.dtype.kind in "biuf":
+			item["column"] = len(columns)
+			columns.append(data.astype(float))
+		else:
+			item["data"] = data.tolist()
+
+		curves.append(item)
+
+	array = numpy.vstack(columns) if columns else numpy.empty((0,0))
+
+	header = dict(
+		format = FORMAT,
+		shape = array.shape,
+		index_unit = las.index_unit,
+		encoding = getattr(las,"encoding",None),
+		sections = {},
+		curves = curves,
+		)
+
+	for name,section in las.sections.items():
+
+		if name == "Curves":
+			continue
+
+		if isinstance(section,str):
+			header["sections"][name] = section
+		else:
+			header["sections"][name] = [_item(item) for item in section]
+
+	with atomic(cache_file.with_suffix(".npy"),"wb") as f:
+		numpy.save(f,array)
+
+	# the sidecar is written last, its existence marks a complete cache entry
+	with atomic(cache_file,"w") as f:
+		json.dump(header,f,default=_default)
+
+def load(cache_file:str,mmap:bool=False) -> LASIO:
+	"""Reads the columnar cache written by `dump`. Only the header is parsed here,
+	curve arrays are read from the `.npy` file on their first access. The file is
+	mapped once here, so curves read later come from the same array even if the
+	cache entry is replaced or evicted in the meantime.
+
+	If mmap is True, curve data are read-only `numpy.memmap` views into the `.npy`
+	file and pages are loaded by the operating system only when touched, so the
+	resident memory scales with the depth window being worked on.
+	"""
+	cache_file = pathlib.Path(cache_file)
+
+	with open(cache_file,"r") as f:
+		header = json.load(f)
+
+	las = LASIO(None)
+
+	las.index_unit = header["index_unit"]
+	las.encoding = header["encoding"]
+
+	for name,section in header["sections"].items():
+
+		if isinstance(section,str):
+			las.sections[name] = section
+		else:
+			las.sections[name] = lasio.SectionItems(
+				[_header_item(lasio.HeaderItem,item) for item in section])
+
+	array = None
+
+	if any("column" in item for item in header["curves"]):
+		array = numpy.load(cache_file.with_suffix(".npy"),mmap_mode="r")
+
+	curves = []
+
+	for item in header["curves"]:
+
+		if "column" in item:
+			loader = _loader(array,item["column"],item["dtype"],mmap)
+			curve = _header_item(CurveItem,item,loader=loader)
+		else:
+			data = numpy.asarray(item["data"],dtype=item["dtype"])
+			curve = _header_item(CurveItem,item,data=data)
+
+		curves.append(curve)
+
+	las.sections["Curves"] = lasio.SectionItems(curves)
+
+	return las
+
+def _item(item:lasio.HeaderItem) -> dict:
+	"""Returns header item fields as a dictionary."""
+	return dict(
+		mnemonic = item.mnemonic,
+		original_mnemonic = item.original_mnemonic,
+		unit = item.unit,
+		value = item.value,
+		descr = item.descr,
+		)
+
+def _header_item(cls,item:dict,**kwargs):
+	"""Creates header (or curve) item from the dictionary written by `_item`."""
+	header_item = cls(item["original_mnemonic"],item["unit"],item["value"],item["descr"],**kwargs)
+
+	header_item.set_session_mnemonic_only(item["mnemonic"])
+
+	return header_item
+
+def _loader(array:numpy.memmap,column:int,dtype:str,mmap:bool=False):
+	"""Returns a function that reads a single curve (row) of the mapped array."""
+
+	def load_column():
+		if mmap and array.dtype==numpy.dtype(dtype):
+			return array[column]
+		return numpy.array(array[column],dtype=dtype)
+
+	return load_column
+
+def _default(value):
+	"""Converts numpy scalars (and anything else) to json serializable values."""
+	if isinstance(value,numpy.generic):
+		return value.item()
+
+	return str(value)
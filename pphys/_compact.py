@@ -0,0 +1,166 @@
+import copy
+import hashlib
+
+import lasio
+import numpy
+
+from ._columnar import _item, _header_item
+
+RTOL = 1e-6 # float32 keeps about seven significant digits
+
+class CurveItem(lasio.CurveItem):
+
+	def __init__(self,mnemonic="",unit="",value="",descr="",data=None,rtol:float=RTOL):
+		"""A lasio.CurveItem storing only the valid samples of its data, as float32 when
+		the relative change of every value stays within rtol, together with a validity
+		bitmap. The float64 array with NaN at invalid samples is decoded on first access
+		and kept, so that changes made to it in place are seen by later accesses; call
+		`compress` to encode it again and release it. If rtol is None, values are never
+		downcast."""
+		self._rtol = rtol
+		self._data = None
+
+		super().__init__(mnemonic,unit,value,descr,data)
+
+	@property
+	def data(self):
+
+		if self._data is not None:
+			return self._data
+
+		if self._valid is None:
+			self._data = self._values if self._values.dtype.kind!="f" else self._values.astype(float,copy=False)
+		else:
+			self._data = numpy.full(self._size,numpy.nan)
+			self._data[numpy.unpackbits(self._valid,count=self._size).view(bool)] = self._values
+
+		return self._data
+
+	@data.setter
+	def data(self,value):
+
+		value = numpy.asarray(value)
+
+		self._data = None
+
+		self._size,self._valid = value.size,None
+
+		if value.dtype.kind!="f" or value.ndim!=1:
+			self._values = value
+			return
+
+		valid = ~numpy.isnan(value)
+
+		if not valid.all():
+			self._valid = numpy.packbits(valid)
+			value = value[valid]
+
+		self._values = _downcast(value,self._rtol)
+
+	def compress(self):
+		"""Encodes the decoded data again, keeping the changes made to it, and releases it."""
+		if self._data is not None and self._data is not self._values:
+			self.data = self._data
+
+	@property
+	def nbytes(self) -> int:
+		"""Returns the memory held by the curve data in bytes, the decoded data included."""
+		nbytes = self._values.nbytes+(0 if self._valid is None else self._valid.nbytes)
+
+		if self._data is not None and self._data is not self._values:
+			nbytes += self._data.nbytes
+
+		return nbytes
+
+def compact(las:lasio.LASFile,grids:dict=None,rtol:float=RTOL) -> lasio.LASFile:
+	"""Returns a shallow copy of the LAS object with compact curve items, see `CurveItem`;
+	the LAS object itself is left unchanged. The index is kept as float64; indices found
+	in the grids dictionary (keyed by content) are shared as a single read-only array."""
+	grids = {} if grids is None else grids
+
+	curves = []
+
+	for position,curve in enumerate(las.curves):
+
+		data = numpy.asarray(curve.data)
+
+		if position==0 and data.dtype.kind=="f" and not numpy.isnan(data).any():
+			data = _share(data,grids)
+			item = _header_item(CurveItem,_item(curve),data=data,rtol=None)
+		else:
+			item = _header_item(CurveItem,_item(curve),data=data,rtol=rtol)
+
+		curves.append(item)
+
+	las = copy.copy(las)
+
+	las.sections = dict(las.sections)
+	las.sections["Curves"] = lasio.SectionItems(curves)
+
+	return las
+
+class CompactStore(dict):
+
+	def __init__(self,las_files:dict=None,rtol:float=RTOL):
+		"""Dictionary of LAS objects whose curves are compacted when they are added, see
+		`compact`; identical depth grids are shared by all wells of the store."""
+		super().__init__()
+
+		self.rtol = rtol
+		self.grids = {}
+
+		if las_files is not None:
+			self.update(las_files)
+
+	def __setitem__(self,key,las):
+		super().__setitem__(key,compact(las,self.grids,self.rtol))
+
+	def update(self,las_files:dict):
+		for key,las in las_files.items():
+			self[key] = las
+
+	def compress(self):
+		"""Encodes the curve data decoded by accesses again, see `CurveItem.compress`."""
+		for las in self.values():
+			for curve in las.curves:
+				curve.compress()
+
+	@property
+	def nbytes(self) -> int:
+		"""Returns the memory held by the curve data in bytes, shared grids counted once."""
+		grids = {id(grid) for grid in self.grids.values()}
+
+		nbytes = sum(grid.nbytes for grid in self.grids.values())
+
+		for las in self.values():
+			for curve in las.curves:
+				if not (curve._valid is None and id(curve._values) in grids):
+					nbytes += curve.nbytes
+
+		return nbytes
+
+def _share(index:numpy.ndarray,grids:dict) -> numpy.ndarray:
+	"""Returns the read-only grid equal to the index, registering it if it is new."""
+	index = numpy.ascontiguousarray(index,dtype=float)
+
+	key = (index.size,hashlib.blake2b(index.tobytes(),digest_size=16).hexdigest())
+
+	if key not in grids:
+		grid = index.copy()
+		grid.setflags(write=False)
+		grids[key] = grid
+
+	return grids[key]
+
+def _downcast(values:numpy.ndarray,rtol:float=None) -> numpy.ndarray:
+	"""Returns the values as float32 if the relative change of each is within rtol."""
+	if rtol is None or values.dtype==numpy.float32:
+		return values
+
+	with numpy.errstate(over="ignore"):
+		single = values.astype(numpy.float32)
+
+	if numpy.all(numpy.abs(single-values)<=rtol*numpy.abs(values)):
+		return single
+
+	return values
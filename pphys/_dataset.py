@@ -0,0 +1,242 @@
+import json
+import pathlib
+import urllib.parse
+
+import numpy
+import pandas
+
+from ._cache import atomic
+
+FORMAT = 1
+
+INDEX = "depth"
+
+def export(las_files:dict,dataset_path:str,curves:list=None,row_group_size:int=65536):
+	"""Writes loaded wells into a Parquet dataset partitioned by well, one file per well
+	with the columns depth and curves, sorted by depth. Wells that are already in the
+	dataset are replaced, others are kept, so a field can be exported incrementally.
+	Requires the pyarrow package.
+
+	Parameters:
+	----------
+	las_files 	 : Dictionary of LAS objects keyed by well name, as returned by `pphys.load`.
+	dataset_path : Directory of the dataset, a `well=<name>` directory is written per well.
+	curves 		 : Curve mnemonics to export, all curves by default.
+	row_group_size: Number of samples per row group; depth ranges are skipped by row
+				   group statistics, so smaller groups make depth queries more selective.
+
+	Returns:
+	-------
+	Dataset: the exported dataset.
+
+	"""
+	pa,pq = _pyarrow()
+
+	dataset_path = pathlib.Path(dataset_path)
+
+	dataset_path.mkdir(parents=True,exist_ok=True)
+
+	content = Dataset._content(dataset_path)
+
+	for name,las in las_files.items():
+
+		keys = [key for key in las.keys()[1:] if curves is None or key in curves]
+
+		header = dict(
+			index_unit = las.index_unit,
+			index = las.curves[0].mnemonic,
+			units = {key:las.curves[key].unit for key in keys},
+			well = {item.mnemonic:str(item.value) for item in las.well},
+			)
+
+		order = numpy.argsort(las.index,kind="stable")
+
+		table = pa.table({INDEX:numpy.asarray(las.index,dtype=float)[order],
+			**{key:numpy.asarray(las[key],dtype=float)[order] for key in keys}})
+
+		table = table.replace_schema_metadata({"pphys":json.dumps(header)})
+
+		well_path = dataset_path / f"well={urllib.parse.quote(str(name),safe='')}"
+
+		well_path.mkdir(exist_ok=True)
+
+		with atomic(well_path / "part-0.parquet","wb") as f:
+			pq.write_table(table,f,row_group_size=row_group_size)
+
+		content["wells"][str(name)] = header
+
+		for key in keys:
+			if key not in content["curves"]:
+				content["curves"].append(key)
+
+	with atomic(dataset_path / Dataset.CONTENT,"w") as f:
+		json.dump(content,f)
+
+	return Dataset(dataset_path)
+
+class Dataset():
+
+	CONTENT = "_pphys.json"
+
+	def __init__(self,dataset_path:str):
+		"""Parquet dataset of wells written by `pphys.export`. Queries read only the well
+		partitions, row groups (by depth statistics) and curve columns they select.
+
+		dataset_path : Directory of the dataset.
+
+		Wells sharing a curve mnemonic share its column, curves missing in a well are
+		returned as NaN. Depths are in the index unit of each well, see `header`.
+		"""
+		self.dataset_path = pathlib.Path(dataset_path)
+
+		content = Dataset._content(self.dataset_path)
+
+		self._wells = content["wells"]
+		self._curves = content["curves"]
+
+	@staticmethod
+	def _content(dataset_path:pathlib.Path) -> dict:
+		"""Returns the well headers and curve mnemonics of the dataset."""
+		content_file = dataset_path / Dataset.CONTENT
+
+		if not content_file.exists():
+			return dict(format=FORMAT,wells={},curves=[])
+
+		with open(content_file,"r") as f:
+			content = json.load(f)
+
+		if content.get("format") != FORMAT:
+			raise ValueError(f"Unsupported dataset format in {dataset_path}.")
+
+		return content
+
+	@property
+	def wells(self) -> list:
+		"""Returns the well names."""
+		return list(self._wells)
+
+	@property
+	def curves(self) -> list:
+		"""Returns the curve mnemonics of all wells."""
+		return list(self._curves)
+
+	def header(self,well:str) -> dict:
+		"""Returns the header of the well: index mnemonic and unit, curve units and
+		well section values."""
+		return self._wells[well]
+
+	def dataset(self):
+		"""Returns the pyarrow dataset with the schema of all wells."""
+		pa,_ = _pyarrow()
+
+		import pyarrow.dataset as ds
+
+		schema = pa.schema([(INDEX,pa.float64()),*((key,pa.float64()) for key in self._curves),("well",pa.string())])
+
+		return ds.dataset(self.dataset_path,schema=schema,format="parquet",
+			partitioning=ds.partitioning(pa.schema([("well",pa.string())]),flavor="hive"),
+			exclude_invalid_files=False,ignore_prefixes=[".","_"])
+
+	def batches(self,curves:list=None,wells:list=None,top:float=None,bottom:float=None,batch_size:int=131072):
+		"""Yields pyarrow record batches with the columns well, depth and curves matching
+		the selection, see `query`. Statistics over the field can be accumulated batch by
+		batch without holding all wells in memory."""
+		dataset = self.dataset()
+
+		yield from dataset.to_batches(columns=self._columns(curves),
+			filter=self._filter(wells,top,bottom),batch_size=batch_size)
+
+	def table(self,curves:list=None,wells:list=None,top:float=None,bottom:float=None):
+		"""Returns the selection as a pyarrow table, see `query`."""
+		dataset = self.dataset()
+
+		return dataset.to_table(columns=self._columns(curves),filter=self._filter(wells,top,bottom))
+
+	def query(self,curves:list=None,wells:list=None,top:float=None,bottom:float=None):
+		"""Returns the samples of the selected wells within the depth interval as a
+		pandas.DataFrame with the columns well, depth and curves.
+
+		curves 	: curve mnemonics to read, all curves by default,
+		wells 	: well names to read, all wells by default,
+		top 	: minimum depth of the interval ...
+		bottom 	: ... and its maximum depth, both included.
+
+		Example: RHOB and NPHI of two wells between 2000 and 2500,
+
+			dataset.query(curves=["RHOB","NPHI"],wells=["A-1","A-2"],top=2000,bottom=2500)
+		"""
+		return self.table(curves,wells,top,bottom).to_pandas()
+
+	def histogram(self,curve:str,bins,wells:list=None,top:float=None,bottom:float=None) -> pandas.DataFrame:
+		"""Returns the histogram of the curve per well (rows) over the bin edges (columns),
+		computed batch by batch. NaN values are not counted. The counts are the input of
+		multi-well histogram normalization and cutoff sensitivity."""
+		edges = numpy.asarray(bins,dtype=float)
+
+		counts = {}
+
+		for batch in self.batches([curve],wells,top,bottom):
+
+			names = batch.column("well").to_numpy(zero_copy_only=False)
+			values = batch.column(curve).to_numpy(zero_copy_only=False)
+
+			valid = ~numpy.isnan(values)
+
+			for name in numpy.unique(names):
+				count,_ = numpy.histogram(values[valid&(names==name)],edges)
+				counts[name] = counts.get(name,0)+count
+
+		return pandas.DataFrame.from_dict(counts,orient="index",
+			columns=pandas.IntervalIndex.from_breaks(edges,closed="left"))
+
+	def _columns(self,curves:list=None) -> list:
+		"""Returns the column names read for the curves."""
+		curves = self._curves if curves is None else curves
+
+		unknown = [key for key in curves if key not in self._curves]
+
+		if unknown:
+			raise KeyError(f"Curves {unknown} are not in the dataset.")
+
+		return ["well",INDEX,*curves]
+
+	def _filter(self,wells:list=None,top:float=None,bottom:float=None):
+		"""Returns the filter expression of the selection, None selects everything."""
+		import pyarrow.dataset as ds
+
+		conditions = []
+
+		if wells is not None:
+			conditions.append(ds.field("well").isin([str(well) for well in wells]))
+
+		if top is not None:
+			conditions.append(ds.field(INDEX)>=top)
+
+		if bottom is not None:
+			conditions.append(ds.field(INDEX)<=bottom)
+
+		if not conditions:
+			return None
+
+		expression = conditions[0]
+
+		for condition in conditions[1:]:
+			expression = expression&condition
+
+		return expression
+
+	def __len__(self):
+		return len(self._wells)
+
+	def __repr__(self):
+		return f"{self.__class__.__name__}(wells={len(self._wells)},curves={len(self._curves)})"
+
+def _pyarrow():
+	"""Returns the pyarrow and pyarrow.parquet modules, pyarrow is an optional dependency."""
+	try:
+		import pyarrow
+		import pyarrow.parquet
+	except ImportError as error:
+		raise ImportError("Parquet datasets require the pyarrow package.") from error
+
+	return pyarrow,pyarrow.parquet
@@ -1,29 +1,320 @@
+import math
+import re
+
 import lasio
 import numpy
+import pandas
+
+from ._parse import parse
+
+DELIMITERS = dict(SPACE=None,COMMA=",",TAB="\t")
 
 class LASIO(lasio.LASFile):
 
 	def __init__(self,file_ref,**kwargs):
+		"""LAS file object, see `lasio.LASFile` for the arguments.
+
+		With engine="fast", the header is parsed by lasio and the `~A` section by a
+		vectorized reader (`pphys._parse.parse`) splitting large files by line ranges
+		across threads, set by the additional `workers` argument. Numeric data only,
+		the NULL value of the header is replaced by NaN unless null_policy="none".
+		"""
+		if kwargs.get("engine") == "fast":
+			self._read_fast(file_ref,**kwargs)
+		else:
+			super().__init__(file_ref,**kwargs)
+
+	def _read_fast(self,file_ref,engine:str="fast",workers:int=None,encoding:str=None,**kwargs):
+		"""Reads the header with lasio and the data section with the vectorized parser."""
+		if hasattr(file_ref,"read"):
+			text = file_ref.read()
+		elif isinstance(file_ref,str) and "\n" in file_ref:
+			text = file_ref
+		else:
+			with open(file_ref,"r",encoding=encoding,errors="replace") as f:
+				text = f.read()
+
+		match = re.search(r"^[ \t]*~A.*$\n?",text,re.MULTILINE|re.IGNORECASE)
+
+		if match is None:
+			super().__init__(text,**kwargs)
+			return
 
-		super().__init__(file_ref,**kwargs)
+		super().__init__(text[:match.end()],ignore_data=True,**kwargs)
 
-	def mask(self,dmin:float=None,dmax:float=None):
+		dlm = self.version.DLM.value if "DLM" in self.version else "SPACE"
+
+		null = self.well.NULL.value if "NULL" in self.well else None
+
+		if kwargs.get("null_policy") == "none":
+			null = None
+
+		values = parse(text[match.end():],len(self.curves),
+			delimiter=DELIMITERS.get(str(dlm).strip().upper()),null=null,workers=workers)
+
+		# one contiguous array per curve, as lasio does
+		for curve,data in zip(self.curves,numpy.ascontiguousarray(values.T)):
+			curve.data = data
+
+	def mask(self,dmin:float=None,dmax:float=None,out:numpy.ndarray=None):
 		"""
-		Selects a depth interval and returns a boolean array.
+		Selects a depth interval and returns a boolean array. The index may be
+		increasing or decreasing; an index that is neither is compared sample
+		by sample.
 
 		Parameters:
 		dmin (float): Minimum depth of the interval.
 		dmax (float): Maximum depth of the interval.
+		out (np.ndarray): Boolean buffer of the index size to write the mask into.
 
 		Returns:
 		np.ndarray: Boolean array where True indicates depths within the interval.
 		"""
-		dmin = self.index.min() if dmin is None else dmin
-		dmax = self.index.max() if dmax is None else dmax
+		if out is None:
+			out = numpy.zeros(self.index.size,dtype=bool)
+		else:
+			out[:] = False
+
+		if self._order() == 0:
+			out[:] = True
+			if dmin is not None:
+				out &= self.index>=dmin
+			if dmax is not None:
+				out &= self.index<=dmax
+			return out
 
-		return numpy.logical_and(self.index>=dmin,self.index<=dmax)
+		out[self.window(dmin,dmax)] = True
 
-	def crop(self,dmin:float=None,dmax:float=None,key:str=None):
+		return out
+
+	def window(self,dmin:float=None,dmax:float=None):
+		"""
+		Selects a depth interval and returns it as a slice of samples. The index
+		may be increasing or decreasing (negative STEP); the interval is found by
+		binary search and only the samples within the slice are touched in
+		memory-mapped mode.
+
+		Parameters:
+		dmin (float): Minimum depth of the interval.
+		dmax (float): Maximum depth of the interval.
+
+		Returns:
+		slice: Samples within the interval.
+
+		Raises:
+		ValueError: If the index is not monotonic.
+		"""
+		order = self._order()
+
+		if order == 0:
+			raise ValueError("The depth index is neither increasing nor decreasing, depth windows require a monotonic index.")
+
+		size = self.index.size
+
+		# positions in the increasing depth order
+		start = 0 if dmin is None else int(self._position(dmin,side="left"))
+		stop = size if dmax is None else int(self._position(dmax,side="right"))
+
+		if order < 0:
+			start,stop = size-stop,size-start
+
+		return slice(start,max(start,stop))
+
+	def _order(self) -> int:
+		"""
+		Returns 1 for an increasing index, -1 for a decreasing one and 0 if it is
+		not monotonic. The check is done once and reused while the index array
+		is the same, see `invalidate`.
+		"""
+		index = self.index
+
+		key = self._fingerprint()
+
+		if getattr(self,"_ordered",(None,None))[0] == key:
+			return self._ordered[1]
+
+		step = numpy.diff(index)
+
+		if numpy.all(step>=0):
+			order = 1
+		elif numpy.all(step<=0):
+			order = -1
+		else:
+			order = 0
+
+		self._ordered = (key,order)
+
+		return order
+
+	def _fingerprint(self):
+		"""Returns the key of the cached checks of the index, the identity and size
+		of the index array, so that they are redone when a new index is assigned
+		without reading its values."""
+		index = self.index
+
+		self._keyed = index # kept alive so that its id is not reused by another array
+
+		return (id(index),numpy.size(index))
+
+	def invalidate(self):
+		"""Drops the cached order and spacing of the index, to be called after the
+		index array is edited in place."""
+		self._ordered = (None,None)
+		self._spacing = (None,None)
+
+	def spacing(self,rtol:float=1e-3):
+		"""
+		Returns the constant step of the index if it is uniformly sampled, i.e.
+		every depth is within rtol*step of the regular grid, otherwise None.
+		The step is negative for a decreasing index. The check is done once and
+		reused while the index array is the same, see `invalidate`.
+
+		Parameters:
+		rtol (float): Tolerance relative to the step.
+
+		Returns:
+		float or None: Step of the regular grid.
+		"""
+		index = self.index
+
+		key = (self._fingerprint(),rtol)
+
+		if getattr(self,"_spacing",(None,None))[0] == key:
+			return self._spacing[1]
+
+		step = None
+
+		if index.size>1:
+			estimate = (index[-1]-index[0])/(index.size-1)
+			if estimate != 0:
+				grid = numpy.arange(index.size)*estimate+index[0]
+				if numpy.all(numpy.abs(index-grid)<=rtol*abs(estimate)):
+					step = float(estimate)
+
+		self._spacing = (key,step)
+
+		return step
+
+	def searchsorted(self,depths,side:str="left"):
+		"""
+		Finds the sample positions where depths would be inserted to keep the
+		index order, same as numpy.searchsorted for an increasing index. For a
+		decreasing index, "left" is the position before the samples equal to the
+		depth and "right" the one after them, as in numpy.searchsorted. On a
+		uniformly sampled index the positions are computed arithmetically
+		(constant time per depth) and corrected against the actual depths,
+		otherwise binary search is used.
+
+		Parameters:
+		depths (float or array-like): Depth values.
+		side (str): "left" or "right", see numpy.searchsorted.
+
+		Returns:
+		int or np.ndarray: Sample positions.
+
+		Raises:
+		ValueError: If the index is not monotonic.
+		"""
+		order = self._order()
+
+		if order == 0:
+			raise ValueError("The depth index is neither increasing nor decreasing, it can not be searched.")
+
+		if order > 0:
+			return self._position(depths,side)
+
+		# samples shallower than the depth come after it in a decreasing index
+		position = self._position(depths,side="right" if side=="left" else "left")
+
+		return self.index.size-position
+
+	def _position(self,depths,side:str="left"):
+		"""Returns the positions of the depths in the index taken in increasing
+		depth order, i.e. in the reversed index when it is decreasing."""
+		index = self.index if self._order()>=0 else self.index[::-1]
+
+		step = self.spacing()
+
+		if step is None:
+			return numpy.searchsorted(index,depths,side=side)
+
+		step = abs(step)
+
+		size = index.size
+
+		if isinstance(depths,(float,int)) or numpy.ndim(depths)==0:
+			return self._searchsorted(index,float(depths),side,step)
+
+		depths = numpy.asarray(depths,dtype=float)
+
+		with numpy.errstate(invalid="ignore"):
+			position = (depths-index[0])/step
+			position = numpy.ceil(position) if side=="left" else numpy.floor(position)+1
+
+		position = numpy.clip(numpy.nan_to_num(position,nan=size),0,size).astype(int)
+
+		# the grid is regular within tolerance, so positions are at most one sample off
+		below = index[numpy.maximum(position-1,0)]
+		position -= (position>0)&((below>=depths) if side=="left" else (below>depths))
+
+		above = index[numpy.minimum(position,size-1)]
+		position += (position<size)&((above<depths) if side=="left" else (above<=depths))
+
+		return position[()]
+
+	@staticmethod
+	def _searchsorted(index:numpy.ndarray,depth:float,side:str,step:float) -> int:
+		"""Scalar version of searchsorted on a uniformly sampled index."""
+		size = index.size
+
+		if depth != depth: # NaN is sorted to the end
+			return size
+
+		position = min(max((depth-float(index[0]))/step,-1.),size+1.)
+		position = math.ceil(position) if side=="left" else math.floor(position)+1
+		position = min(max(position,0),size)
+
+		if side=="left":
+			if position>0 and index[position-1]>=depth:
+				position -= 1
+			elif position<size and index[position]<depth:
+				position += 1
+		else:
+			if position>0 and index[position-1]>depth:
+				position -= 1
+			elif position<size and index[position]<=depth:
+				position += 1
+
+		return position
+
+	def nearest(self,depths):
+		"""
+		Returns the position of the sample nearest to each depth, the first one
+		on ties, same as numpy.argmin(numpy.abs(index-depth)) per depth. A
+		monotonic index is searched, any other one is scanned.
+
+		Parameters:
+		depths (float or array-like): Depth values.
+
+		Returns:
+		int or np.ndarray: Sample positions.
+		"""
+		index = self.index
+
+		depths = numpy.asarray(depths,dtype=float)
+
+		if self._order() == 0:
+			distance = numpy.abs(index-depths.reshape(-1,1))
+			return numpy.argmin(distance,axis=1).reshape(depths.shape)[()]
+
+		upper = numpy.minimum(self.searchsorted(depths,side="left"),index.size-1)
+		lower = numpy.maximum(upper-1,0)
+
+		first = numpy.abs(depths-index[lower])<=numpy.abs(index[upper]-depths)
+
+		return numpy.where(first,lower,upper)[()]
+
+	def crop(self,dmin:float=None,dmax:float=None,key:str=None,out:numpy.ndarray=None):
 		"""
 		Crops a LAS frame (or curve if key is provided) to include only data
 		within a specified depth range.
@@ -33,31 +324,110 @@ class LASIO(lasio.LASFile):
 		dmin (float): Minimum depth for cropping.
 		dmax (float): Maximum depth for cropping.
 		key (str): Name of the curve to crop.
+		out (np.ndarray): Buffer of the window size to copy the cropped curve into.
 		
 		Returns:
 		-------
-		numpy.ndarray or pandas.DataFrame: Cropped curve values.
+		numpy.ndarray or pandas.DataFrame: Cropped curve values, a view
+		of the curve data when key is provided without out buffer.
 		"""
-		mask = self.mask(dmin,dmax)
+		window = self.window(dmin,dmax)
+
+		if key is None:
+			frame = pandas.DataFrame(
+				{curve.mnemonic:curve.data[window] for curve in self.curves[1:]},
+				index=self.index[window])
+			frame.index.name = self.curves[0].mnemonic
+			return frame
 
-		return self.df()[mask] if key is None else self[key].values[mask]
+		if out is None:
+			return self[key][window]
 
-	def resample(self,depths:numpy.ndarray,key:str=None):
+		out[...] = self[key][window]
+
+		return out
+
+	def resample(self,depths:numpy.ndarray,key:str=None,out:numpy.ndarray=None):
 		"""
-		Resample a curve's values based on new depth values.
+		Resample a curve's values based on new depth values, equivalent of
+		numpy.interp over the index. The interpolation weights are computed
+		once and applied to all requested curves.
 
 		Parameters:
 		----------
 		depths (array-like): New depth values for resampling.
-		key (str): Name of the curve to resample.
+		key (str or list): Name of the curve (or curves) to resample.
+		out (np.ndarray): Buffer for the resampled values, of the depths size
+			for a single key, or (number of keys, depths size) for a list.
 
 		Returns:
 		-------
 		numpy.ndarray or pandas.DataFrame: Resampled curve values.
+
+		Raises:
+		------
+		ValueError: If the index is not monotonic.
 		"""
-		interp = lambda values: numpy.interp(depths,self.index,values)
+		depths = numpy.asarray(depths,dtype=float)
+
+		keys = self.keys()[1:] if key is None else [key] if isinstance(key,str) else list(key)
+
+		if out is None:
+			out = numpy.empty((len(keys),*depths.shape))
+		elif isinstance(key,str):
+			out = out[numpy.newaxis]
+
+		lower,upper,weight = self._weights(depths)
+
+		for values,name in zip(out,keys):
+			curve = self[name]
+			values[...] = curve[lower]*(1-weight)+curve[upper]*weight
+			numpy.copyto(values,curve[lower],where=weight==0)
+			numpy.copyto(values,curve[upper],where=weight==1)
+
+		if key is None:
+			frame = pandas.DataFrame(out.T,columns=keys,index=depths)
+			frame.index.name = self.curves[0].mnemonic
+			return frame
+
+		return out[0] if isinstance(key,str) else out
+
+	def _weights(self,depths:numpy.ndarray):
+		"""Returns the bracketing sample indices and linear interpolation weights of
+		the depths in the index, constant outside of the index range. A decreasing
+		index is interpolated in increasing depth order and the sample indices are
+		mapped back to it."""
+		order = self._order()
+
+		if order == 0:
+			raise ValueError("The depth index is neither increasing nor decreasing, resampling requires a monotonic index.")
+
+		index = self.index if order>0 else self.index[::-1]
+
+		upper = numpy.asarray(self._position(depths,side="right"))
+
+		numpy.clip(upper,1,max(index.size-1,1),out=upper)
+
+		lower = upper-1
+
+		if index.size<2:
+			return lower,lower,numpy.zeros(depths.shape)
+
+		lower_depths = index[lower]
+
+		spacing = index[upper]-lower_depths
+
+		with numpy.errstate(divide="ignore",invalid="ignore"):
+			weight = (depths-lower_depths)/spacing
+
+		weight[spacing==0] = 0
+
+		numpy.clip(weight,0,1,out=weight)
+
+		if order < 0:
+			lower,upper = index.size-1-lower,index.size-1-upper
 
-		return self.df.apply(interp) if key is None else interp(self[key])
+		return lower,upper,weight
 
 	def copy(self):
 		"""Create a new LAS object with the cropped data"""
@@ -1,42 +1,217 @@
+from collections import OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
 import pathlib
-import pickle
 
 from ._lasio import LASIO
 
-def load(source_path:str,cache_path:str,**kwargs) -> dict:
+from ._cache import is_fresh, record
+
+from ._compact import compact as _compact, CompactStore
+
+from ._read import read, dump, get_cache_file
+
+def load(source_path:str,cache_path:str,backend:str="pickle",mmap:bool=False,checksum:str=None,
+	workers:int=None,errors:dict=None,progress=None,lazy:bool=False,maxsize:int=None,compact:bool=False,**kwargs) -> dict:
 	"""Load LAS files from a directory, using a cache to avoid redundant processing.
-	
+
 	Parameters:
 	----------
 	source_path  : Directory containing LAS files.
 	cache_path 	 : Directory where cached files will be stored.
+	backend 	 : Cache format, "pickle" or "columnar", see `pphys.read`.
+	mmap 		 : If True, curve data are memory-mapped from the columnar cache.
+	checksum 	 : Content hash stored in the cache manifest, see `pphys.read`.
+	workers 	 : Number of processes parsing and caching the files concurrently,
+				   files are loaded one by one when it is None or 1.
+	errors 		 : If a dictionary is provided, exceptions raised by failing files are
+				   collected in it (filename as key) and the remaining files are
+				   still loaded; otherwise the first exception is raised.
+	progress 	 : Callable invoked as progress(done,total,filename) after each file.
+	lazy 		 : If True, returns a `LazyLoad` mapping instead of a dictionary, files
+				   are read only on their first access. Errors and progress are then
+				   reported on access, see `LazyLoad`.
+	maxsize 	 : Number of materialized LAS objects kept in memory by the lazy
+				   mapping, least recently used ones are dropped first; None keeps all.
+	compact 	 : If True, curves are held compactly (valid samples only, float32 where
+				   precision allows) and identical depth grids are shared, see
+				   `CompactStore`; a `CompactStore` is returned instead of a dictionary.
 
 	Returns:
 	-------
-	dict: A dictionary with filenames (without extension) as keys and LAS data as values.
-	
+	dict: A dictionary with filenames (without extension) as keys and LAS data as values,
+		ordered by filename.
+
 	"""
 
+	if compact and mmap:
+		raise ValueError("Compact curves are copied into memory, they can not be memory-mapped.")
+
+	if lazy:
+		if workers is not None and workers>1:
+			raise ValueError("Lazy loading reads files on access, it can not be used with workers.")
+		return LazyLoad(source_path,cache_path,backend=backend,mmap=mmap,checksum=checksum,
+			errors=errors,progress=progress,maxsize=maxsize,compact=compact,**kwargs)
+
 	# Ensure cache directory exists
 	pathlib.Path(cache_path).mkdir(parents=True, exist_ok=True)
 
-	las_files = {}  # Dictionary to store LAS data
+	# Sorted so that the result does not depend on the directory listing order
+	las_paths = sorted(pathlib.Path(source_path).glob("*.las"))
+
+	failures = {}
+
+	if workers is not None and workers>1:
+		failures = _ingest_parallel(las_paths,cache_path,backend,checksum,workers,progress,kwargs)
+
+	las_files = CompactStore() if compact else {}  # Dictionary to store LAS data
+
+	for count,las_file in enumerate(las_paths,start=1):
+
+		if las_file.stem in failures:
+			continue
+
+		try:
+			las_files[las_file.stem] = read(las_file,cache_path,backend=backend,mmap=mmap,checksum=checksum,**kwargs)
+		except Exception as error:
+			if errors is None:
+				raise
+			failures[las_file.stem] = error
+
+		if progress is not None and (workers is None or workers<=1):
+			progress(count,len(las_paths),las_file.stem)
+
+	if errors is not None:
+		errors.update({las_file.stem:failures[las_file.stem] for las_file in las_paths if las_file.stem in failures})
+	elif failures:
+		raise next(iter(failures.values()))
+
+	return las_files  # Dictionary of {filename: LASFile}
+
+class LazyLoad(Mapping):
+
+	def __init__(self,source_path:str,cache_path:str,backend:str="pickle",mmap:bool=False,checksum:str=None,
+		errors:dict=None,progress=None,maxsize:int=None,compact:bool=False,**kwargs):
+		"""Read-only mapping of LAS files in a directory, see `pphys.load`. Keys come from
+		a directory scan, and values are read (from the cache if possible) only on first
+		access. At most maxsize LAS objects are kept in memory, None keeps all of them.
+		If compact is True, the LAS objects are compacted when they are read.
+
+		If errors is a dictionary, the exception of a failing file is collected in it and
+		its access raises KeyError instead, so that it behaves like a missing file. The
+		progress callable is invoked as progress(done,total,filename) after the first
+		read of each file."""
+		pathlib.Path(cache_path).mkdir(parents=True, exist_ok=True)
+
+		self._paths = {las_file.stem:las_file for las_file in sorted(pathlib.Path(source_path).glob("*.las"))}
+
+		self.cache_path = cache_path
+		self.backend = backend
+		self.mmap = mmap
+		self.checksum = checksum
+		self.errors = errors
+		self.progress = progress
+		self.maxsize = maxsize
+		self.kwargs = kwargs
+
+		self._done = set() # keys of the files read at least once
+
+		self._grids = {} if compact else None # depth grids shared by compacted objects
+
+		self._items = OrderedDict() # materialized LAS objects, least recently used first
+
+	def __getitem__(self,key:str):
+
+		if key in self._items:
+			self._items.move_to_end(key)
+			return self._items[key]
+
+		las_path = self._paths[key] # unknown keys raise KeyError without being reported
+
+		try:
+			las_data = read(las_path,self.cache_path,backend=self.backend,
+				mmap=self.mmap,checksum=self.checksum,**self.kwargs)
+		except Exception as error:
+			if self.errors is None:
+				raise
+			self.errors[key] = error
+			raise KeyError(key) from error
+		finally:
+			self._report(key)
+
+		if self._grids is not None:
+			las_data = _compact(las_data,self._grids)
+
+		if self.maxsize is None or self.maxsize>0:
+			self._items[key] = las_data
+
+		if self.maxsize is not None and len(self._items)>self.maxsize:
+			self._items.popitem(last=False)
+
+		return las_data
+
+	def _report(self,key:str):
+		"""Invokes the progress callable after the first read of the file."""
+		if self.progress is None or key in self._done:
+			return
+
+		self._done.add(key)
+
+		self.progress(len(self._done),len(self._paths),key)
+
+	def __iter__(self):
+		return iter(self._paths)
+
+	def __len__(self):
+		return len(self._paths)
+
+	def __contains__(self,key):
+		return key in self._paths
+
+	def __repr__(self):
+		return f"{self.__class__.__name__}({list(self._paths)})"
+
+	def path(self,key:str) -> pathlib.Path:
+		"""Returns the path of the LAS file."""
+		return self._paths[key]
+
+	def clear(self):
+		"""Drops the materialized LAS objects from memory, the cache files are kept."""
+		self._items.clear()
+
+	@property
+	def materialized(self) -> list:
+		"""Returns the keys of the LAS objects held in memory."""
+		return list(self._items)
+
+def _ingest_parallel(las_paths:list,cache_path:str,backend:str,checksum:str,workers:int,progress,kwargs:dict) -> dict:
+	"""Parses and caches LAS files in a process pool, returns the failures."""
+	failures = {}
+
+	with ProcessPoolExecutor(max_workers=workers) as executor:
+
+		futures = {executor.submit(_ingest,las_file,cache_path,backend,checksum,kwargs):las_file for las_file in las_paths}
+
+		for count,future in enumerate(as_completed(futures),start=1):
+
+			las_file = futures[future]
+
+			try:
+				future.result()
+			except Exception as error:
+				failures[las_file.stem] = error
 
-	# Loop through all .las files in the directory
-	for las_file in pathlib.Path(source_path).glob("*.las"):
-		cache_file = pathlib.Path(cache_path) / f"{las_file.stem}.pkl"  # Cache filename
+			if progress is not None:
+				progress(count,len(las_paths),las_file.stem)
 
-		# If a cached version exists, load it
-		if cache_file.exists():
-			with open(cache_file, "rb") as f:
-				las_data = pickle.load(f)
-		else:
-			# Otherwise, read and cache the LAS file
-			las_data = LASIO(str(las_file),**kwargs)
-			with open(cache_file, "wb") as f:
-				pickle.dump(las_data,f)
+	return failures
 
-		# Store in dictionary with filename as key
-		las_files[las_file.stem] = las_data
+def _ingest(las_file:pathlib.Path,cache_path:str,backend:str,checksum:str,kwargs:dict):
+	"""Parses the LAS file and writes its cache unless it is already cached.
+	It runs in a worker process, only the cache file is shared with the parent."""
+	cache_file = get_cache_file(las_file,cache_path,backend)
 
-	return las_files  # Dictionary of {filename: LASFile}
\ No newline at end of file
+	if not is_fresh(las_file,cache_file,kwargs,checksum):
+		dump(LASIO(str(las_file),**kwargs),cache_file,backend)
+		record(las_file,cache_file,kwargs,checksum)
@@ -0,0 +1,148 @@
+import contextlib
+import os
+import pathlib
+import time
+
+from ._cache import get_entry_files, manifest
+
+from ._load import load
+from ._read import _read, get_cache_file
+
+class CacheManager():
+
+	def __init__(self,cache_path:str,backend:str="pickle",budget:int=None,policy:str="lru",checksum:str=None):
+		"""Cache manager around `pphys.read` and `pphys.load` keeping the cache directory
+		within a byte budget.
+
+		cache_path 	: Directory where cached files are stored.
+		backend 	: Cache format, "pickle" or "columnar", see `pphys.read`.
+		budget 		: Maximum size of the cache directory in bytes, None for no limit.
+		policy 		: Eviction policy, "lru" evicts least recently accessed entries first,
+					  "lfu" evicts least frequently accessed entries first.
+		checksum 	: Content hash stored in the cache manifest, see `pphys.read`.
+
+		Access times and hit counts are kept in the manifest records of the entries,
+		so they are shared by all processes working on the same cache directory.
+		"""
+		if policy not in ("lru","lfu"):
+			raise ValueError(f"Unknown eviction policy '{policy}', use 'lru' or 'lfu'.")
+
+		self.cache_path = pathlib.Path(cache_path)
+		self.backend = backend
+		self.budget = budget
+		self.policy = policy
+		self.checksum = checksum
+
+		self.cache_path.mkdir(parents=True,exist_ok=True)
+
+		self._nbytes = None # running size estimate, None until the directory is scanned
+
+	def read(self,file_path,mmap:bool=False,**kwargs):
+		"""Reads the LAS file through the cache, evicting entries if the budget is exceeded."""
+		cache_file = get_cache_file(file_path,self.cache_path,self.backend)
+
+		# a stale entry is replaced on a miss, its size is taken off the running estimate
+		nbytes = None if self._nbytes is None else _get_nbytes(cache_file)
+
+		las_data,hit = _read(file_path,self.cache_path,self.backend,mmap,self.checksum,kwargs)
+
+		if not hit and self.budget is not None:
+
+			if self._nbytes is None:
+				self._nbytes = sum(entry["nbytes"] for entry in self.entries())
+			else:
+				self._nbytes += _get_nbytes(cache_file)-nbytes
+
+			if self._nbytes>self.budget:
+				self.prune()
+
+		return las_data
+
+	def load(self,source_path:str,**kwargs) -> dict:
+		"""Loads LAS files from the directory through the cache, see `pphys.load`,
+		evicting entries afterwards if the budget is exceeded. Curves of the columnar
+		backend not read yet stay readable after their entries are evicted, the arrays
+		are mapped when the wells are loaded."""
+		las_files = load(source_path,self.cache_path,backend=self.backend,checksum=self.checksum,**kwargs)
+
+		if self.budget is not None:
+			self.prune()
+
+		return las_files
+
+	def entries(self) -> list:
+		"""Returns the manifest records of the cache entries with their sizes in bytes,
+		ordered by eviction priority (the first one is evicted first)."""
+		entries = [entry for records in manifest(self.cache_path).values() for entry in records]
+
+		for entry in entries:
+			entry["nbytes"] = _get_nbytes(entry["cache_file"])
+
+		if self.policy == "lru":
+			entries.sort(key=lambda entry: entry.get("accessed",0))
+		else:
+			entries.sort(key=lambda entry: (entry.get("hits",0),entry.get("accessed",0)))
+
+		return entries
+
+	def prune(self,budget:int=None) -> list:
+		"""Evicts cache entries until the cache size is within the budget, returns the
+		evicted cache files. If budget is None, the budget of the manager is used."""
+		budget = self.budget if budget is None else budget
+
+		entries = self.entries()
+
+		nbytes = sum(entry["nbytes"] for entry in entries)
+
+		evicted = []
+
+		for entry in entries:
+
+			if budget is None or nbytes<=budget:
+				break
+
+			# the manifest record goes first, so the entry is never seen half-deleted
+			for entry_file in get_entry_files(entry["cache_file"]):
+				with contextlib.suppress(FileNotFoundError,PermissionError):
+					os.remove(entry_file)
+
+			nbytes -= entry["nbytes"]
+
+			evicted.append(entry["cache_file"])
+
+		self._nbytes = nbytes
+
+		return evicted
+
+	def stats(self) -> dict:
+		"""Returns the cache report: number of entries, hits (reads served from the cache),
+		misses (files parsed into the cache), size in bytes, budget and the oldest entry
+		by access time."""
+		entries = self.entries()
+
+		oldest = min(entries,key=lambda entry: entry.get("accessed",0),default=None)
+
+		return dict(
+			entries = len(entries),
+			hits = sum(entry.get("hits",0) for entry in entries),
+			misses = sum(entry.get("misses",0) for entry in entries),
+			nbytes = sum(entry["nbytes"] for entry in entries),
+			budget = self.budget,
+			policy = self.policy,
+			oldest = None if oldest is None else dict(
+				path = oldest["path"],
+				cache_file = oldest["cache_file"],
+				accessed = oldest.get("accessed"),
+				age = time.time()-oldest.get("accessed",0),
+				),
+			)
+
+def _get_nbytes(cache_file) -> int:
+	"""Returns the total size of the cache entry files in bytes."""
+	nbytes = 0
+
+	for entry_file in get_entry_files(cache_file):
+		with contextlib.suppress(FileNotFoundError):
+			nbytes += os.stat(entry_file).st_size
+
+	return nbytes
@@ -0,0 +1,82 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import os
+import warnings
+
+import numpy
+
+CHUNK = 1<<22 # minimum text size (characters) parsed by a single thread
+
+def parse(text:str,ncurves:int,delimiter:str=None,null:float=None,workers:int=None) -> numpy.ndarray:
+	"""Converts the text of a LAS data section into a two-dimensional float array
+	(samples x curves). The text is split by line ranges and the ranges are converted
+	in threads with `numpy.fromstring`; wrapped samples may span the ranges.
+
+	Parameters:
+	----------
+	text 		: Lines of the `~A` section, without the `~A` line.
+	ncurves 	: Number of curves, i.e. values per sample.
+	delimiter 	: Value separator other than whitespace, e.g. ",".
+	null 		: NULL value replaced by NaN.
+	workers 	: Number of threads, by default the number of processors. Texts
+				  shorter than `CHUNK` characters per thread are not split further.
+
+	"""
+	workers = (os.cpu_count() or 1) if workers is None else max(1,workers)
+
+	parts = split(text,min(workers,len(text)//CHUNK+1))
+
+	# warnings filters are process-wide, so they are set once around all threads
+	with warnings.catch_warnings():
+		warnings.simplefilter("error",DeprecationWarning)
+		try:
+			if len(parts)>1:
+				with ThreadPoolExecutor(max_workers=len(parts)) as executor:
+					values = numpy.concatenate(list(executor.map(lambda part: convert(part,delimiter),parts)))
+			else:
+				values = convert(text,delimiter)
+		except DeprecationWarning as error:
+			raise ValueError("Non-numeric value in the data section.") from error
+
+	if ncurves==0 or values.size%ncurves:
+		raise ValueError(f"The data section has {values.size} values, not a multiple of {ncurves} curves.")
+
+	values = values.reshape((-1,ncurves))
+
+	if null is not None:
+		values[values==null] = numpy.nan
+
+	return values
+
+def convert(text:str,delimiter:str=None) -> numpy.ndarray:
+	"""Converts data lines into a flat float array, comment lines are skipped.
+	Non-numeric values raise the DeprecationWarning of `numpy.fromstring`."""
+	if "#" in text:
+		text = "".join(line for line in text.splitlines(True) if not line.lstrip().startswith("#"))
+
+	if delimiter is not None:
+		text = text.replace(delimiter," ")
+
+	if not text.strip(): # numpy.fromstring returns [-1.] for blank text
+		return numpy.empty(0)
+
+	return numpy.fromstring(text,dtype=float,sep=" ")
+
+def split(text:str,parts:int) -> list:
+	"""Splits the text into at most the given number of parts at line boundaries."""
+	bounds,start = [],0
+
+	for count in range(1,parts):
+
+		stop = text.find("\n",max(start,len(text)*count//parts))
+
+		if stop<0:
+			break
+
+		bounds.append((start,stop+1))
+
+		start = stop+1
+
+	bounds.append((start,len(text)))
+
+	return [text[start:stop] for start,stop in bounds if stop>start]
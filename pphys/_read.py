@@ -1,10 +1,15 @@
 import pathlib
 import pickle
 
+from ._cache import atomic, get_key, is_fresh, record, touch
 from ._lasio import LASIO
 
-def read(file_path,cache_path:str=None,**kwargs):
-	"""Read LAS files with optional caching using pickle.
+from . import _columnar
+
+SUFFIXES = dict(pickle=".pkl",columnar=".json")
+
+def read(file_path,cache_path:str=None,backend:str="pickle",mmap:bool=False,checksum:str=None,**kwargs):
+	"""Read LAS files with optional caching.
 	
 	Parameters:
 	----------
@@ -12,7 +17,26 @@ def read(file_path,cache_path:str=None,**kwargs):
         Path to the LAS file.
 
     cache_path: str, optional
-        Directory to store or load the cached `.pkl` file.
+        Directory to store or load the cached file.
+
+    backend: str, optional
+        Cache format, "pickle" stores the whole LASIO object in a `.pkl` file,
+        "columnar" stores curves in a `.npy` array with a `.json` header sidecar
+        so that a cache hit parses the header only and curves are read on access.
+
+    mmap: bool, optional
+        If True, curve data are `numpy.memmap` views into the columnar cache file,
+        so that only the pages of the depth window being worked on are loaded.
+        Requires the "columnar" backend.
+
+    checksum: str, optional
+        Content hash, "blake2" or "xxhash", stored in the cache manifest. A file
+        whose size or modification time changed but whose content hash did not
+        is then served from the cache instead of being parsed again.
+
+    The cache is keyed by the absolute path of the LAS file and every entry has a
+    manifest record with the file size, modification time, parser version and the
+    keyword arguments passed to LASIO; an entry is used only if all of them match.
 
 	Returns:
 	-------
@@ -20,18 +44,56 @@ def read(file_path,cache_path:str=None,**kwargs):
 		A class inherited from lasio.LASFile with added methods.
 
 	"""
-	cache_file = f"{pathlib.Path(file_path).stem}.pkl"
+	las_data,_ = _read(file_path,cache_path,backend,mmap,checksum,kwargs)
+
+	return las_data
+
+def _read(file_path,cache_path:str,backend:str,mmap:bool,checksum:str,kwargs:dict):
+	"""Reads the LAS file through the cache, returns LAS data and whether it was a cache hit."""
+	if mmap and backend != "columnar":
+		raise ValueError("Memory-mapped curve access requires the 'columnar' backend.")
+
+	cache_file = get_cache_file(file_path,cache_path,backend)
+
+	if is_fresh(file_path,cache_file,kwargs,checksum):
+		touch(cache_file)
+		return undump(cache_file,backend,mmap=mmap),True
+
+	las_data = LASIO(str(file_path),**kwargs)
+
+	dump(las_data,cache_file,backend)
+
+	record(file_path,cache_file,kwargs,checksum)
+
+	if mmap: # the parsed arrays are released in favor of the mapped ones
+		return undump(cache_file,backend,mmap=mmap),False
+
+	return las_data,False
+
+def get_cache_file(file_path,cache_path:str=None,backend:str="pickle") -> pathlib.Path:
+	"""Returns the path of the cache file for the LAS file."""
+	if backend not in SUFFIXES:
+		raise ValueError(f"Unknown cache backend '{backend}', use one of {tuple(SUFFIXES)}.")
+
+	cache_file = pathlib.Path(f"{get_key(file_path)}{SUFFIXES[backend]}")
 
 	if cache_path is not None:
 		cache_file = pathlib.Path(cache_path) / cache_file
 
-	if cache_file.exists():
-		with open(cache_file, "rb") as f:
-			las_data = pickle.load(f)
-	else:
-		las_data = LASIO(str(file_path),**kwargs)
+	return cache_file
+
+def dump(las_data,cache_file,backend:str="pickle"):
+	"""Writes LAS data to the cache file in the given backend format."""
+	if backend == "columnar":
+		return _columnar.dump(las_data,cache_file)
+
+	with atomic(cache_file, "wb") as f:
+		pickle.dump(las_data,f)
 
-		with open(cache_file, "wb") as f:
-			pickle.dump(las_data,f)
+def undump(cache_file,backend:str="pickle",mmap:bool=False):
+	"""Reads LAS data from the cache file in the given backend format."""
+	if backend == "columnar":
+		return _columnar.load(cache_file,mmap=mmap)
 
-	return las_data
\ No newline at end of file
+	with open(cache_file, "rb") as f:
+		return pickle.load(f)
@@ -0,0 +1,256 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import json
+import pathlib
+
+import numpy
+import pandas
+
+from ._cache import atomic
+
+FORMAT = 1
+
+WELL_ITEMS = dict(STRT="strt",STOP="stop",STEP="step",NULL="null",WELL="well",UWI="uwi",FLD="field",COMP="company")
+
+def scan(source_path:str,index_path:str=None,workers:int=None,pattern:str="*.las"):
+	"""Scans headers of LAS files in a directory into a well index table. Each file is
+	read only up to its `~A` section, so the cost does not depend on the data size.
+
+	Parameters:
+	----------
+	source_path  : Directory containing LAS files.
+	index_path 	 : Index file (json) where the scan is persisted. If it exists, only the
+				   files added or modified (size or modification time) since the last scan
+				   are read again.
+	workers 	 : Number of processes scanning the files concurrently.
+	pattern 	 : Glob pattern of the LAS files in the directory.
+
+	Returns:
+	-------
+	WellIndex: well metadata and curve inventory tables.
+
+	"""
+	las_paths = sorted(pathlib.Path(source_path).glob(pattern))
+
+	previous = {} if index_path is None else WellIndex.records(index_path)
+
+	records,outdated = {},[]
+
+	for las_file in las_paths:
+
+		path,stat = str(las_file.resolve()),las_file.stat()
+
+		entry = previous.get(path)
+
+		if entry is not None and entry["size"]==stat.st_size and entry["mtime"]==stat.st_mtime_ns:
+			records[path] = entry
+		else:
+			outdated.append(path)
+
+	if workers is not None and workers>1 and len(outdated)>1:
+		with ProcessPoolExecutor(max_workers=workers) as executor:
+			scanned = list(executor.map(read_header,outdated,chunksize=max(1,len(outdated)//(4*workers))))
+	else:
+		scanned = [read_header(path) for path in outdated]
+
+	records.update({entry["path"]:entry for entry in scanned})
+
+	records = [records[str(las_file.resolve())] for las_file in las_paths]
+
+	well_index = WellIndex.from_records(records)
+
+	if index_path is not None:
+		well_index.save(index_path)
+
+	return well_index
+
+def read_header(file_path:str) -> dict:
+	"""Reads the header sections of the LAS file, stopping at the `~A` section.
+	Returns the well record with the curve mnemonics and units."""
+	file_path = pathlib.Path(file_path)
+
+	stat = file_path.stat()
+
+	entry = dict(
+		path = str(file_path.resolve()),
+		name = file_path.stem,
+		size = stat.st_size,
+		mtime = stat.st_mtime_ns,
+		unit = "",
+		curves = [],
+		units = [],
+		error = None,
+		)
+
+	entry.update({key:None for key in WELL_ITEMS.values()})
+
+	section = None
+
+	try:
+		with open(file_path,"r",errors="replace") as f:
+
+			for line in f:
+
+				line = line.strip()
+
+				if not line or line.startswith("#"):
+					continue
+
+				if line.startswith("~"):
+					section = line[1:2].upper()
+					if section == "A":
+						break
+					continue
+
+				if section not in ("W","C"):
+					continue
+
+				mnemonic,unit,value = _split(line)
+
+				if section == "W" and mnemonic in WELL_ITEMS:
+					entry[WELL_ITEMS[mnemonic]] = value
+					if mnemonic == "STRT":
+						entry["unit"] = unit
+				elif section == "C":
+					entry["curves"].append(mnemonic)
+					entry["units"].append(unit)
+
+	except OSError as error:
+		entry["error"] = str(error)
+
+	for key in ("strt","stop","step","null"):
+		entry[key] = _float(entry[key])
+
+	return entry
+
+class WellIndex():
+
+	def __init__(self,wells:pandas.DataFrame,curves:pandas.DataFrame,records:list=None):
+		"""Well index with two tables:
+
+		wells 	: one row per LAS file with path, name, size, mtime, depth unit, strt,
+				  stop, step, null, well, uwi, field, company, error, and top and
+				  bottom, i.e. the shallowest and deepest index values.
+		curves 	: curve inventory, one row per curve with name (of the well), mnemonic
+				  and unit.
+		records : well records returned by `read_header`, they are written by `save`.
+		"""
+		self.wells = wells
+		self.curves = curves
+
+		self._records = records
+
+	@staticmethod
+	def from_records(records:list):
+		"""Builds the index from the well records returned by `read_header`."""
+		columns = ["path","name","size","mtime","unit",*WELL_ITEMS.values(),"error"]
+
+		wells = pandas.DataFrame.from_records(
+			[{key:entry[key] for key in columns} for entry in records],columns=columns)
+
+		strt = wells["strt"].to_numpy(dtype=float)
+		stop = wells["stop"].to_numpy(dtype=float)
+
+		wells["top"] = numpy.fmin(strt,stop)
+		wells["bottom"] = numpy.fmax(strt,stop)
+
+		curves = pandas.DataFrame(dict(
+			name = [entry["name"] for entry in records for _ in entry["curves"]],
+			mnemonic = [mnemonic for entry in records for mnemonic in entry["curves"]],
+			unit = [unit for entry in records for unit in entry["units"]],
+			))
+
+		return WellIndex(wells,curves,records)
+
+	@staticmethod
+	def records(index_path:str) -> dict:
+		"""Returns the well records of the index file keyed by LAS file path."""
+		index_path = pathlib.Path(index_path)
+
+		if not index_path.exists():
+			return {}
+
+		with open(index_path,"r") as f:
+			content = json.load(f)
+
+		if content.get("format") != FORMAT:
+			return {}
+
+		return {entry["path"]:entry for entry in content["wells"]}
+
+	@staticmethod
+	def load(index_path:str):
+		"""Reads the well index from the index file written by `save`."""
+		return WellIndex.from_records(list(WellIndex.records(index_path).values()))
+
+	def save(self,index_path:str):
+		"""Writes the well index to the index file."""
+		if self._records is None:
+			raise ValueError("Only the index built from well records can be saved.")
+
+		with atomic(index_path,"w") as f:
+			json.dump(dict(format=FORMAT,wells=self._records),f)
+
+	def query(self,curves:list=None,top:float=None,bottom:float=None,names:list=None,unit:str=None) -> pandas.DataFrame:
+		"""Returns the rows of the wells table matching all given conditions:
+
+		curves 	: mnemonics that must all be present in the well,
+		top 	: the well must cover the interval from top ...
+		bottom 	: ... to bottom, in the depth unit of the well,
+		names 	: well (file) names to select from,
+		unit 	: depth unit of the well, case insensitive.
+
+		Example: wells with RHOB and NPHI covering 2000-2500 m,
+
+			well_index.query(curves=["RHOB","NPHI"],top=2000,bottom=2500,unit="m")
+		"""
+		mask = numpy.array(self.wells["error"].isna(),dtype=bool)
+
+		if names is not None:
+			mask &= self.wells["name"].isin(names).to_numpy()
+
+		if unit is not None:
+			mask &= (self.wells["unit"].str.upper()==unit.upper()).to_numpy()
+
+		if top is not None:
+			mask &= (self.wells["top"]<=top).to_numpy()
+
+		if bottom is not None:
+			mask &= (self.wells["bottom"]>=bottom).to_numpy()
+
+		if curves is not None:
+			curves = [curve.upper() for curve in curves]
+			found = self.curves[self.curves["mnemonic"].isin(curves)]
+			counts = found.groupby("name")["mnemonic"].nunique()
+			mask &= self.wells["name"].map(counts).eq(len(set(curves))).to_numpy()
+
+		return self.wells[mask]
+
+	def __len__(self):
+		return len(self.wells)
+
+	def __repr__(self):
+		return f"{self.__class__.__name__}(wells={len(self.wells)},curves={len(self.curves)})"
+
+def _split(line:str):
+	"""Splits a header line `MNEM.UNIT VALUE : DESCRIPTION` into mnemonic, unit and value."""
+	mnemonic,_,rest = line.partition(".")
+
+	unit = ""
+
+	if rest and not rest[:1].isspace():
+		unit,rest = (rest.split(maxsplit=1)+[""])[:2]
+
+	value,colon,_ = rest.rpartition(":")
+
+	if not colon:
+		value = rest
+
+	return mnemonic.strip().upper(),unit.strip(),value.strip()
+
+def _float(value):
+	"""Converts header value to float, NaN if it is not a number."""
+	try:
+		return float(value)
+	except (TypeError,ValueError):
+		return numpy.nan
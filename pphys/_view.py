@@ -175,7 +175,10 @@ class LasView():
             if zonedepth>lasdepths[-1]:
                 continue
             
-            lasindex = numpy.argmin(numpy.abs(lasdepths-zonedepth))
+            if hasattr(self.lasfile,"nearest"): # constant time on uniformly sampled LASIO index
+                lasindex = int(self.lasfile.nearest(zonedepth))
+            else:
+                lasindex = numpy.argmin(numpy.abs(lasdepths-zonedepth))
 
             laszones.append(zonename)
             laszoneindices.append(lasindex)
@@ -0,0 +1,179 @@
+import gzip
+import pathlib
+
+import lasio
+import numpy
+import pandas
+
+from ._cache import atomic
+
+DESCRIPTIONS = dict(
+	STRT = "START DEPTH",
+	STOP = "STOP DEPTH",
+	STEP = "STEP",
+	NULL = "NULL VALUE",
+	COMP = "COMPANY",
+	WELL = "WELL",
+	FLD = "FIELD",
+	LOC = "LOCATION",
+	SRVC = "SERVICE COMPANY",
+	DATE = "LOG DATE",
+	UWI = "UNIQUE WELL ID",
+	)
+
+def write(file_path:str,data,mnemonics:list=None,units:list=None,descrs:list=None,well:dict=None,params:dict=None,
+	null:float=-999.25,precision=4,width:int=10,rows:int=10000,compress:bool=None,compresslevel:int=6):
+	"""Writes curves into a LAS 2.0 file. The data section is formatted in blocks of
+	rows, each block with a single format operation, so the cost stays close to the
+	cost of writing the bytes.
+
+	Parameters:
+	----------
+	file_path 	: Path of the LAS file, it is replaced atomically when writing is done.
+	data 		: Curves with the index (depth) first; a pandas.DataFrame, a dictionary
+				  of arrays, a two-dimensional array (samples x curves, memory-mapped
+				  arrays are read block by block) or a lasio.LASFile, whose curve and
+				  header items are written with the data.
+	mnemonics 	: Curve mnemonics, required for two-dimensional arrays.
+	units 		: Curve units, empty by default.
+	descrs 		: Curve descriptions, empty by default.
+	well 		: Well section items other than STRT, STOP, STEP and NULL, e.g.
+				  dict(WELL="2580",UWI="...").
+	params 		: Parameter section items.
+	null 		: NULL value written for NaN and infinite values.
+	precision 	: Number of decimals, one value for all curves or one per curve.
+	width 		: Minimum width of the values in the data section.
+	rows 		: Number of samples formatted and written at once.
+	compress 	: If True, the file is gzip compressed; by default the file is
+				  compressed when its name ends with ".gz".
+	compresslevel: Compression level of gzip.
+
+	"""
+	values,mnemonics,units,descrs,well,params = _prepare(data,mnemonics,units,descrs,well,params)
+
+	ncurves = values.shape[1]
+
+	precision = numpy.broadcast_to(precision,ncurves).tolist()
+
+	for decimals in set(precision):
+		if float(f"{null:.{decimals}f}") != null:
+			raise ValueError(f"NULL value {null} can not be written with {decimals} decimals.")
+
+	rowfmt = " ".join(f"%{width}.{decimals}f" for decimals in precision)+"\n"
+
+	header = _header(values,mnemonics,units,descrs,well,params,null,rowfmt)
+
+	if compress is None:
+		compress = pathlib.Path(file_path).suffix.lower() == ".gz"
+
+	with atomic(file_path,"wb") as f:
+
+		stream = gzip.GzipFile(fileobj=f,mode="wb",compresslevel=compresslevel) if compress else f
+
+		stream.write(header.encode())
+
+		for start in range(0,values.shape[0],rows):
+			block = numpy.array(values[start:start+rows],dtype=float)
+			block[~numpy.isfinite(block)] = null
+			stream.write(_format(block,rowfmt))
+
+		if compress:
+			stream.close()
+
+def _format(block:numpy.ndarray,rowfmt:str) -> bytes:
+	"""Returns the block formatted with the precomputed row format in a single string
+	format operation, as numpy.savetxt formats a row."""
+	return ((rowfmt*block.shape[0]) % tuple(block.ravel().tolist())).encode()
+
+def _prepare(data,mnemonics,units,descrs,well,params):
+	"""Returns the data as a two-dimensional array with the header fields."""
+	if isinstance(data,lasio.LASFile):
+
+		curves = data.curves
+
+		mnemonics = [curve.mnemonic for curve in curves] if mnemonics is None else mnemonics
+		units = [curve.unit for curve in curves] if units is None else units
+		descrs = [curve.descr for curve in curves] if descrs is None else descrs
+
+		if well is None:
+			well = {item.mnemonic:(item.value,item.unit,item.descr) for item in data.well}
+		if params is None:
+			params = {item.mnemonic:(item.value,item.unit,item.descr) for item in data.params}
+
+		values = numpy.column_stack([curve.data for curve in curves])
+
+	elif isinstance(data,(pandas.DataFrame,dict)):
+
+		mnemonics = list(data) if mnemonics is None else mnemonics
+
+		values = numpy.column_stack([numpy.asarray(data[key],dtype=float) for key in data])
+
+	else:
+
+		values = numpy.asanyarray(data)
+
+		values = values if values.ndim==2 else values.reshape((-1,1))
+
+	if mnemonics is None or len(mnemonics)!=values.shape[1]:
+		raise ValueError(f"{values.shape[1]} curve mnemonics are required.")
+
+	ncurves = values.shape[1]
+
+	units = [""]*ncurves if units is None else units
+	descrs = [""]*ncurves if descrs is None else descrs
+
+	return values,mnemonics,units,descrs,well or {},params or {}
+
+def _header(values,mnemonics,units,descrs,well,params,null,rowfmt) -> str:
+	"""Returns the header sections followed by the `~A` line."""
+	index = numpy.asarray(values[:,0],dtype=float) if values.shape[0] else numpy.empty(0)
+
+	step = 0. # irregular sampling, as required by the standard
+
+	if index.size>1:
+		steps = numpy.diff(index)
+		if numpy.allclose(steps,steps[0],rtol=1e-6,atol=0):
+			step = float(steps[0])
+
+	unit = units[0]
+
+	depthfmt = rowfmt.split(" ")[0].strip()
+
+	items = dict(
+		STRT = ((depthfmt % index[0]).strip() if index.size else "",unit,""),
+		STOP = ((depthfmt % index[-1]).strip() if index.size else "",unit,""),
+		STEP = ((depthfmt % step).strip(),unit,""),
+		NULL = (f"{null}","",""),
+		)
+
+	for mnemonic,item in well.items():
+		if mnemonic.upper() not in items:
+			items[mnemonic] = item
+
+	lines = ["~Version Information"]
+	lines += _section(dict(VERS=("2.0","","CWLS LOG ASCII STANDARD - VERSION 2.0"),WRAP=("NO","","ONE LINE PER DEPTH STEP")))
+	lines += ["~Well Information"]
+	lines += _section(items)
+	lines += ["~Curve Information"]
+	lines += _section({mnemonic:("",unit,descr) for mnemonic,unit,descr in zip(mnemonics,units,descrs)})
+
+	if params:
+		lines += ["~Parameter Information"]
+		lines += _section(params)
+
+	lines += ["~ASCII "+" ".join(mnemonics)]
+
+	return "\n".join(lines)+"\n"
+
+def _section(items:dict) -> list:
+	"""Returns the aligned lines `MNEM.UNIT VALUE : DESCRIPTION` of the section items.
+	Item values are either the value or (value,unit,descr) tuples."""
+	items = {str(mnemonic):(item if isinstance(item,tuple) else (item,"","")) for mnemonic,item in items.items()}
+
+	fields = [(mnemonic,str(unit),str(value),str(descr) or DESCRIPTIONS.get(mnemonic.upper(),""))
+		for mnemonic,(value,unit,descr) in items.items()]
+
+	head = max((len(mnemonic)+len(unit)+1 for mnemonic,unit,_,_ in fields),default=0)
+	body = max((len(value) for _,_,value,_ in fields),default=0)
+
+	return [f" {mnemonic+'.'+unit:<{head}} {value:>{body}} : {descr}" for mnemonic,unit,value,descr in fields]
@@ -9,6 +9,8 @@ import cv2
 import pytesseract
 import pypdfium2 as pdfium
 
+import pphys
+
 pytesseract.pytesseract.tesseract_cmd = (r"C:\Users\Javid.Shiriyev\AppData\Local\Programs\Tesseract-OCR\tesseract.exe")
 
 @dataclass
@@ -252,35 +254,14 @@ def resample_to_step(depth: np.ndarray, value: np.ndarray, step: float) -> Tuple
 def write_las(path: str, depth: np.ndarray, curve: np.ndarray, curve_mnemonic: str = 'QK',
               depth_unit: str = 'M', curve_unit: str = '', well_name: str = '2580',
               null_value: float = -999.25, note: str = '') -> None:
-    def fmt(v: float) -> str:
-        if not np.isfinite(v):
-            return f"{null_value:.2f}"
-        return f"{v:.6f}".rstrip('0').rstrip('.') if abs(v) < 1e6 else f"{v:.6e}"
-
-    lines = []
-    lines.append("~Version")
-    lines.append(" VERS.                  2.0 : CWLS LOG ASCII STANDARD")
-    lines.append(" WRAP.                  NO  : ONE LINE PER DEPTH STEP")
-    lines.append("~Well")
-    lines.append(f" STRT.{depth_unit:>4} {fmt(float(depth[0])):>12} : START DEPTH")
-    lines.append(f" STOP.{depth_unit:>4} {fmt(float(depth[-1])):>12} : STOP DEPTH")
-    step_est = float(np.median(np.diff(depth))) if len(depth) > 1 else 0.0
-    lines.append(f" STEP.{depth_unit:>4} {fmt(step_est):>12} : STEP")
-    lines.append(f" NULL.      {null_value:>12} : NULL VALUE")
-    lines.append(f" WELL.      {well_name:>12} : WELL")
+    well = {'WELL': well_name}
     if note:
         # keep single line note
-        note1 = note.replace('\n', ' ')[:120]
-        lines.append(f" NOTE.      {note1}")
-    lines.append("~Curve")
-    lines.append(f" DEPT.{depth_unit:>4}              : DEPTH")
-    lines.append(f" {curve_mnemonic}.{curve_unit:>4}              : DIGITIZED CURVE")
-    lines.append("~ASCII")
-    for d, v in zip(depth, curve):
-        lines.append(f"{fmt(float(d))} {fmt(float(v))}")
-
-    with open(path, 'w', encoding='utf-8') as f:
-        f.write("\n".join(lines) + "\n")
+        well['NOTE'] = note.replace('\n', ' ')[:120]
+
+    pphys.write(path, np.column_stack((depth, curve)), mnemonics=['DEPT', curve_mnemonic],
+                units=[depth_unit, curve_unit], descrs=['DEPTH', 'DIGITIZED CURVE'],
+                well=well, null=null_value, precision=6)
 
 def save_overlay_curve(roi_bgr: np.ndarray, xs: np.ndarray, out_path: str) -> None:
     overlay = roi_bgr.copy()
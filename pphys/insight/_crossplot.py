@@ -0,0 +1,208 @@
+import numpy
+
+class crossplot():
+
+    def __init__(self,xlim,ylim,bins=200,xscale="linear",yscale="linear"):
+        """Cross-plot of sample counts on a fixed grid, accumulated chunk by chunk so
+        that field-wide data never has to be held in memory.
+
+        xlim    : (min,max) of the x-axis, samples outside are not counted.
+        ylim    : (min,max) of the y-axis.
+        bins    : number of bins of both axes, or (xbins,ybins).
+        xscale  : "linear" or "log", log bins are equally spaced in log10.
+        yscale  : "linear" or "log".
+
+        Counts are kept per group (well, zone, ...) when samples are added with one,
+        for colouring the cells by the majority group. They are stored sparsely, only
+        for the cells a group has samples in, so memory scales with the samples rather
+        than with the number of groups times the number of cells.
+        """
+        xbins,ybins = numpy.broadcast_to(bins,(2,))
+
+        self.xedges = _edges(xlim,int(xbins),xscale)
+        self.yedges = _edges(ylim,int(ybins),yscale)
+
+        self.xscale,self.yscale = xscale,yscale
+
+        self.shape = (int(ybins),int(xbins))
+
+        self.counts = numpy.zeros(self.shape,dtype=numpy.int64)
+
+        self.groups = []
+
+        self._groups = {} # group index by label
+
+        # sorted (group,cell) keys with their counts, and the chunks added since merged
+        self._keys = numpy.empty(0,dtype=numpy.int64)
+        self._values = numpy.empty(0,dtype=numpy.int64)
+
+        self._pending = []
+
+        self._mesh = None
+        self._color = None
+
+    def add(self,x,y,group=None):
+        """Adds samples to the counts and returns the cross-plot.
+
+        group   : label of all samples (e.g. well name) or an array of labels of each
+                  sample (e.g. zones); None counts the samples without a group.
+        """
+        x,y = numpy.broadcast_arrays(numpy.asarray(x,dtype=float).ravel(),numpy.asarray(y,dtype=float).ravel())
+
+        cell = self._cells(x,y)
+
+        valid = cell>=0
+
+        size = self.shape[0]*self.shape[1]
+
+        self.counts += numpy.bincount(cell[valid],minlength=size).reshape(self.shape)
+
+        if group is None:
+            return self
+
+        if numpy.ndim(group)==0:
+            labels,codes = [group],numpy.zeros(int(valid.sum()),dtype=int)
+        else:
+            labels,codes = numpy.unique(numpy.broadcast_to(group,x.shape)[valid],return_inverse=True)
+            labels = labels.tolist()
+
+        index = numpy.array([self._group(label) for label in labels],dtype=numpy.int64)
+
+        self._pending.append(numpy.unique(index[codes]*size+cell[valid],return_counts=True))
+
+        # merged once the chunks outgrow the merged keys, so each key is sorted a few times
+        if sum(keys.size for keys,_ in self._pending)>=max(self._keys.size,size):
+            self._merge()
+
+        return self
+
+    def majority(self):
+        """Returns the index of the group with the most samples in each cell, -1 for
+        cells without grouped samples; labels are in `groups`."""
+        self._merge()
+
+        size = self.shape[0]*self.shape[1]
+
+        group,cell = numpy.divmod(self._keys,size)
+
+        # the first group of each cell by decreasing count, the earlier group on ties
+        order = numpy.lexsort((group,-self._values,cell))
+
+        first = order[numpy.flatnonzero(numpy.diff(cell[order],prepend=-1))]
+
+        majority = numpy.full(size,-1)
+
+        majority[cell[first]] = group[first]
+
+        return majority.reshape(self.shape)
+
+    def draw(self,axis,color="count",**kwargs):
+        """Draws the cross-plot below the other artists of the axis and returns the mesh.
+        Later calls update the data of the same mesh in place, e.g. after a new well is
+        added, and the canvas is redrawn.
+
+        color   : "count" colours cells by the number of samples on a log scale,
+                  "majority" by the majority group with a qualitative colormap, tab20
+                  repeated when there are more than 20 groups.
+        kwargs  : passed to axis.pcolormesh, and set on the mesh by later calls.
+        """
+        from matplotlib import colormaps, colors
+
+        if color=="count":
+            values = numpy.ma.masked_equal(self.counts,0)
+            norm = colors.LogNorm(vmin=1,vmax=max(1,int(self.counts.max())))
+            kwargs = dict(dict(cmap="viridis",norm=norm),**kwargs)
+        elif color=="majority":
+            values = numpy.ma.masked_less(self.majority(),0)
+            count = max(len(self.groups),1)
+            palette = colormaps["tab20"].colors
+            cmap = colors.ListedColormap([palette[index%len(palette)] for index in range(count)])
+            norm = colors.BoundaryNorm(numpy.arange(count+1)-0.5,cmap.N)
+            kwargs = dict(dict(cmap=cmap,norm=norm),**kwargs)
+        else:
+            raise ValueError(f"Unknown colouring {color}, expected count or majority.")
+
+        if self._mesh is not None and self._mesh.axes is axis and self._color==color:
+            self._mesh.set_array(values)
+            clim = kwargs.pop("vmin",None),kwargs.pop("vmax",None)
+            self._mesh.set(**kwargs)
+            if clim != (None,None):
+                self._mesh.set_clim(*clim)
+            axis.figure.canvas.draw_idle()
+            return self._mesh
+
+        if self._mesh is not None and self._mesh.axes is axis:
+            self._mesh.remove()
+
+        axis.set_xscale(self.xscale)
+        axis.set_yscale(self.yscale)
+
+        kwargs = dict(dict(zorder=0.5,rasterized=True),**kwargs)
+
+        self._mesh = axis.pcolormesh(self.xedges,self.yedges,values,**kwargs)
+
+        self._color = color
+
+        return self._mesh
+
+    def _cells(self,x,y):
+        """Returns the flat cell index of each sample, -1 outside the grid or for NaN."""
+        column = _bin(x,self.xedges,self.xscale)
+        row = _bin(y,self.yedges,self.yscale)
+
+        return numpy.where((column>=0)&(row>=0),row*self.shape[1]+column,-1)
+
+    def _group(self,label) -> int:
+        """Returns the index of the group, registering it if it is new."""
+        if label not in self._groups:
+            self._groups[label] = len(self.groups)
+            self.groups.append(label)
+
+        return self._groups[label]
+
+    def _merge(self):
+        """Adds the pending chunks of group counts to the sorted keys."""
+        if not self._pending:
+            return
+
+        keys = numpy.concatenate([self._keys,*(keys for keys,_ in self._pending)])
+        values = numpy.concatenate([self._values,*(values for _,values in self._pending)])
+
+        order = numpy.argsort(keys,kind="stable")
+
+        keys,values = keys[order],values[order]
+
+        start = numpy.flatnonzero(numpy.diff(keys,prepend=-1))
+
+        self._keys = keys[start]
+        self._values = numpy.add.reduceat(values,start) if start.size else values
+
+        self._pending = []
+
+def _edges(limits,bins,scale="linear"):
+    """Returns the bin edges between the limits, equally spaced in log10 for log scale."""
+    low,high = sorted(limits)
+
+    if scale=="log":
+        return numpy.logspace(numpy.log10(low),numpy.log10(high),bins+1)
+
+    if scale!="linear":
+        raise ValueError(f"Unknown scale {scale}, expected linear or log.")
+
+    return numpy.linspace(low,high,bins+1)
+
+def _bin(values,edges,scale="linear"):
+    """Returns the bin index of the values, -1 outside the edges, by arithmetic on the
+    equally spaced edges rather than a search."""
+    with numpy.errstate(divide="ignore",invalid="ignore"):
+
+        if scale=="log":
+            values,low,high = numpy.log10(values),numpy.log10(edges[0]),numpy.log10(edges[-1])
+        else:
+            low,high = edges[0],edges[-1]
+
+        position = (values-low)*((edges.size-1)/(high-low))
+
+    inside = (position>=0)&(position<=edges.size-1) # NaN is outside
+
+    return numpy.where(inside,numpy.minimum(position,edges.size-2),-1).astype(int)
@@ -0,0 +1,117 @@
+import time
+
+import numpy
+
+from ._crossplot import crossplot
+
+POINTS = 20000 # scatter layers above this count are rasterized by default
+
+class blitter():
+
+    def __init__(self,axis,interval=1/30):
+        """Redraws the animated artists of an interactive cross-plot over a cached
+        background, so that motion events do not redraw the scatter layer.
+
+        axis     : matplotlib axis of the cross-plot.
+        interval : minimum time in seconds between two redraws, see `throttle`.
+
+        The background is cached on every full draw of the canvas. Backends without
+        blitting support fall back to canvas.draw_idle.
+        """
+        self.axis = axis
+
+        self.canvas = axis.figure.canvas
+
+        self.interval = interval
+
+        self.artists = []
+
+        self.background = None
+
+        self._last = 0.
+
+        self.canvas.mpl_connect('draw_event',self._on_draw)
+
+    def add(self,artist):
+        """Registers the artist to be drawn over the background and returns it."""
+        artist.set_animated(True)
+
+        self.artists.append(artist)
+
+        return artist
+
+    def remove(self):
+        """Removes all registered artists from the axis."""
+        for artist in self.artists:
+            artist.remove()
+
+        self.artists = []
+
+    def throttle(self) -> bool:
+        """Returns True if the interval has passed since the last accepted call."""
+        now = time.perf_counter()
+
+        if now-self._last<self.interval:
+            return False
+
+        self._last = now
+
+        return True
+
+    def update(self):
+        """Restores the background, draws the artists and blits the axis."""
+        if self.background is None or not self.canvas.supports_blit:
+            self.canvas.draw_idle()
+            return
+
+        self.canvas.restore_region(self.background)
+
+        self._draw_artists()
+
+        self.canvas.blit(self.axis.figure.bbox)
+
+        self.canvas.flush_events()
+
+    def _on_draw(self,event):
+
+        self.background = self.canvas.copy_from_bbox(self.axis.figure.bbox)
+
+        self._draw_artists()
+
+    def _draw_artists(self):
+
+        for artist in self.artists:
+            self.axis.draw_artist(artist)
+
+def points(axis,x,y,layer="auto",bins=200,**kwargs):
+    """Draws the samples of a cross-plot and returns the artist.
+
+    layer   : "points" for a scatter layer, "raster" for a scatter layer rasterized
+              in vector outputs, "density" for sample counts on a bins x bins grid
+              spanning the data, see `pphys.insight._crossplot.crossplot`. "auto"
+              rasterizes the scatter layer above POINTS samples.
+    kwargs  : passed to axis.scatter or axis.pcolormesh.
+    """
+    x,y = numpy.asarray(x,dtype=float).ravel(),numpy.asarray(y,dtype=float).ravel()
+
+    if layer=="auto":
+        layer = "raster" if x.size>POINTS else "points"
+
+    if layer in ("points","raster"):
+        kwargs = dict(dict(s=2,c="k"),**kwargs)
+        return axis.scatter(x,y,rasterized=layer=="raster",**kwargs)
+
+    if layer!="density":
+        raise ValueError(f"Unknown layer {layer}, expected auto, points, raster or density.")
+
+    xscale,yscale = axis.get_xscale(),axis.get_yscale()
+
+    valid = numpy.isfinite(x)&numpy.isfinite(y)&((x>0) if xscale=="log" else True)&((y>0) if yscale=="log" else True)
+
+    x,y = x[valid],y[valid]
+
+    plot = crossplot((x.min(),x.max()),(y.min(),y.max()),bins,xscale,yscale)
+
+    kwargs = dict(dict(cmap="Greys"),**kwargs)
+
+    return plot.add(x,y).draw(axis,**kwargs)
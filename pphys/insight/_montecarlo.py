@@ -0,0 +1,137 @@
+from concurrent.futures import ProcessPoolExecutor
+
+from dataclasses import dataclass, field
+
+import numpy
+
+from .saturation._archie import archie
+
+ARCHIE = ("a","m","n")
+
+WORKSPACE = 16 # float64 arrays of the chunk size held at once by a model evaluation
+
+@dataclass
+class montecarlo:
+    """Propagates parameter uncertainty through a saturation model.
+
+    model       : archie or one of the shalyform classes constructed from archie.
+    parameters  : uncertain parameters by name; a, m and n of archie or keyword
+                  arguments of the model method such as rwater and rshale. Each
+                  value is a scalar, an array with a value per realization, or a
+                  tuple naming a numpy.random.Generator distribution and its
+                  arguments, e.g. m=("normal",2.,0.1) or rwater=("uniform",0.02,0.04).
+    realizations: number of parameter sets drawn.
+    seed        : seed of the random generator.
+    method      : name of the model method evaluated.
+    budget      : memory in bytes available to the evaluation of a chunk.
+
+    The ensemble is drawn once; every realization is a parameter set of the whole
+    well. The model is evaluated on (realizations x depth) arrays, a depth chunk at
+    a time, and only the percentiles of each chunk are kept.
+    """
+    model       : type
+    parameters  : dict
+    realizations: int = 1000
+    seed        : int = None
+    method      : str = "sw"
+    budget      : int = 2**28
+
+    ensemble    : dict = field(init=False,repr=False)
+
+    def __post_init__(self):
+
+        rng = numpy.random.default_rng(self.seed)
+
+        self.ensemble = {}
+
+        for name,value in self.parameters.items():
+
+            if isinstance(value,tuple):
+                value = getattr(rng,value[0])(*value[1:],size=self.realizations)
+            elif numpy.ndim(value)!=0 and numpy.size(value)!=self.realizations:
+                raise ValueError(f"Parameter {name} has {numpy.size(value)} values for {self.realizations} realizations.")
+
+            self.ensemble[name] = value if numpy.ndim(value)==0 else numpy.asarray(value,dtype=float).reshape(-1,1)
+
+    def chunks(self,logs:dict,percentiles=(10,50,90),processes:int=None,**kwargs):
+        """Yields the depth slices of the logs with the percentiles of the model output
+        over the realizations, an array of shape (percentiles x slice length).
+
+        logs        : the remaining arguments of the model method by name, arrays of
+                      the depth samples or scalars.
+        percentiles : percentiles computed at each depth, NaN realizations excluded.
+        processes   : if given, chunks are evaluated in a pool of that many processes
+                      and the budget is shared by them.
+        kwargs      : passed to the model method, e.g. lower and upper of the trimming.
+        """
+        common = set(logs)&set(self.ensemble)
+
+        if common:
+            raise ValueError(f"Arguments {sorted(common)} are given both as logs and parameters.")
+
+        depth = numpy.broadcast_shapes(*(numpy.shape(value) for value in logs.values()))
+
+        if len(depth)!=1:
+            raise ValueError("Logs must be scalars or one-dimensional arrays of the same length.")
+
+        length = depth[0]
+
+        budget = self.budget if processes is None else self.budget//processes
+
+        size = max(1,budget//(8*WORKSPACE*self.realizations))
+
+        slices = [slice(start,min(start+size,length)) for start in range(0,length,size)]
+
+        tasks = ((self,{key:value if numpy.ndim(value)==0 else numpy.asarray(value,dtype=float)[chunk]
+            for key,value in logs.items()},percentiles,kwargs) for chunk in slices)
+
+        if processes is None:
+            yield from zip(slices,(_evaluate(*task) for task in tasks))
+            return
+
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            futures = [executor.submit(_evaluate,*task) for task in tasks]
+            for chunk,future in zip(slices,futures):
+                yield chunk,future.result()
+
+    def percentiles(self,logs:dict,percentiles=(10,50,90),processes:int=None,**kwargs) -> numpy.ndarray:
+        """Returns the percentiles of the model output at each depth as an array of shape
+        (percentiles x depth), see `chunks` for the arguments. For the P10, P50 and P90
+        saturation curves,
+
+            p10,p50,p90 = montecarlo(simandoux,dict(m=("normal",2.,0.1))).percentiles(logs)
+        """
+        length = numpy.broadcast_shapes(*(numpy.shape(value) for value in logs.values()))
+
+        curves = numpy.empty((len(percentiles),*length))
+
+        for chunk,values in self.chunks(logs,percentiles,processes,**kwargs):
+            curves[:,chunk] = values
+
+        return curves
+
+    def instance(self):
+        """Returns the model constructed with the archie parameters of the ensemble,
+        as columns of the realizations."""
+        parameters = {key:self.ensemble[key] for key in ARCHIE if key in self.ensemble}
+
+        if isinstance(self.model,type) and issubclass(self.model,archie):
+            return self.model(**parameters)
+
+        return self.model(archie(**parameters))
+
+def _evaluate(engine:montecarlo,logs:dict,percentiles,kwargs:dict) -> numpy.ndarray:
+    """Evaluates the model for all realizations on the depth chunk of the logs and
+    returns the percentiles over the realizations."""
+    arguments = {key:value for key,value in engine.ensemble.items() if key not in ARCHIE}
+
+    values = getattr(engine.instance(),engine.method)(**logs,**arguments,**kwargs)
+
+    length = numpy.broadcast_shapes(*(numpy.shape(value) for value in logs.values()))
+
+    values = numpy.broadcast_to(values,(engine.realizations,*length))
+
+    if numpy.isnan(values).any():
+        return numpy.nanpercentile(values,percentiles,axis=0)
+
+    return numpy.percentile(values,percentiles,axis=0)
@@ -0,0 +1,134 @@
+from dataclasses import dataclass
+
+import warnings
+
+import numpy
+
+@dataclass
+class roots_result:
+    """Roots found by `roots` with their convergence diagnostics."""
+    root        : numpy.ndarray # last iterate of each sample
+    converged   : numpy.ndarray # True where the step fell within the tolerance
+    iterations  : numpy.ndarray # number of iterations of each sample
+    residual    : numpy.ndarray # forward function at the root
+
+    @property
+    def failures(self) -> int:
+        """Returns the number of valid samples that did not converge."""
+        return int(numpy.count_nonzero(~self.converged&~numpy.isnan(self.root)))
+
+def roots(forward,derivative,*args,x0=1.,bracket=None,tol=1.48e-8,maxiter=50,warn=True):
+    """Solves forward(x,*args) = 0 for all samples at once with Newton iterations,
+    safeguarded by bisection where a bracket is given.
+
+    forward     : function of the unknown and args returning the residual, it is
+                  called with numpy arrays holding only the unconverged samples.
+    derivative  : derivative of the forward function with the same arguments.
+    args        : scalars or arrays broadcast together, scalars are passed as they
+                  are and arrays are reduced to the unconverged samples.
+    x0          : initial guess, scalar or array.
+    bracket     : (lower,upper) bounds of the root, scalars or arrays. Samples whose
+                  residuals at the bounds have opposite signs take a bisection step
+                  whenever the Newton step leaves the bracket or the derivative is
+                  zero; other samples iterate with plain Newton steps.
+    tol         : Absolute step tolerance, a sample is converged once its step is
+                  within tol, as in scipy.optimize.newton.
+    maxiter     : Maximum number of iterations.
+    warn        : If True, a RuntimeWarning reports the valid samples not converged.
+
+    Plain Newton samples stop at a zero derivative, samples with NaN are returned as NaN.
+    Returns a `roots_result` with the roots and convergence diagnostics.
+    """
+    shape = numpy.broadcast_shapes(numpy.shape(x0),*(numpy.shape(arg) for arg in args),
+        *(() if bracket is None else (numpy.shape(bracket[0]),numpy.shape(bracket[1]))))
+
+    size = int(numpy.prod(shape))
+
+    def flat(value):
+        """Scalars stay scalars, arrays are broadcast to the samples."""
+        if numpy.ndim(value) == 0:
+            return value
+        return numpy.broadcast_to(numpy.asarray(value,dtype=float),shape).ravel()
+
+    args = samples = [flat(arg) for arg in args]
+
+    root = numpy.array(numpy.broadcast_to(numpy.asarray(x0,dtype=float),shape)).ravel()
+
+    converged = numpy.zeros(size,dtype=bool)
+    iterations = numpy.zeros(size,dtype=int)
+
+    # indices of the samples still iterating, with their unknowns and arguments
+    active = numpy.arange(size)
+
+    x = root.copy()
+
+    if bracket is not None:
+        lower = numpy.broadcast_to(numpy.asarray(bracket[0],dtype=float),shape).ravel().copy()
+        upper = numpy.broadcast_to(numpy.asarray(bracket[1],dtype=float),shape).ravel().copy()
+        with numpy.errstate(all="ignore"):
+            flower = forward(lower,*args)
+            fupper = forward(upper,*args)
+        bracketed = numpy.broadcast_to(numpy.sign(flower)*numpy.sign(fupper)<=0,(size,)).copy()
+    else:
+        lower = upper = flower = None
+        bracketed = numpy.zeros(size,dtype=bool)
+
+    for _ in range(maxiter):
+
+        if active.size == 0:
+            break
+
+        with numpy.errstate(all="ignore"):
+
+            fx = forward(x,*args)
+            fprime = derivative(x,*args)
+
+            newton = x-fx/fprime
+
+            if bracket is not None:
+                # the root stays between the bounds with opposite residual signs
+                below = bracketed&(numpy.sign(fx)==numpy.sign(flower))
+                lower,flower = numpy.where(below,x,lower),numpy.where(below,fx,flower)
+                upper = numpy.where(bracketed&~below,x,upper)
+
+                inside = (newton-numpy.fmin(lower,upper))*(numpy.fmax(lower,upper)-newton)>0
+
+                newton = numpy.where(bracketed&~inside,(lower+upper)/2,newton)
+
+        stalled = ~bracketed&(fprime==0) # scipy stops at a zero derivative
+
+        newton = numpy.where(stalled,x,newton)
+
+        step = numpy.abs(newton-x)
+
+        invalid = numpy.isnan(newton)
+
+        done = (step<=tol)|(fx==0)|stalled|invalid
+
+        iterations[active] += 1
+
+        x = numpy.where(fx==0,x,newton)
+
+        root[active] = x
+
+        converged[active[done]] = ~(stalled|invalid)[done]
+
+        keep = ~done
+
+        active,x,bracketed = active[keep],x[keep],bracketed[keep]
+
+        args = [arg if numpy.ndim(arg)==0 else arg[keep] for arg in args]
+
+        if bracket is not None:
+            lower,upper,flower = lower[keep],upper[keep],flower[keep]
+
+    with numpy.errstate(all="ignore"):
+        residual = forward(root,*samples)
+
+    result = roots_result(root.reshape(shape),converged.reshape(shape),iterations.reshape(shape),
+        numpy.broadcast_to(residual,(size,)).reshape(shape).copy())
+
+    if warn and result.failures:
+        warnings.warn(f"{result.failures} samples did not converge within {maxiter} iterations.",RuntimeWarning)
+
+    return result
@@ -1,15 +1,73 @@
+from dataclasses import dataclass
+
+import functools
+import inspect
+
+import numpy
+
+@dataclass
+class clipstats:
+    """Counts of the samples trimmed by the calls it is passed to, see `trim`."""
+    size    : int = 0 # samples returned
+    lower   : int = 0 # samples raised to the lower limit
+    upper   : int = 0 # samples lowered to the upper limit
+    invalid : int = 0 # NaN samples, kept as NaN
+
+    @property
+    def clipped(self) -> int:
+        """Returns the number of samples set to a limit."""
+        return self.lower+self.upper
+
 def trim(function):
+    """Limits the values returned by the function to [lower,upper], given as keywords
+    of the call with the defaults 0 and 1; None disables a limit. The values are clipped
+    in place in a single pass, scalars and 0-d arrays are supported.
+
+    out     : array to return the values in. If the function has an out argument, the
+              buffer is passed to it, otherwise the values are copied to it.
+    stats   : clipstats instance adding up the trimmed samples of the calls for QC.
+
+    If the function has lower and upper arguments, e.g. a fused kernel clipping in the
+    same loop, the limits are passed to it and no second pass is made, unless stats are
+    requested and the values are needed before clipping.
+    """
+    parameters = inspect.signature(function).parameters
+
+    threaded = "out" in parameters
 
-    def wrap(*args,lower=0,upper=1,**kwargs):
-        values = function(*args,**kwargs)
+    fused = "lower" in parameters and "upper" in parameters
 
-        if upper is not None:
-            values[values>upper] = upper
+    @functools.wraps(function)
+    def wrap(*args,lower=0,upper=1,out=None,stats=None,**kwargs):
 
-        if lower is not None:
-            values[values<lower] = lower
+        if fused:
+            bounds = dict(lower=None,upper=None) if stats is not None else dict(lower=lower,upper=upper)
+            kwargs = dict(kwargs,**bounds)
 
-        return values
+        if threaded:
+            values = function(*args,out=out,**kwargs)
+        else:
+            values = function(*args,**kwargs)
+
+        if out is not None and values is not out:
+            numpy.copyto(out,values)
+            values = out
+
+        if stats is not None:
+            stats.size += numpy.size(values)
+            stats.invalid += int(numpy.count_nonzero(numpy.isnan(values)))
+            if lower is not None:
+                stats.lower += int(numpy.count_nonzero(values<lower))
+            if upper is not None:
+                stats.upper += int(numpy.count_nonzero(values>upper))
+
+        if (lower is None and upper is None) or (fused and stats is None):
+            return values
+
+        if isinstance(values,numpy.ndarray) and values.dtype.kind=="f" and values.flags.writeable:
+            return numpy.clip(values,lower,upper,out=values)
+
+        return numpy.clip(values,lower,upper)
 
     return wrap
 
@@ -25,6 +83,10 @@ if __name__ == "__main__":
 
     print(res/100)
 
-    sat = saturation(res,lower=0.1,upper=0.7)
+    stats = clipstats()
+
+    sat = saturation(res,lower=0.1,upper=0.7,stats=stats)
+
+    print(sat)
 
-    print(sat)
\ No newline at end of file
+    print(stats)
@@ -1,6 +1,6 @@
 import numpy
 
-from borepy.utils._wrappers import trim
+from .._trim import trim
 
 class sonic():
 
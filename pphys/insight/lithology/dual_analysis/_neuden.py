@@ -1,6 +1,8 @@
 import numpy
 
-from borepy.utils._wrappers import trim
+from ..._crossplot import crossplot
+
+from ..._trim import trim
 
 class neuden():
 
@@ -69,6 +71,19 @@ class neuden():
         self.Dens["SLT1"] = self.SLT["type1"]["rhoma"]
         self.Neus["SLT1"] = self.SLT["type1"][phima]
 
+    def density(self,bins=200):
+        """Returns an empty density cross-plot spanning the axes of `lithonodes`,
+        neutron porosity (x) versus bulk density (y). Samples of many wells are added
+        chunk by chunk and the lithology nodes and lines are drawn on top of it:
+
+            plot = model.density()
+            for name,well in wells.items():
+                plot.add(well["NPHI"],well["RHOB"],group=name)
+            plot.draw(axis,color="majority")
+            model.lithonodes(axis)
+        """
+        return crossplot((-0.05,0.45),(1.9,3.0),bins)
+
     def lithonodes(self,axis):
 
         DENSS  = [self.Dens["SS2"]] #self.Dens["SS1"],
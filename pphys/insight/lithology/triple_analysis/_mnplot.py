@@ -1,3 +1,7 @@
+import numpy
+
+from ..._crossplot import crossplot
+
 class mnplot():
 
     def __init__(self,DTf=189,rhof=1.0,phiNf=1.0,NTool="SNP",**kwargs):
@@ -49,6 +53,20 @@ class mnplot():
         self.Ms["SLT1"] = self.MValue(self.SLT["type1"]["DTma"],self.SLT["type1"]["rhoma"])
         self.Ns["SLT1"] = self.NValue(self.SLT["type1"][phima],self.SLT["type1"]["rhoma"])
 
+    def density(self,bins=200):
+        """Returns an empty density cross-plot spanning the axes of `lithonodes`,
+        N-values (x) versus M-values (y). Samples of many wells are added chunk by
+        chunk and the lithology nodes are drawn on top of it:
+
+            plot = model.density()
+            for name,well in wells.items():
+                plot.add(model.NValue(well["NPHI"],well["RHOB"]),
+                    model.MValue(well["DT"],well["RHOB"]),group=name)
+            plot.draw(axis,color="majority")
+            model.lithonodes(axis)
+        """
+        return crossplot((0.3,1.),(0.5,1.2),bins)
+
     def lithonodes(self,axis):
 
         NSS  = [self.Ns["SS1"],self.Ns["SS2"]]
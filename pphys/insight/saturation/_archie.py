@@ -1,8 +1,8 @@
 from dataclasses import dataclass
 
-import numpy
+from .._trim import trim
 
-from borepy.utils._wrappers import trim
+from ._kernels import archie_sw
 
 @dataclass
 class archie:
@@ -20,9 +20,10 @@ class archie:
         return self.ff(porosity)*rwater/rtotal
 
     @trim
-    def sw(self,porosity,rwater,rtotal):
-        """Calculates water saturation based on Archie's equation."""
-        return numpy.power(self.swn(porosity,rwater,rtotal),1/self.n)
+    def sw(self,porosity,rwater,rtotal,lower=0,upper=1,out=None):
+        """Calculates water saturation based on Archie's equation, evaluated and
+        trimmed by the fused kernel of `pphys.insight.saturation._kernels`."""
+        return archie_sw(porosity,rwater,rtotal,self.a,self.m,self.n,lower=lower,upper=upper,out=out)
 
     def bwv(self,porosity,swater):
         """Calculates bulk water volume."""
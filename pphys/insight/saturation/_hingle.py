@@ -1,26 +1,293 @@
 from dataclasses import dataclass
 
+from matplotlib import pyplot
+from matplotlib.backend_bases import MouseButton
+
 import numpy
 
-from borepy.utils._wrappers import trim
+from .._interactive import blitter, points
+
+from .._trim import trim
+
+from ._pickett import _envelope, _quantiles
 
 class hingle():
 
-    def __init__(self,**kwargs):
+    def __init__(self,PHI=None,RT=None,n=2.,depth=None):
+        """Initialization of Hingle (porosity tool vs. scaled conductivity) cross-plot
+        that assists in water saturation calculation when the matrix is unknown.
+
+        PHI     : porosity or a porosity tool reading linear in porosity, e.g. bulk
+                  density or sonic transit time (x-axis).
+        RT      : true resistivity, the y-axis is Rt^(-1/n).
+        n       : saturation exponent; the water saturation lines are straight lines
+                  through the matrix point when the cementation exponent equals n.
+        depth   : depths of the samples, for zones given as depth intervals.
+
+        """
+        self.PHI = PHI
+
+        self.RT = RT
+
+        self.n = n
+
+        self.depth = depth
+
+        self.slope,self.intercept = None,None
+
+    @property
+    def xaxis(self):
+        """Returns the porosity tool values."""
+        return numpy.asarray(getattr(self.PHI,"data",self.PHI),dtype=float)
+
+    @property
+    def yaxis(self):
+        """Returns the linearized resistivity axis, Rt^(-1/n), of all samples."""
+        rtotal = numpy.asarray(getattr(self.RT,"data",self.RT),dtype=float)
+
+        with numpy.errstate(divide="ignore",invalid="ignore"):
+            return numpy.power(rtotal,-1/self.n)
+
+    @property
+    def matrix(self):
+        """Returns the porosity tool value of the matrix, where the 100% water line
+        reaches zero conductivity."""
+        return -self.intercept/self.slope
+
+    def fit(self,zones=None,quantile=0.05,bins=10,matrix=None,iterations=2,cutoff=3.,minpoints=3):
+        """Fits the 100% water saturation line of each zone to its wet points, the
+        samples with the highest conductivities, all zones at once. The line of the
+        first zone is set as the line of the cross-plot.
+
+        zones       : zone label of each sample, or a depth interval table with top and
+                      bottom columns (see `intervals`); samples of integer zone -1 are
+                      not fitted. One zone by default.
+        quantile    : the line is fitted to the samples at the 1-quantile of Rt^(-1/n)
+                      in equal bins of the x-axis of each zone.
+        matrix      : if given, the matrix value is fixed and only the slope is fitted.
+
+        See `pphys.insight.saturation._pickett.envelope` for the other arguments.
+        Returns a `hingle_result` with an entry per zone.
+        """
+        x,y = numpy.broadcast_arrays(self.xaxis,self.yaxis)
+
+        if zones is None:
+            zones = numpy.zeros(x.shape,dtype=int)
+        elif hasattr(zones,"keys") and "top" in zones.keys():
+            zones = intervals(self.depth,zones["top"],zones["bottom"])
+
+        zones = numpy.asarray(zones).ravel()
+
+        x,y = x.ravel(),y.ravel()
+
+        valid = numpy.isfinite(x)&numpy.isfinite(y)
+
+        if zones.dtype.kind in "iu":
+            valid &= zones>=0
+
+        labels,codes = numpy.unique(zones[valid],return_inverse=True)
+
+        index = numpy.full(x.size,-1)
+        index[valid] = codes
+
+        x,y,count = x[valid],y[valid],labels.size
 
-        super().__init__(**kwargs)
+        if matrix is None:
+            slope,intercept,used = _envelope(x,y,codes,count,1-quantile,bins,iterations,cutoff,minpoints)
+        else:
+            matrix = numpy.broadcast_to(numpy.asarray(matrix,dtype=float),(count,))
+            with numpy.errstate(divide="ignore",invalid="ignore"):
+                ratio = y/(x-matrix[codes])
+            sample,used = _quantiles(numpy.abs(ratio),codes,count,1-quantile)
+            slope = ratio[sample]
+            intercept = -slope*matrix
 
-    def set_axis(self,axis=None):
+        slope = numpy.where(used>=minpoints,slope,numpy.nan)
+        intercept = numpy.where(used>=minpoints,intercept,numpy.nan)
+
+        result = hingle_result(labels,slope,intercept,used,index.reshape(numpy.shape(self.xaxis)))
+
+        if count>0:
+            self.slope,self.intercept = slope[0],intercept[0]
+
+        return result
+
+    @trim
+    def saturation(self,fit=None,out=None):
+        """Returns water saturation of the samples, the ratio of Rt^(-1/n) to that of
+        the 100% water line at the same x value. The line of each sample's zone is
+        taken from the fit if given, otherwise the line of the cross-plot is used."""
+        x,y = self.xaxis,self.yaxis
+
+        if fit is None:
+            slope,intercept = self.slope,self.intercept
+        else:
+            slope = numpy.append(fit.slope,numpy.nan)[fit.index]
+            intercept = numpy.append(fit.intercept,numpy.nan)[fit.index]
+
+        with numpy.errstate(divide="ignore",invalid="ignore"):
+            return numpy.divide(y,slope*x+intercept,out=out)
+
+    def set_axis(self,axis=None,layer="auto"):
+        """Draws the samples, see `pphys.insight._interactive.points` for the layer
+        options of large point counts."""
 
         if axis is None:
             figure,axis = pyplot.subplots(nrows=1,ncols=1)
 
         self.axis = axis
 
+        self.layer = points(self.axis,self.xaxis,self.yaxis,layer)
+
+        self.axis.autoscale_view()
+
+        self.xlim = numpy.array(self.axis.get_xlim())
+
+        self.axis.set_ylim(bottom=0)
+
+        self.axis.set_xlabel(f"Porosity Tool [{getattr(self.PHI,'unit','')}]")
+        self.axis.set_ylabel(f"Rt^(-1/{self.n:g})")
+
+        self.lines = []
+
+        self.saturations = []
+
+        self.canvas = self.axis.figure.canvas
+
+        self.blit = blitter(self.axis)
+
+    def set_lines(self,*args):
+        """arguments must be water saturation percentage in a decreasing order!
+        The lines are created once for a set of saturations, later calls with
+        the same saturations update their data in place."""
+
+        saturations = [100,*args]
+
+        if saturations != self.saturations:
+
+            self.blit.remove()
+
+            self.lines = []
+
+            linewidth = 1.0
+
+            alpha = 1.0
+
+            for Sw in saturations:
+
+                line, = self.axis.plot([],[],linewidth=linewidth,color="blue",alpha=alpha)
+
+                linewidth -= 0.1
+
+                alpha -= 0.1
+
+                self.lines.append(self.blit.add(line))
+
+            self.saturations = saturations
+
+        self._update_lines()
+
+        self.blit.update()
+
+    def _update_lines(self):
+        """Sets the data of the iso-saturation lines for the current slope and intercept."""
+
+        base = self.slope*self.xlim+self.intercept
+
+        for Sw,line in zip(self.saturations,self.lines):
+
+            line.set_data(self.xlim,Sw/100*base)
+
+    def set_mouse(self):
+
+        self.pressed = False
+        self.start = False
+
+        self.canvas.mpl_connect('button_press_event',self._mouse_press)
+        self.canvas.mpl_connect('motion_notify_event',self._mouse_move)
+        self.canvas.mpl_connect('button_release_event',self._mouse_release)
+
+    def _mouse_press(self,event):
+
+        if self.axis.get_navigate_mode()!= None: return
+        if not event.inaxes: return
+        if event.inaxes != self.axis: return
+
+        if self.start: return
+
+        if event.button is not MouseButton.LEFT: return
+
+        self.pressed = True
+
+    def _mouse_move(self,event):
+        """Rotates the water line around the matrix point towards the cursor."""
+
+        if self.axis.get_navigate_mode()!=None: return
+        if not event.inaxes: return
+        if event.inaxes!=self.axis: return
+
+        if not self.pressed: return
+
+        self.start = True
+
+        matrix = self.matrix
+
+        if event.xdata==matrix: return
+
+        self.slope = event.ydata/(event.xdata-matrix)
+
+        self.intercept = -self.slope*matrix
+
+        if not self.blit.throttle(): return
+
+        self._update_lines()
+
+        self.blit.update()
+
+    def _mouse_release(self,event):
+
+        if self.axis.get_navigate_mode()!=None: return
+        if not event.inaxes: return
+        if event.inaxes!=self.axis: return
+
+        if self.pressed:
+
+            self.pressed = False
+            self.start = False
+
+            self.set_lines(50,20,10)
+
+            return
+
     def show(self):
 
         pyplot.show()
 
-    @trim
-    def saturation(self):
-        return
\ No newline at end of file
+@dataclass
+class hingle_result:
+    """Hingle water lines fitted per zone by `hingle.fit`."""
+    zones       : numpy.ndarray # zone labels
+    slope       : numpy.ndarray # slope of the 100% water line
+    intercept   : numpy.ndarray # Rt^(-1/n) of the 100% water line at zero x value
+    points      : numpy.ndarray # envelope points kept by the fit of each zone
+    index       : numpy.ndarray # position of each sample's zone in the arrays, -1 if not fitted
+
+    @property
+    def matrix(self):
+        """Returns the porosity tool value of the matrix of each zone."""
+        return -self.intercept/self.slope
+
+def intervals(depth,top,bottom):
+    """Returns the row of the depth interval table holding each depth, -1 for depths
+    outside all intervals. Where intervals overlap, the one with the deepest top wins."""
+    depth = numpy.asarray(depth,dtype=float)
+
+    top,bottom = numpy.asarray(top,dtype=float),numpy.asarray(bottom,dtype=float)
+
+    order = numpy.argsort(top,kind="stable")
+
+    position = numpy.searchsorted(top[order],depth,side="right")-1
+
+    row = order[numpy.maximum(position,0)]
+
+    return numpy.where((position>=0)&(depth<=bottom[row]),row,-1)
@@ -0,0 +1,156 @@
+import functools
+
+import numpy
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+BACKEND = "numpy" if numba is None else "numba"
+
+BLOCK = 16384 # samples evaluated at once by numpy, temporaries of a block stay in cache
+
+if numba is None:
+
+    def _clip(value,lower,upper):
+        """Returns the values within [lower,upper], NaN is kept."""
+        return numpy.clip(value,lower,upper,out=value if isinstance(value,numpy.ndarray) else None)
+
+    _power = numpy.power
+
+else:
+
+    @numba.njit
+    def _power(base,exponent):
+        """Returns base**exponent, with the square and square root of the common
+        exponents computed directly as numpy.power does and others through exp and
+        log, which are faster than the scalar pow."""
+        if exponent==2.:
+            return base*base
+        if exponent==0.5:
+            return numpy.sqrt(base)
+        if exponent==1.:
+            return base
+        if exponent==0. or base<0.:
+            return base**exponent
+        return numpy.exp(exponent*numpy.log(base))
+
+    @numba.njit
+    def _clip(value,lower,upper):
+        """Returns the value within [lower,upper], NaN is kept."""
+        if numpy.isnan(value): # ordered comparisons of NaN raise the invalid flag
+            return value
+        if value<lower:
+            return lower
+        if value>upper:
+            return upper
+        return value
+
+def kernel(function):
+    """Turns an elementwise equation into a kernel evaluated for arrays of all its
+    arguments. With numba, the equation is compiled into a ufunc that runs a single
+    loop without temporary arrays; otherwise it is evaluated with numpy arithmetic
+    block by block along the first axis, so temporaries are limited to a block.
+
+    Equations whose last arguments are lower and upper are called as
+
+        kernel(*args,lower=0,upper=1,out=None)
+
+    where the bounds can be None, and the others as kernel(*args,out=None). Inputs are
+    broadcast together and cast to float64.
+    """
+    names = function.__code__.co_varnames[:function.__code__.co_argcount]
+
+    clipped = names[-2:] == ("lower","upper")
+
+    equation = function
+
+    if numba is not None:
+        function = numba.vectorize(nopython=True)(function)
+
+    def evaluate(args,out):
+
+        args = [numpy.asarray(arg,dtype=float) for arg in args]
+
+        if numba is not None:
+            return function(*args) if out is None else function(*args,out=out)
+
+        shape = numpy.broadcast_shapes(*(arg.shape for arg in args))
+
+        if len(shape)==0:
+            values = function(*args)
+            return values if out is None else numpy.copyto(out,values) or out
+
+        out = numpy.empty(shape) if out is None else out
+
+        rows = max(1,BLOCK//max(1,int(numpy.prod(shape[1:]))))
+
+        # arguments spanning the first axis are sliced, the others broadcast to each block
+        spans = [arg.ndim==len(shape) and arg.shape[0]==shape[0] and shape[0]>1 for arg in args]
+
+        for start in range(0,shape[0],rows):
+            block = slice(start,start+rows)
+            out[block] = function(*(arg[block] if span else arg for arg,span in zip(args,spans)))
+
+        return out
+
+    if clipped:
+        @functools.wraps(equation)
+        def call(*args,lower=0,upper=1,out=None):
+            lower = -numpy.inf if lower is None else lower
+            upper = numpy.inf if upper is None else upper
+            return evaluate((*args,lower,upper),out)
+    else:
+        @functools.wraps(equation)
+        def call(*args,out=None):
+            return evaluate(args,out)
+
+    return call
+
+@kernel
+def archie_sw(porosity,rwater,rtotal,a,m,n,lower,upper):
+    """Water saturation based on Archie's equation."""
+    return _clip(_power(a*rwater/(_power(porosity,m)*rtotal),1/n),lower,upper)
+
+@kernel
+def indonesia_sw(porosity,vshale,rwater,rshale,rtotal,shalepower,a,m,n,lower,upper):
+    """Water saturation based on Poupon-Leveaux Indonesia model."""
+    swnclean = a/_power(porosity,m)*(rwater/rtotal)
+    swnshale = _power(vshale,-2*shalepower)*(rshale/rtotal)
+    swn = 1/(1/numpy.sqrt(swnclean)+1/numpy.sqrt(swnshale))**2
+    return _clip(_power(swn,1/n),lower,upper)
+
+@kernel
+def laminated_sw(porosity,vshale,rwater,rshale,rtotal,a,m,n,lower,upper):
+    """Water saturation based on laminated shale model."""
+    swn = ((rwater/rtotal)-vshale*(rwater/rshale))*a/_power(porosity,m)*_power(1-vshale,m-1)
+    return _clip(_power(swn,1/n),lower,upper)
+
+@kernel
+def dewitte_sw(phiim,qvalue,rwater,rshale,rtotal,a,m,lower,upper):
+    """Water saturation (equivalent of Swe) based on de Witte's (1950) model."""
+    swnclean = (a*rwater)/(_power(phiim,m)*rtotal)
+    term1 = (qvalue*(rshale-rwater)/(2*rshale))**2
+    term2 = qvalue*(rshale+rwater)/(2*rshale)
+    return _clip((numpy.sqrt(swnclean+term1)-term2)/(1-qvalue),lower,upper)
+
+@kernel
+def dualwater_forward(swt,por,swb,rwb,rw,rt,a,m,n):
+    """Forward equation of the dual-water model, zero at the total water saturation."""
+    return (swt-swb*(1-rw/rwb))*_power(swt,n-1)-(a/_power(por,m))*(rw/rt)
+
+@kernel
+def dualwater_derivative(swt,por,swb,rwb,rw,rt,a,m,n):
+    """Derivative of the forward equation of the dual-water model."""
+    return (n*swt-(n-1)*swb*(1-rw/rwb))*_power(swt,n-2)
+
+@kernel
+def waxman_forward(sw,bqv,rw,rt,por,a,m,n):
+    """Forward equation of the Waxman-Smits model, zero at the water saturation."""
+    return (sw+bqv*rw)*_power(sw,n-1)-(a/_power(por,m))*(rw/rt)
+
+@kernel
+def waxman_derivative(sw,bqv,rw,rt,por,a,m,n):
+    """Derivative of the forward equation of the Waxman-Smits model."""
+    return (n*sw+(n-1)*bqv*rw)*_power(sw,n-2)
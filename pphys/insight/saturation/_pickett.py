@@ -1,8 +1,15 @@
 from dataclasses import dataclass
 
+from matplotlib import pyplot
+from matplotlib.backend_bases import MouseButton
+
 import numpy
 
-from borepy.utils._wrappers import trim
+from .._interactive import blitter, points
+
+from .._trim import trim
+
+from ._archie import archie
 
 class pickett():
 
@@ -46,29 +53,50 @@ class pickett():
 
         self.intercept = intercept
 
-    def set_axis(self,axis=None):
+    def autofit(self,quantile=0.05,bins=10,m=None,a=1.,n=None):
+        """Sets the 100% water line to the wet-point envelope of the cross-plot and
+        returns the fit, see `envelope` for the arguments. The archie parameters are
+        configured from the fit with the tortuosity constant a; the saturation exponent
+        n is kept from an earlier configuration, 2 otherwise."""
+        porosity = getattr(self.PHI,"data",self.PHI)
+        resistivity = getattr(self.RT,"data",self.RT)
+
+        fit = envelope(porosity,resistivity,quantile=quantile,bins=bins,m=m)
+
+        if n is None:
+            n = getattr(self,"archie",{}).get("n",2.)
+
+        self.config(m=fit.m[0],a=a,Rw=fit.rwater(a)[0],n=n)
+
+        return fit
+
+    def set_axis(self,axis=None,layer="auto"):
+        """Draws the samples on log-log axes, see `pphys.insight._interactive.points`
+        for the layer options of large point counts."""
 
         if axis is None:
             figure,axis = pyplot.subplots(nrows=1,ncols=1)
 
         self.axis = axis
 
-        xaxis = self.resistivity.vals
-        yaxis = self.porosity.vals
-
-        self.axis.scatter(xaxis,yaxis,s=2,c="k")
+        xaxis = numpy.asarray(getattr(self.RT,"data",self.RT),dtype=float)
+        yaxis = numpy.asarray(getattr(self.PHI,"data",self.PHI),dtype=float)
 
         self.axis.set_xscale('log')
         self.axis.set_yscale('log')
 
+        self.layer = points(self.axis,xaxis,yaxis,layer)
+
+        self.axis.autoscale_view()
+
         xlim = numpy.array(self.axis.get_xlim())
         ylim = numpy.array(self.axis.get_ylim())
 
         self.xlim = numpy.floor(numpy.log10(xlim))+numpy.array([0,1])
         self.ylim = numpy.floor(numpy.log10(ylim))+numpy.array([0,1])
 
-        self.axis.set_xlabel(f"Resistivity [{self.resistivity.unit}]")
-        self.axis.set_ylabel(f"Porosity [{self.porosity.unit}]")
+        self.axis.set_xlabel(f"Resistivity [{getattr(self.RT,'unit','')}]")
+        self.axis.set_ylabel(f"Porosity [{getattr(self.PHI,'unit','')}]")
 
         self.axis.set_xlim(10**self.xlim)
         self.axis.set_ylim(10**self.ylim)
@@ -79,48 +107,59 @@ class pickett():
 
         self.lines = []
 
+        self.saturations = []
+
         self.canvas = self.axis.figure.canvas
 
+        self.blit = blitter(self.axis)
+
     def set_lines(self,*args):
-        """arguments must be water saturation percentage in a decreasing order!"""
+        """arguments must be water saturation percentage in a decreasing order!
+        The lines are created once for a set of saturations, later calls with
+        the same saturations update their data in place."""
 
-        saturations = [100]
+        saturations = [100,*args]
 
-        [saturations.append(arg) for arg in args]
+        if saturations != self.saturations:
 
-        base = self.slope*self.xlim+self.intercept
+            self.blit.remove()
 
-        for line in self.lines:
+            self.lines = []
 
-            line.remove()
+            linewidth = 1.0
 
-        self.lines = []
+            alpha = 1.0
 
-        linewidth = 1.0
+            for Sw in saturations:
 
-        alpha = 1.0
+                line, = self.axis.plot([],[],linewidth=linewidth,color="blue",alpha=alpha)
 
-        X = 10**self.xlim
+                linewidth -= 0.1
 
-        n = self.archie['n']
+                alpha -= 0.1
 
-        m = -1/self.slope
+                self.lines.append(self.blit.add(line))
 
-        for Sw in saturations:
+            self.saturations = saturations
 
-            Sw = Sw/100
+        self._update_lines()
 
-            Y = 10**(base-n/m*numpy.log10(Sw))
+        self.blit.update()
 
-            line, = self.axis.plot(X,Y,linewidth=linewidth,color="blue",alpha=alpha)
+    def _update_lines(self):
+        """Sets the data of the iso-saturation lines for the current slope and intercept."""
 
-            linewidth -= 0.1
+        base = self.slope*self.xlim+self.intercept
 
-            alpha -= 0.1
+        X = 10**self.xlim
 
-            self.lines.append(line)
+        n = self.archie['n']
+
+        m = -1/self.slope
 
-        self.canvas.draw()
+        for Sw,line in zip(self.saturations,self.lines):
+
+            line.set_data(X,10**(base-n/m*numpy.log10(Sw/100)))
 
     def set_mouse(self):
 
@@ -158,7 +197,11 @@ class pickett():
 
         self.intercept = y-self.slope*x
 
-        self.set_lines()
+        if not self.blit.throttle(): return
+
+        self._update_lines()
+
+        self.blit.update()
 
     def _mouse_release(self,event):
 
@@ -209,4 +252,157 @@ class pickett():
     @property
     def depth(self):
 
-        return self.PHI.depth
\ No newline at end of file
+        return self.PHI.depth
+
+@dataclass
+class envelope_result:
+    """Pickett parameters fitted per zone by `envelope`."""
+    zones   : numpy.ndarray # zone labels
+    m       : numpy.ndarray # cementation exponent, negative of the water line slope
+    arw     : numpy.ndarray # multiplication of tortuosity constant and water resistivity
+    points  : numpy.ndarray # envelope points kept by the fit of each zone
+    index   : numpy.ndarray # position of each sample's zone in the arrays, -1 if invalid
+
+    def rwater(self,a=1.):
+        """Returns the formation water resistivity for the tortuosity constant."""
+        return self.arw/a
+
+    def archie(self,a=1.,n=2.):
+        """Returns an archie instance with the cementation exponents of the zones."""
+        return archie(a=a,m=self.m,n=n)
+
+def envelope(porosity,rtotal,zones=None,quantile=0.05,bins=10,m=None,iterations=2,cutoff=3.,minpoints=3):
+    """Fits the 100% water saturation line of the Pickett plot to the wet points of each
+    zone, log10(Rt) = log10(a*Rw)-m*log10(phi), all zones at once.
+
+    porosity    : porosity of the samples.
+    rtotal      : true resistivity of the samples.
+    zones       : zone label of each sample, e.g. well and formation codes; one zone
+                  by default.
+    quantile    : wet points are the samples with the lowest resistivities, the line
+                  is fitted to the samples at this quantile of log10(Rt) in porosity bins.
+    bins        : number of equal log-porosity bins spanning each zone.
+    m           : if given, the cementation exponent is fixed and only a*Rw is fitted,
+                  as the quantile of log10(Rt)+m*log10(phi) over the zone.
+    iterations  : number of refits with the envelope points picked again along the
+                  last line; every fit is repeated after dropping points with residuals
+                  larger than cutoff times the scaled median absolute deviation.
+    minpoints   : minimum number of samples in a bin and of bins in a zone; zones
+                  with fewer are returned as NaN.
+
+    Returns an `envelope_result` with an entry per zone; fit.m[fit.index] gives the
+    value of each sample.
+    """
+    porosity,rtotal = numpy.broadcast_arrays(numpy.asarray(porosity,dtype=float),numpy.asarray(rtotal,dtype=float))
+
+    zones = numpy.zeros(porosity.shape,dtype=int) if zones is None else numpy.asarray(zones)
+
+    with numpy.errstate(divide="ignore",invalid="ignore"):
+        y = numpy.log10(porosity).ravel()
+        x = numpy.log10(rtotal).ravel()
+
+    valid = numpy.isfinite(x)&numpy.isfinite(y)
+
+    labels,codes = numpy.unique(zones.ravel()[valid],return_inverse=True)
+
+    index = numpy.full(porosity.size,-1)
+    index[valid] = codes
+
+    x,y,count = x[valid],y[valid],labels.size
+
+    if m is not None:
+        m = numpy.broadcast_to(numpy.asarray(m,dtype=float),(count,))
+        values = x+m[codes]*y
+        sample,size = _quantiles(values,codes,count,quantile)
+        arw = numpy.where(size>=minpoints,10**values[sample],numpy.nan)
+        return envelope_result(labels,m.copy(),arw,size,index.reshape(porosity.shape))
+
+    slope,intercept,used = _envelope(y,x,codes,count,quantile,bins,iterations,cutoff,minpoints)
+
+    m = numpy.where(used>=minpoints,-slope,numpy.nan)
+    arw = numpy.where(used>=minpoints,10**intercept,numpy.nan)
+
+    return envelope_result(labels,m,arw,used,index.reshape(porosity.shape))
+
+def _envelope(u,v,codes,count,quantile,bins=10,iterations=2,cutoff=3.,minpoints=3):
+    """Fits the lines v = slope*u+intercept of each zone to the samples at the quantile
+    of v in equal bins of u. Each iteration picks the samples again at the quantile of
+    v detrended by the last slope, so that they lie on the envelope rather than at the
+    bin edges, fits the lines and refits them after dropping points beyond the cutoff
+    times the scaled median absolute deviation. Returns the slopes, intercepts and
+    number of points kept per zone."""
+    low = numpy.full(count,numpy.inf)
+    high = numpy.full(count,-numpy.inf)
+
+    numpy.minimum.at(low,codes,u)
+    numpy.maximum.at(high,codes,u)
+
+    width = numpy.where(high>low,(high-low)/bins,1.)
+
+    groups = codes*bins+numpy.clip(((u-low[codes])/width[codes]).astype(int),0,bins-1)
+
+    owner = numpy.arange(count*bins)//bins
+
+    slope = numpy.zeros(count)
+
+    for iteration in range(iterations+1):
+
+        # the sample at the quantile of each bin, detrended by the last slope, is its
+        # envelope point; the first pick is on v itself
+        point,size = _quantiles(v-numpy.nan_to_num(slope)[codes]*u,groups,count*bins,quantile)
+
+        uq,vq = u[point],v[point]
+
+        # envelope points of the bins holding enough samples
+        keep = size>=minpoints
+
+        slope,intercept,used = _lines(uq,vq,owner,keep.astype(float),count)
+
+        residual = numpy.abs(vq-(intercept[owner]+slope[owner]*uq))
+
+        residual = numpy.where(keep,residual,numpy.nan)
+
+        with numpy.errstate(invalid="ignore"):
+            mad = numpy.nanmedian(residual.reshape(count,bins),axis=1)
+
+        keep = keep&~(residual>cutoff*1.4826*mad[owner]+1e-12)
+
+        slope,intercept,used = _lines(uq,vq,owner,keep.astype(float),count)
+
+    return slope,intercept,used
+
+def _quantiles(values,groups,count,quantile):
+    """Returns the index of the sample at the quantile of the values in each group,
+    -1 for empty groups, and the group sizes."""
+    order = numpy.lexsort((values,groups))
+
+    size = numpy.bincount(groups,minlength=count)
+
+    start = numpy.concatenate(([0],numpy.cumsum(size)[:-1]))
+
+    position = start+numpy.floor(quantile*numpy.maximum(size-1,0)).astype(int)
+
+    index = numpy.full(count,-1)
+
+    index[size>0] = order[position[size>0]]
+
+    return index,size
+
+def _lines(x,y,owner,weight,count):
+    """Returns the slopes and intercepts of the weighted least squares lines of the
+    points of each owner and the number of points used."""
+    x = numpy.where(weight>0,x,0.)
+    y = numpy.where(weight>0,y,0.)
+
+    def total(values):
+        return numpy.bincount(owner,weights=weight*values,minlength=count)
+
+    n,sx,sy = total(1.),total(x),total(y)
+
+    sxx,sxy = total(x*x),total(x*y)
+
+    with numpy.errstate(divide="ignore",invalid="ignore"):
+        slope = (n*sxy-sx*sy)/(n*sxx-sx*sx)
+        intercept = (sy-slope*sx)/n
+
+    return slope,intercept,n.astype(int)
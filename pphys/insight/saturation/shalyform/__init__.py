@@ -9,3 +9,4 @@ from ._simandoux import totalshale
 from ._waxman import waxman
 from ._dualwater import dualwater
 
+from ._compare import compare
@@ -0,0 +1,90 @@
+import numpy
+
+from ..._roots import roots
+
+from .._kernels import dualwater_forward, dualwater_derivative
+
+from ._simandoux import solve, polynomial_forward, polynomial_derivative
+
+MODELS = ("archie","indonesia","laminated","simandoux","totalshale","dispersed","dualwater")
+
+def compare(archie,porosity,vshale,rwater,rshale,rtotal,models=MODELS,phishale=None,shalepower=None,lower=0,upper=1,tol=1.48e-8,maxiter=50,out=None):
+	"""Returns water saturations of several models for the same logs as an array of
+	shape (models x depth), in the order of the model names.
+
+	archie 		: archie instance holding a, m and n of all models
+	porosity 	: total porosity
+	vshale 		: shale volume
+	rwater 		: formation water resistivity
+	rshale 		: shale resistivity
+	rtotal 		: true formation resistivity
+
+	models 		: names among archie, indonesia, laminated, simandoux, totalshale,
+				  dispersed (Bateman's total saturation) and dualwater
+	phishale 	: shale porosity, required by the dual-water model for the bound
+				  water saturation (Woodhouse) and resistivity
+	shalepower 	: exponent of the Indonesia model, 1-vshale/2 by default
+	out 		: array of shape (models x depth) to write the saturations to, so that
+				  repeated comparisons reuse the same memory
+
+	The formation factor, Rw/Rt and the other terms shared by the models are computed
+	once, the implicit models are solved all samples at once and the saturations are
+	trimmed to [lower,upper] in a single pass.
+	"""
+	a,m,n = archie.a,archie.m,archie.n
+
+	shape = numpy.broadcast_shapes(*(numpy.shape(value) for value in (porosity,vshale,rwater,rshale,rtotal)))
+
+	saturation = numpy.empty((len(models),*shape)) if out is None else out
+
+	if saturation.shape != (len(models),*shape):
+		raise ValueError(f"The output array must have the shape {(len(models),*shape)}.")
+
+	phim = porosity**m
+
+	formfact = a/phim # formation factor
+	ratio = rwater/rtotal
+
+	swnclean = formfact*ratio
+
+	conductance = vshale/rshale # shale conductivity term of Simandoux type models
+
+	for row,name in enumerate(models):
+
+		if name == "archie":
+			swn = swnclean
+		elif name == "indonesia":
+			power = 1-vshale/2 if shalepower is None else shalepower
+			swnshale = vshale**(-2*power)*(rshale/rtotal)
+			swn = (swnclean**(-1/2)+swnshale**(-1/2))**(-2)
+		elif name == "laminated":
+			swn = (ratio-vshale*(rwater/rshale))*formfact*(1-vshale)**(m-1)
+		elif name == "simandoux":
+			saturation[row] = solve(1/(formfact*rwater),conductance,1/rtotal,n,tol,maxiter)
+			continue
+		elif name == "totalshale":
+			saturation[row] = solve(1/(formfact*rwater)/(1-vshale),conductance,1/rtotal,n,tol,maxiter)
+			continue
+		elif name == "dispersed":
+			saturation[row] = roots(polynomial_forward,polynomial_derivative,
+				1/(formfact*rwater),porosity*vshale/a*(1/rshale-1/rwater),1/rtotal,n,
+				x0=1.,bracket=(0.,1.),tol=tol,maxiter=maxiter).root
+			continue
+		elif name == "dualwater":
+			if phishale is None:
+				raise ValueError("The dual-water model requires the shale porosity, phishale.")
+			swbound = numpy.clip(vshale*phishale/porosity,0,1)
+			rwbound = rshale*phishale**2
+			saturation[row] = roots(dualwater_forward,dualwater_derivative,
+				porosity,swbound,rwbound,rwater,rtotal,a,m,n,
+				x0=1.,bracket=(0.,1.),tol=tol,maxiter=maxiter).root
+			continue
+		else:
+			raise ValueError(f"Unknown saturation model {name}, expected one of {MODELS}.")
+
+		saturation[row] = numpy.power(swn,1/n)
+
+	if lower is not None or upper is not None:
+		numpy.clip(saturation,lower,upper,out=saturation)
+
+	return saturation
@@ -1,8 +1,8 @@
-import numpy
+from ..._trim import trim
 
-from scipy.optimize import root_scalar
+from ..._roots import roots
 
-from borepy.utils._wrappers import trim
+from .._kernels import dewitte_sw
 
 class dispersed():
 	"""Dispersed shale is an inexact term used to describe clay overgrowths on the
@@ -18,7 +18,7 @@ class dispersed():
 		return (phis-phid)/phis
 
 	@trim
-	def sw_dewitte(self,phiim,qvalue,rwater,rshale,rtotal):
+	def sw_dewitte(self,phiim,qvalue,rwater,rshale,rtotal,lower=0,upper=1,out=None):
 		"""Calculates water saturation (equivalent of Swe) based on de Witte's (1950) model,
 		full equation.
 
@@ -30,13 +30,11 @@ class dispersed():
 		rtotal 	: true formation resistivity
 
 		sw 		: the water saturation in the fraction of true effective formation porosity
-		"""
-		swn_clean = (self._archie.a*rwater)/(phiim**self._archie.m*rtotal)
 
-		term1 = (qvalue*(rshale-rwater)/(2*rshale))**2
-		term2 = qvalue*(rshale+rwater)/(2*rshale)
-
-		return ((swn_clean+term1)**(1/2)-term2)/(1-qvalue)
+		It is evaluated and trimmed by the fused kernel of `pphys.insight.saturation._kernels`.
+		"""
+		return dewitte_sw(phiim,qvalue,rwater,rshale,rtotal,
+			self._archie.a,self._archie.m,lower=lower,upper=upper,out=out)
 
 	@trim
 	def sw_dewitte_simplified(self,phiim,qvalue,rwater,rtotal):
@@ -63,36 +61,21 @@ class dispersed():
 		return qvalue+swater*(1-qvalue)
 
 	@trim
-	def swt_bateman(self,phit,vshale,rwater,rshale,rtotal):
-		"""Calculates total water saturation based on dispersed shale model."""
-
-		size = phit.size
-
-		saturation = numpy.zeros(size)
-
-		vshale = set_value_iterable(vshale,size)
-		rwater = set_value_iterable(rwater,size)
-		rshale = set_value_iterable(rshale,size)
-		rtotal = set_value_iterable(rtotal,size)
-
-		zipped = zip(phit,vshale,rwater,rshale,rtotal)
-
-		for index,(por,vsh,rw,rsh,rt) in enumerate(zipped):
-
-			solver = root_scalar(
-				dispersed.swt_bateman_forward,
-				method = 'newton', x0 = 1,
-				fprime = dispersed.swt_bateman_derivative,
-				args = (por,vsh,rw,rsh,rt,
-					self._archie.a,
-					self._archie.m,
-					self._archie.n,
-					),
-				)
-
-			saturation[index] = solver.root
-
-		return saturation
+	def swt_bateman(self,phit,vshale,rwater,rshale,rtotal,tol=1.48e-8,maxiter=50):
+		"""Calculates total water saturation based on dispersed shale model. All samples
+		are solved at once by Newton iterations from Swt=1, safeguarded by bisection where
+		the root lies within 0 and 1, see `pphys.insight._roots.roots` for the step
+		tolerance tol and maxiter."""
+		return roots(
+			dispersed.swt_bateman_forward,
+			dispersed.swt_bateman_derivative,
+			phit,vshale,rwater,rshale,rtotal,
+			self._archie.a,
+			self._archie.m,
+			self._archie.n,
+			x0 = 1., bracket = (0.,1.),
+			tol = tol, maxiter = maxiter,
+			).root
 
 	@trim
 	def swe_bateman(self,swt,phie,phit):
@@ -122,12 +105,3 @@ class dispersed():
 	@property
 	def archie(self):
 		return self._archie
-
-def set_value_iterable(entry,size):
-
-	try:
-		iter(entry)
-	except TypeError:
-		entry = [entry for _ in range(size)]
-
-	return entry
\ No newline at end of file
@@ -1,8 +1,8 @@
-import numpy
+from ..._trim import trim
 
-from scipy.optimize import root_scalar
+from ..._roots import roots
 
-from borepy.utils._wrappers import trim
+from .._kernels import dualwater_forward, dualwater_derivative
 
 class dualwater():
 	"""The dual water model proposes that two distinct waters can be found in the pore space.
@@ -63,7 +63,7 @@ class dualwater():
 		return rshale*phishale**2
 
 	@trim
-	def swt(self,phit,swbound,rwbound,rwater,rtotal):
+	def swt(self,phit,swbound,rwbound,rwater,rtotal,tol=1.48e-8,maxiter=50):
 		"""Calculates total water saturation based on dual-water model.
 		
 		phit 	: total porosity
@@ -73,34 +73,21 @@ class dualwater():
 		rwater	: formation water resistivity
 		rtotal	: true formation resistivity
 
+		All samples are solved at once by Newton iterations from Swt=1, safeguarded by
+		bisection where the root lies within 0 and 1, see `pphys.insight._roots.roots`
+		for the step tolerance tol and maxiter. The equation and its derivative are
+		evaluated by the fused kernels of `pphys.insight.saturation._kernels`.
 		"""
-		size = phit.size
-
-		saturation = numpy.zeros(size)
-
-		swbound = set_value_iterable(swbound,size)
-		rwbound = set_value_iterable(rwbound,size)
-		rwater = set_value_iterable(rwater,size)
-		rtotal = set_value_iterable(rtotal,size)
-
-		zipped = zip(phit,swbound,rwbound,rwater,rtotal)
-
-		for index,(por,swb,rwb,rw,rt) in enumerate(zipped):
-
-			solver = root_scalar(
-				dualwater.swt_forward,
-				method = 'newton', x0 = 1,
-				fprime = dualwater.swt_derivative,
-				args = (por,swb,rwb,rw,rt,
-					self._archie.a,
-					self._archie.m,
-					self._archie.n,
-					),
-				)
-
-			saturation[index] = solver.root
-
-		return saturation
+		return roots(
+			dualwater_forward,
+			dualwater_derivative,
+			phit,swbound,rwbound,rwater,rtotal,
+			self._archie.a,
+			self._archie.m,
+			self._archie.n,
+			x0 = 1., bracket = (0.,1.),
+			tol = tol, maxiter = maxiter,
+			).root
 
 	@trim
 	def swe(self,swt,swbound):
@@ -135,12 +122,3 @@ class dualwater():
 	@property
 	def archie(self):
 		return self._archie
-
-def set_value_iterable(entry,size):
-
-	try:
-		iter(entry)
-	except TypeError:
-		entry = [entry for _ in range(size)]
-
-	return entry	
\ No newline at end of file
@@ -1,6 +1,6 @@
-import numpy
+from ..._trim import trim
 
-from borepy.utils._wrappers import trim
+from .._kernels import indonesia_sw
 
 class indonesia():
 
@@ -18,15 +18,15 @@ class indonesia():
 		return (swnclean**(-1/2)+swnshale**(-1/2))**(-2)
 
 	@trim
-	def sw(self,porosity,vshale,rwater,rshale,rtotal,shalepower=None):
-		"""Calculates water saturation based on Poupon-Leveaux Indonesia model"""
+	def sw(self,porosity,vshale,rwater,rshale,rtotal,shalepower=None,lower=0,upper=1,out=None):
+		"""Calculates water saturation based on Poupon-Leveaux Indonesia model, evaluated
+		and trimmed by the fused kernel of `pphys.insight.saturation._kernels`."""
 
 		if shalepower is None:
 			shalepower = 1-vshale/2
 
-		swntotal = self.swn(porosity,vshale,rwater,rshale,rtotal,shalepower)
-
-		return numpy.power(swntotal,1/self._archie.n)
+		return indonesia_sw(porosity,vshale,rwater,rshale,rtotal,shalepower,
+			self._archie.a,self._archie.m,self._archie.n,lower=lower,upper=upper,out=out)
 
 	def bwv(self,porosity,swater):
 		"""Calculates bulk water volume."""
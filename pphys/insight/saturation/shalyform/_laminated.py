@@ -1,6 +1,6 @@
-import numpy
+from ..._trim import trim
 
-from borepy.utils._wrappers import trim
+from .._kernels import laminated_sw
 
 class laminated():
 	"""The model for analysis of laminated shale proposes a multilayer
@@ -30,9 +30,11 @@ class laminated():
 		return term1*term2
 
 	@trim
-	def sw(self,porosity,vshale,rwater,rshale,rtotal):
-		"""Calculates water saturation based on laminated shale model."""
-		return self.swn(porosity,vshale,rwater,rshale,rtotal)**(1/self._archie.n)
+	def sw(self,porosity,vshale,rwater,rshale,rtotal,lower=0,upper=1,out=None):
+		"""Calculates water saturation based on laminated shale model, evaluated and
+		trimmed by the fused kernel of `pphys.insight.saturation._kernels`."""
+		return laminated_sw(porosity,vshale,rwater,rshale,rtotal,
+			self._archie.a,self._archie.m,self._archie.n,lower=lower,upper=upper,out=out)
 
 	@property
 	def archie(self):
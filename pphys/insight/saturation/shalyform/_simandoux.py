@@ -1,8 +1,8 @@
 import numpy
 
-from scipy.optimize import root_scalar
+from ..._trim import trim
 
-from borepy.utils._wrappers import trim
+from ..._roots import roots
 
 class simandoux():
 
@@ -11,36 +11,18 @@ class simandoux():
 		self._archie = archie
 
 	@trim
-	def sw(self,porosity,vshale,rwater,rshale,rtotal):
-		"""Calculates water saturation based on simandoux model."""
+	def sw(self,porosity,vshale,rwater,rshale,rtotal,tol=1.48e-8,maxiter=50):
+		"""Calculates water saturation based on simandoux model. All samples are solved
+		at once, in closed form when n is 2 and by Newton iterations from Sw=1 otherwise,
+		with the step tolerance tol and at most maxiter iterations per sample."""
 
-		size = porosity.size
+		a,m,n = self._archie.a,self._archie.m,self._archie.n
 
-		saturation = numpy.zeros(size)
+		A = (porosity**m)/(a*rwater)
+		B = vshale/rshale
+		C = 1/rtotal
 
-		vshale = set_value_iterable(vshale,size)
-		rwater = set_value_iterable(rwater,size)
-		rshale = set_value_iterable(rshale,size)
-		rtotal = set_value_iterable(rtotal,size)
-
-		zipped = zip(porosity,vshale,rwater,rshale,rtotal)
-
-		for index,(por,vsh,rw,rsh,rt) in enumerate(zipped):
-
-			solver = root_scalar(
-				simandoux.sw_forward,
-				method = 'newton', x0 = 1,
-				fprime = simandoux.sw_derivative,
-				args = (por,vsh,rw,rsh,rt,
-					self._archie.a,
-					self._archie.m,
-					self._archie.n,
-					),
-				)
-
-			saturation[index] = solver.root
-
-		return saturation
+		return solve(A,B,C,n,tol,maxiter)
 
 	def bwv(self,porosity,swater):
 		"""Calculates bulk water volume."""
@@ -79,35 +61,17 @@ class totalshale():
 		self._archie = archie
 
 	@trim
-	def sw(self,porosity,vshale,rwater,rshale,rtotal):
-		"""Calculates water saturation based on total shale model."""
-		size = porosity.size
-
-		saturation = numpy.zeros(size)
+	def sw(self,porosity,vshale,rwater,rshale,rtotal,tol=1.48e-8,maxiter=50):
+		"""Calculates water saturation based on total shale model, see simandoux.sw
+		for the solution and its controls."""
 
-		vshale = set_value_iterable(vshale,size)
-		rwater = set_value_iterable(rwater,size)
-		rshale = set_value_iterable(rshale,size)
-		rtotal = set_value_iterable(rtotal,size)
+		a,m,n = self._archie.a,self._archie.m,self._archie.n
 
-		zipped = zip(porosity,vshale,rwater,rshale,rtotal)
+		A = (porosity**m)/(a*rwater)/(1-vshale)
+		B = vshale/rshale
+		C = 1/rtotal
 
-		for index,(por,vsh,rw,rsh,rt) in enumerate(zipped):
-
-			solver = root_scalar(
-				totalshale.sw_forward,
-				method = 'newton', x0 = 1,
-				fprime = totalshale.sw_derivative,
-				args = (por,vsh,rw,rsh,rt,
-					self._archie.a,
-					self._archie.m,
-					self._archie.n,
-					),
-				)
-
-			saturation[index] = solver.root
-
-		return saturation
+		return solve(A,B,C,n,tol,maxiter)
 
 	def bwv(self,porosity,swater):
 		"""Calculates bulk water volume."""
@@ -137,14 +101,26 @@ class totalshale():
 	def bulk_water_volume(self):
 		return self.bwv
 
-def set_value_iterable(entry,size):
+def solve(A,B,C,n,tol=1.48e-8,maxiter=50):
+	"""Returns the positive root of A*(Sw)**n+B*(Sw)-C = 0 for arrays of coefficients.
+
+	When n is the scalar 2, the root of the quadratic is returned, written as 2C/(B+sqrt(B**2+4AC))
+	to avoid cancellation. Otherwise, Newton iterations start from Sw=1 for all samples
+	and each sample stops once its step is within tol, as root_scalar(method="newton")
+	does one sample at a time, see `pphys.insight._roots.roots`.
+	"""
+	if numpy.ndim(n) == 0 and n == 2:
+		return 2*C/(B+numpy.sqrt(B**2+4*A*C))
+
+	return roots(polynomial_forward,polynomial_derivative,A,B,C,n,x0=1.,tol=tol,maxiter=maxiter).root
 
-	try:
-		iter(entry)
-	except TypeError:
-		entry = [entry for _ in range(size)]
+def polynomial_forward(sw,A,B,C,n):
+	"""Returns A*(Sw)**n+B*(Sw)-C."""
+	return (A*sw**(n-1)+B)*sw-C
 
-	return entry
+def polynomial_derivative(sw,A,B,C,n):
+	"""Returns the derivative of A*(Sw)**n+B*(Sw)-C."""
+	return n*A*sw**(n-1)+B
 
 if __name__ == "__main__":
 
@@ -13,8 +13,141 @@ means exists to use this method if only well log data are available. Modificatio
 Smits method by Juhász (1979) have made it more directly applicable to measurements from logs.
 """
 
+import numpy
+
+from ..._trim import trim
+
+from ..._roots import roots
+
+from .._kernels import waxman_forward, waxman_derivative
+
 class waxman():
 
-	def saturation():
+	def __init__(self,archie):
+		"""Waxman-Smits model where the clay conductivity is added to that of the formation
+		water through the cation exchange capacity per unit pore volume, Qv. The a, m and n
+		of archie are taken as the a, m* and n* of the clay-corrected formation."""
+
+		self._archie = archie
+
+	def qvalue(self,cec,porosity,density=2.65):
+		"""Calculates the cation exchange capacity per unit pore volume, Qv in meq/cm3.
+
+		cec 		: cation exchange capacity in meq/100 g of dry rock
+		porosity 	: total porosity
+		density 	: grain density in g/cm3
+		"""
+		return cec*(1-porosity)*density/(100*porosity)
+
+	def bvalue(self,rwater,temperature=25.):
+		"""Calculates the equivalent conductance of clay exchange cations, B in
+		(1/ohm.m)/(meq/cm3), based on the Juhász (1981) fit of the Waxman-Thomas data.
+
+		rwater 		: formation water resistivity at the temperature
+		temperature : formation temperature in °C
+		"""
+		T = temperature
+
+		return (-1.28+0.225*T-0.0004059*T**2)/(1+rwater**1.23*(0.045*T-0.27))
+
+	@trim
+	def qvn_juhasz(self,porosity,vshale,phishale):
+		"""Calculates the normalized Qv (Qv/Qvsh) of Juhász, the fraction of the total
+		porosity that belongs to the shale.
+
+		porosity 	: total porosity
+		vshale 		: shale volume
+		phishale 	: total porosity of shale, e.g. from the density-neutron cross-plot
+		"""
+		return vshale*phishale/porosity
+
+	def bqvshale_juhasz(self,rwater,rshale,phishale):
+		"""Calculates B*Qv of the shale, the apparent water conductivity of a wet shale
+		less the conductivity of the formation water.
+
+		rwater 		: formation water resistivity
+		rshale 		: shale resistivity
+		phishale 	: total porosity of shale
+		"""
+		return self._archie.a/(phishale**self._archie.m*rshale)-1/rwater
+
+	@trim
+	def sw(self,porosity,qvalue,rwater,rtotal,bvalue,tol=1.48e-8,maxiter=50):
+		"""Calculates total water saturation based on the Waxman-Smits model,
+
+			1/Rt = Sw**n*/F*(1/Rw+B*Qv/Sw) with F* = a/phit**m*
+
+		porosity 	: total porosity
+		qvalue 		: cation exchange capacity per unit pore volume, meq/cm3
+		rwater 		: formation water resistivity
+		rtotal 		: true formation resistivity
+		bvalue 		: equivalent conductance of clay exchange cations, see bvalue
+
+		All samples are solved at once, see `solve`.
+		"""
+		return solve(bvalue*qvalue,rwater,rtotal,porosity,
+			self._archie.a,self._archie.m,self._archie.n,tol,maxiter)
+
+	@trim
+	def sw_juhasz(self,porosity,vshale,rwater,rshale,rtotal,phishale,tol=1.48e-8,maxiter=50):
+		"""Calculates total water saturation based on the Waxman-Smits model with B*Qv
+		derived from logs as the normalized Qv times B*Qv of the shale (Juhász, 1981).
+
+		porosity 	: total porosity
+		vshale 		: shale volume
+		rwater 		: formation water resistivity
+		rshale 		: shale resistivity
+		rtotal 		: true formation resistivity
+		phishale 	: total porosity of shale
+
+		All samples are solved at once, see `solve`.
+		"""
+		bqv = self.qvn_juhasz(porosity,vshale,phishale)*self.bqvshale_juhasz(rwater,rshale,phishale)
+
+		return solve(bqv,rwater,rtotal,porosity,
+			self._archie.a,self._archie.m,self._archie.n,tol,maxiter)
+
+	@trim
+	def swe(self,swt,qvn):
+		"""Calculates effective water saturation from the total one and normalized Qv."""
+		return (swt-qvn)/(1-qvn)
+
+	def bwv(self,porosity,swater):
+		"""Calculates bulk water volume."""
+		return porosity*swater
+
+	@property
+	def archie(self):
+		return self._archie
+
+	@property
+	def water_saturation(self):
+		return self.sw
+
+	@property
+	def bulk_water_volume(self):
+		return self.bwv
+
+def solve(bqv,rwater,rtotal,porosity,a,m,n,tol=1.48e-8,maxiter=50):
+	"""Returns the positive root of (Sw)**n+B*Qv*Rw*(Sw)**(n-1)-a*Rw/(phit**m*Rt) = 0 for
+	arrays of all arguments.
+
+	When n is the scalar 2, the root of the quadratic is returned, written as 2C/(K+sqrt(K**2+4C))
+	with K = B*Qv*Rw and C = a*Rw/(phit**m*Rt) to avoid cancellation. Otherwise, Newton iterations
+	start from the Archie saturation C**(1/n), limited to 1, which is above the root when B*Qv
+	is positive so that the iterations decrease monotonically to it. They are safeguarded by
+	bisection where the root lies within 0 and 1, see `pphys.insight._roots.roots`. The equation
+	and its derivative are evaluated by the fused kernels of `pphys.insight.saturation._kernels`,
+	so that parameters given per realization, as in `pphys.insight._montecarlo.montecarlo`, are
+	solved in the same iterations.
+	"""
+	C = a/porosity**m*(rwater/rtotal)
+
+	if numpy.ndim(n) == 0 and n == 2:
+		K = bqv*rwater
+		return 2*C/(K+numpy.sqrt(K**2+4*C))
+
+	x0 = numpy.fmin(C**(1/n),1.)
 
-		pass
\ No newline at end of file
+	return roots(waxman_forward,waxman_derivative,bqv,rwater,rtotal,porosity,a,m,n,
+		x0=x0,bracket=(0.,1.),tol=tol,maxiter=maxiter).root
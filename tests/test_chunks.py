@@ -0,0 +1,47 @@
+import io
+import pathlib
+import shutil
+import tempfile
+import unittest
+
+import lasio
+import numpy
+
+from pphys import ChunkReader
+
+DOCS = pathlib.Path(__file__).parents[1] / "docs"
+
+class TestChunkReader(unittest.TestCase):
+
+    def setUp(self):
+        self.temp = pathlib.Path(tempfile.mkdtemp())
+        self.file = DOCS / "tutorial_6_graph_B.LAS"
+        self.data = lasio.read(self.file).data
+
+    def tearDown(self):
+        shutil.rmtree(self.temp)
+
+    def test_rows(self):
+        chunks = list(ChunkReader(self.file,rows=250))
+        self.assertEqual(chunks[0].shape,(250,self.data.shape[1]))
+        numpy.testing.assert_array_equal(numpy.concatenate(chunks),self.data)
+
+    def test_window(self):
+        chunks = list(ChunkReader(self.file,window=5.,rows=77))
+        self.assertEqual(chunks[0][0,0],2028.)
+        self.assertAlmostEqual(chunks[0][-1,0],2032.95)
+        numpy.testing.assert_array_equal(numpy.concatenate(chunks),self.data)
+
+    def test_wrapped(self):
+        las = lasio.read(self.file)
+        las.data[3,2] = numpy.nan
+        buffer = io.StringIO()
+        las.write(buffer,wrap=True,data_width=30)
+        wrapped = self.temp / "wrapped.las"
+        wrapped.write_text(buffer.getvalue())
+        reader = ChunkReader(wrapped,window=2.,rows=13)
+        self.assertEqual(reader.keys(),las.keys())
+        numpy.testing.assert_array_equal(numpy.concatenate(list(reader)),las.data)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import importlib.util
+import pathlib
+import shutil
+import tempfile
+import unittest
+
+import numpy
+
+import pphys
+
+DOCS = pathlib.Path(__file__).parents[1] / "docs"
+
+@unittest.skipUnless(importlib.util.find_spec("pyarrow"),"pyarrow is not installed")
+class TestDataset(unittest.TestCase):
+
+    def setUp(self):
+        self.temp = pathlib.Path(tempfile.mkdtemp())
+        (self.temp / "source").mkdir()
+        for las_file in ("tutorial_1_graph_A.LAS","tutorial_6_graph_B.LAS"):
+            shutil.copy(DOCS / las_file,self.temp / "source" / las_file.replace(".LAS",".las"))
+        self.las_files = pphys.load(self.temp / "source",self.temp / "cache")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp)
+
+    def test_query(self):
+        dataset = pphys.export(self.las_files,self.temp / "dataset",row_group_size=100)
+        self.assertEqual(dataset.wells,list(self.las_files))
+        frame = dataset.query(curves=["GR","RHOB"],wells=["tutorial_6_graph_B"],top=2030,bottom=2040)
+        self.assertEqual(list(frame.columns),["well","depth","GR","RHOB"])
+        las = self.las_files["tutorial_6_graph_B"]
+        mask = (las.index>=2030)&(las.index<=2040)
+        numpy.testing.assert_array_equal(frame["GR"],las["GR"][mask])
+        self.assertEqual(dataset.header("tutorial_6_graph_B")["units"]["RHOB"],"gm/cc")
+        with self.assertRaises(KeyError):
+            dataset.query(curves=["XX"])
+
+    def test_incremental(self):
+        pphys.export({"A":self.las_files["tutorial_6_graph_B"]},self.temp / "dataset",curves=["GR"])
+        dataset = pphys.export({"B":self.las_files["tutorial_1_graph_A"]},self.temp / "dataset")
+        self.assertEqual(dataset.wells,["A","B"])
+        frame = dataset.query()
+        self.assertTrue(frame[frame["well"]=="A"]["GAMMAKT"].isna().all())
+        counts = dataset.histogram("GR",numpy.linspace(0,200,11))
+        self.assertEqual(counts.loc["A"].sum(),numpy.count_nonzero((frame[frame["well"]=="A"]["GR"]<200)))
+
+if __name__ == "__main__":
+    unittest.main()
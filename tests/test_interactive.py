@@ -0,0 +1,129 @@
+import unittest
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+from matplotlib import pyplot
+from matplotlib.backend_bases import MouseButton, MouseEvent
+
+import numpy
+
+from pphys.insight._crossplot import crossplot
+from pphys.insight._interactive import points
+from pphys.insight.saturation._pickett import pickett
+
+class TestPickett(unittest.TestCase):
+
+    def setUp(self):
+        rng = numpy.random.default_rng(0)
+        porosity = rng.uniform(0.05,0.3,30000)
+        self.plot = pickett(porosity,0.05/porosity**2/rng.uniform(0.2,1.,30000)**2)
+        self.plot.config(m=2,a=1,Rw=0.05,n=2)
+        self.plot.set_axis()
+        self.plot.set_mouse()
+        self.plot.canvas.draw()
+
+    def tearDown(self):
+        pyplot.close("all")
+
+    def event(self,name,x,y,button=None):
+        x,y = self.plot.axis.transData.transform((x,y))
+        event = MouseEvent(name,self.plot.canvas,x,y,button=button)
+        self.plot.canvas.callbacks.process(name,event)
+
+    def test_drag(self):
+        self.assertTrue(self.plot.layer.get_rasterized())
+        self.assertIsNotNone(self.plot.blit.background)
+
+        self.plot.set_lines(50,20,10)
+        lines = list(self.plot.lines)
+        before = lines[0].get_ydata().copy()
+
+        self.plot.blit.interval = 0.
+        self.event("button_press_event",1.,0.1,MouseButton.LEFT)
+        self.event("motion_notify_event",2.,0.1)
+
+        self.assertEqual(self.plot.lines,lines)
+        self.assertTrue(all(line.get_animated() for line in lines))
+        self.assertFalse(numpy.allclose(lines[0].get_ydata(),before))
+        self.assertAlmostEqual(self.plot.intercept,numpy.log10(0.1)+0.5*numpy.log10(2.))
+
+        self.event("button_release_event",2.,0.1,MouseButton.LEFT)
+        self.assertEqual(self.plot.lines,lines)
+
+    def test_density(self):
+        axis = pyplot.subplots()[1]
+        axis.set_xscale("log")
+        mesh = points(axis,[1.,10.,100.],[0.1,0.2,0.3],layer="density",bins=4)
+        self.assertEqual(mesh.get_array().count(),3)
+
+class TestCrossplot(unittest.TestCase):
+
+    def tearDown(self):
+        pyplot.close("all")
+
+    def test_add(self):
+        rng = numpy.random.default_rng(0)
+        x,y = rng.normal(0.2,0.1,5000),rng.normal(2.4,0.2,5000)
+        plot = crossplot((-0.05,0.45),(1.9,3.0),bins=(50,40))
+        plot.add(x[:2000],y[:2000],group="A").add(x[2000:],y[2000:],group="B")
+        counts,_,_ = numpy.histogram2d(x,y,bins=(plot.xedges,plot.yedges))
+        numpy.testing.assert_array_equal(plot.counts,counts.T)
+        self.assertEqual(plot.groups,["A","B"])
+        self.assertEqual(plot.majority().shape,(40,50))
+
+    def test_majority(self):
+        plot = crossplot((1.,1000.),(0.01,1.),bins=3,xscale="log",yscale="log")
+        plot.add([2.,2.,50.,0.,numpy.nan],[0.02,0.02,0.2,0.5,0.5],group=numpy.array(["b","b","a","a","a"]))
+        plot.add([2.],[0.02],group="a")
+        self.assertEqual(plot.counts.sum(),4)
+        majority = plot.majority()
+        self.assertEqual(plot.groups[majority[0,0]],"b")
+        self.assertEqual(plot.groups[majority[1,1]],"a")
+        self.assertEqual((majority>=0).sum(),2)
+
+        axis = pyplot.subplots()[1]
+        mesh = plot.draw(axis,color="majority")
+        plot.add([500.],[0.5],group="c")
+        self.assertIs(plot.draw(axis,color="majority"),mesh)
+        self.assertEqual(mesh.get_array().count(),3)
+        self.assertEqual(axis.get_xscale(),"log")
+
+    def test_groups(self):
+        rng = numpy.random.default_rng(1)
+        plot = crossplot((0.,1.),(0.,1.),bins=(7,5))
+        counts = {}
+        for index in range(200):
+            x,y = rng.random(20),rng.random(20)
+            group = rng.integers(0,12,20).astype(str) if index%2 else f"well{index%17}"
+            plot.add(x,y,group=group)
+            for cell,label in zip(plot._cells(x,y),numpy.broadcast_to(group,20)):
+                counts.setdefault(str(label),numpy.zeros(35,dtype=int))[cell] += 1
+        dense = numpy.array([counts[label] for label in plot.groups])
+        majority = numpy.where(dense.sum(axis=0)>0,dense.argmax(axis=0),-1).reshape(5,7)
+        numpy.testing.assert_array_equal(plot.majority(),majority)
+        self.assertEqual(len(plot.groups),29)
+
+    def test_draw(self):
+        plot = crossplot((0.,1.),(0.,1.),bins=30)
+        x = (numpy.arange(30)+0.5)/30
+        for index in range(25):
+            plot.add(x[index],x[index],group=f"well{index}")
+        axis = pyplot.subplots()[1]
+        mesh = plot.draw(axis,color="majority")
+        self.assertEqual(mesh.cmap.N,25)
+        numpy.testing.assert_array_equal(mesh.cmap.colors[20],mesh.cmap.colors[0])
+        self.assertEqual(mesh.norm(24),24)
+        plot.add(x[25],x[25],group="well25")
+        self.assertIs(plot.draw(axis,color="majority",alpha=0.5),mesh)
+        self.assertEqual(mesh.cmap.N,26)
+        self.assertEqual(mesh.get_alpha(),0.5)
+        mesh = plot.draw(axis,cmap="magma")
+        plot.add(x[:5],x[:5])
+        self.assertIs(plot.draw(axis,cmap="plasma",vmin=1,vmax=10),mesh)
+        self.assertEqual(mesh.get_cmap().name,"plasma")
+        self.assertEqual(mesh.get_clim(),(1,10))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import importlib
+import sys
+import unittest
+
+from unittest import mock
+
+import numpy
+
+from pphys.insight.saturation import _kernels
+
+class TestKernels(unittest.TestCase):
+
+    def setUp(self):
+        rng = numpy.random.default_rng(0)
+        self.porosity = rng.uniform(0.05,0.3,1000)
+        self.vshale = rng.uniform(0.01,0.5,1000)
+        self.rwater = rng.uniform(0.02,0.1,1000)
+        self.rtotal = rng.uniform(1.,100.,1000)
+
+    def check(self,kernels):
+
+        for n in (2.,2.3):
+
+            expected = (self.rwater/(self.porosity**2*self.rtotal))**(1/n)
+
+            numpy.testing.assert_allclose(kernels.archie_sw(self.porosity,self.rwater,self.rtotal,1.,2.,n,lower=None,upper=None),expected,rtol=1e-14)
+            numpy.testing.assert_allclose(kernels.archie_sw(self.porosity,self.rwater,self.rtotal,1.,2.,n),numpy.clip(expected,0,1),rtol=1e-14)
+
+            out = numpy.empty((3,1000))
+            result = kernels.archie_sw(self.porosity,self.rwater,self.rtotal,1.,2.,numpy.array([[2.],[n],[3.]]),upper=0.5,out=out)
+            self.assertIs(result,out)
+            numpy.testing.assert_allclose(out[1],numpy.clip(expected,0,0.5),rtol=1e-14)
+
+            swnshale = self.vshale**(-2*(1-self.vshale/2))*(3./self.rtotal)
+            swn = ((self.rwater/self.rtotal/self.porosity**2)**(-1/2)+swnshale**(-1/2))**(-2)
+            numpy.testing.assert_allclose(kernels.indonesia_sw(self.porosity,self.vshale,self.rwater,3.,self.rtotal,1-self.vshale/2,1.,2.,n),
+                numpy.clip(swn**(1/n),0,1),rtol=1e-14)
+
+        self.assertAlmostEqual(kernels.archie_sw(0.2,0.05,10.,1.,2.,2.),numpy.sqrt(0.05/(0.04*10.)),places=14)
+        self.assertTrue(numpy.isnan(kernels.archie_sw(numpy.nan,0.05,10.,1.,2.,2.)))
+
+    def test_kernels(self):
+        self.check(_kernels)
+
+    def test_numpy(self):
+        with mock.patch.dict(sys.modules,{"numba":None}):
+            kernels = importlib.reload(_kernels)
+        try:
+            self.assertEqual(kernels.BACKEND,"numpy")
+            with mock.patch.object(kernels,"BLOCK",64):
+                self.check(kernels)
+        finally:
+            importlib.reload(_kernels)
+
+if __name__ == "__main__":
+    unittest.main()
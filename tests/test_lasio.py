@@ -0,0 +1,145 @@
+import pathlib
+import unittest
+from unittest import mock
+
+import numpy
+
+from pphys._lasio import LASIO
+
+DOCS = pathlib.Path(__file__).parents[1] / "docs"
+
+class TestLASIO(unittest.TestCase):
+
+    def setUp(self):
+        self.las = LASIO(None)
+        self.depths = numpy.arange(1000,1100,0.5)
+        self.values = numpy.sin(self.depths)
+        self.values[::7] = numpy.nan
+        self.las.append_curve("DEPT",self.depths)
+        self.las.append_curve("GR",self.values)
+        self.las.append_curve("RHOB",self.values*2)
+
+    def test_mask(self):
+        mask = numpy.logical_and(self.depths>=1010.2,self.depths<=1020)
+        numpy.testing.assert_array_equal(self.las.mask(1010.2,1020),mask)
+        self.assertTrue(self.las.mask().all())
+
+    def test_window(self):
+        decreasing = LASIO(None)
+        decreasing.append_curve("DEPT",self.depths[::-1])
+        window = decreasing.window(1010.2,1020)
+        numpy.testing.assert_array_equal(numpy.arange(decreasing.index.size)[window],
+            numpy.flatnonzero((self.depths[::-1]>=1010.2)&(self.depths[::-1]<=1020)))
+        self.assertEqual(decreasing.window(),slice(0,self.depths.size))
+        unordered = LASIO(None)
+        unordered.append_curve("DEPT",numpy.array([0.,1.,0.5]))
+        with self.assertRaises(ValueError):
+            unordered.window(0.,1.)
+
+    def test_crop(self):
+        mask = numpy.logical_and(self.depths>=1010.2,self.depths<=1020)
+        cropped = self.las.crop(1010.2,1020,"GR")
+        self.assertTrue(numpy.shares_memory(cropped,self.las["GR"]))
+        numpy.testing.assert_array_equal(cropped,self.values[mask])
+        out = numpy.empty(mask.sum())
+        self.assertIs(self.las.crop(1010.2,1020,"GR",out=out),out)
+        numpy.testing.assert_array_equal(self.las.crop(1010.2,1020)["RHOB"],self.values[mask]*2)
+
+    def test_resample(self):
+        depths = numpy.concatenate((numpy.linspace(990,1110,1001),self.depths[::3]))
+        numpy.testing.assert_allclose(self.las.resample(depths,"GR"),
+            numpy.interp(depths,self.depths,self.values),rtol=1e-12)
+        resampled = self.las.resample(depths,["GR","RHOB"])
+        self.assertEqual(resampled.shape,(2,depths.size))
+        numpy.testing.assert_allclose(self.las.resample(depths)["RHOB"],resampled[1],rtol=1e-12)
+
+    def test_decreasing(self):
+        depths = numpy.arange(1100,1000,-0.5)
+        values = numpy.cos(depths)
+        decreasing = LASIO(None)
+        decreasing.append_curve("DEPT",depths)
+        decreasing.append_curve("GR",values)
+        mask = decreasing.mask(1010,1020)
+        self.assertEqual(mask.sum(),21)
+        numpy.testing.assert_array_equal(mask,(depths>=1010)&(depths<=1020))
+        numpy.testing.assert_array_equal(decreasing.crop(1010,1020,"GR"),values[mask])
+        numpy.testing.assert_array_equal(decreasing.crop(1010,1020).index,depths[mask])
+        self.assertEqual(decreasing.resample([1099.75],"GR")[0],(values[0]+values[1])/2)
+        resampled = numpy.linspace(990,1110,1001)
+        numpy.testing.assert_allclose(decreasing.resample(resampled,"GR"),
+            numpy.interp(resampled,depths[::-1],values[::-1]),rtol=1e-12)
+        unordered = LASIO(None)
+        unordered.append_curve("DEPT",numpy.array([0.,1.,0.5]))
+        numpy.testing.assert_array_equal(unordered.mask(0.2,0.8),[False,False,True])
+        with self.assertRaises(ValueError):
+            unordered.resample([0.2],"DEPT")
+
+    def test_spacing(self):
+        self.assertAlmostEqual(self.las.spacing(),0.5)
+        irregular = LASIO(None)
+        irregular.append_curve("DEPT",numpy.array([0.,0.5,1.2,1.5]))
+        self.assertIsNone(irregular.spacing())
+        decreasing = LASIO(None)
+        decreasing.append_curve("DEPT",self.depths[::-1].copy())
+        self.assertAlmostEqual(decreasing.spacing(),-0.5)
+        self.las.index[5] += 0.3 # edited in place
+        self.las.invalidate()
+        self.assertIsNone(self.las.spacing())
+        self.las.curves[0].data = numpy.arange(200.) # assigned
+        self.assertEqual(self.las.spacing(),1.)
+
+    def test_cached(self):
+        self.las.window(1010.,1020.)
+        with mock.patch("zlib.crc32",side_effect=AssertionError),\
+            mock.patch("numpy.diff",side_effect=AssertionError),\
+            mock.patch("numpy.all",side_effect=AssertionError):
+            self.assertEqual(self.las.window(1010.,1020.),slice(20,41))
+            self.assertEqual(self.las.searchsorted(1010.),20)
+            self.assertEqual(self.las.nearest(1010.2),20)
+            self.assertAlmostEqual(self.las.spacing(),0.5)
+
+    def test_searchsorted(self):
+        depths = numpy.concatenate((numpy.linspace(990,1110,1001),self.depths,[numpy.nan]))
+        for side in ("left","right"):
+            numpy.testing.assert_array_equal(self.las.searchsorted(depths,side),
+                numpy.searchsorted(self.depths,depths,side))
+            self.assertEqual(self.las.searchsorted(1010.,side),
+                numpy.searchsorted(self.depths,1010.,side))
+
+    def test_searchsorted_decreasing(self):
+        decreasing = LASIO(None)
+        decreasing.append_curve("DEPT",self.depths[::-1].copy())
+        depths = numpy.concatenate((numpy.linspace(990,1110,1001),self.depths))
+        for side in ("left","right"):
+            numpy.testing.assert_array_equal(decreasing.searchsorted(depths,side),
+                numpy.searchsorted(-self.depths[::-1],-depths,side))
+            self.assertEqual(decreasing.searchsorted(1010.,side),
+                numpy.searchsorted(-self.depths[::-1],-1010.,side))
+        unordered = LASIO(None)
+        unordered.append_curve("DEPT",numpy.array([0.,1.,0.5]))
+        with self.assertRaises(ValueError):
+            unordered.searchsorted(0.2)
+
+    def test_nearest(self):
+        depths = numpy.linspace(990,1110,1001)
+        for index in (self.depths,self.depths[::-1].copy(),numpy.array([1050.,1000.,1100.,1020.])):
+            las = LASIO(None)
+            las.append_curve("DEPT",index)
+            nearest = [numpy.argmin(numpy.abs(index-depth)) for depth in depths]
+            numpy.testing.assert_array_equal(las.nearest(depths),nearest)
+        self.assertEqual(self.las.nearest(1010.2),20)
+
+    def test_fast_engine(self):
+        for las_file in sorted(DOCS.glob("tutorial_*.LAS")):
+            las = LASIO(str(las_file))
+            with mock.patch("pphys._parse.CHUNK",10000): # splits the data section by threads
+                fast = LASIO(str(las_file),engine="fast",workers=3)
+            self.assertEqual(fast.keys(),las.keys())
+            self.assertEqual(fast.index_unit,las.index_unit)
+            numpy.testing.assert_array_equal(fast.data,las.data)
+        text = las_file.read_text().replace(" 24.44550"," 24.4x550")
+        with self.assertRaises(ValueError):
+            LASIO(text,engine="fast")
+
+if __name__ == "__main__":
+    unittest.main()
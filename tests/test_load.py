@@ -0,0 +1,98 @@
+import pathlib
+import shutil
+import tempfile
+import unittest
+
+import numpy
+
+import pphys
+
+DOCS = pathlib.Path(__file__).parents[1] / "docs"
+
+class TestLoad(unittest.TestCase):
+
+    def setUp(self):
+        self.temp = pathlib.Path(tempfile.mkdtemp())
+        self.source = self.temp / "source"
+        self.cache = self.temp / "cache"
+        self.source.mkdir()
+        for las_file in sorted(DOCS.glob("tutorial_1_*.LAS")):
+            shutil.copy(las_file,self.source / f"{las_file.stem}.las")
+        (self.source / "broken.las").write_text("not a las file")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp)
+
+    def test_errors(self):
+        errors,calls = {},[]
+        las_files = pphys.load(self.source,self.cache,errors=errors,
+            progress=lambda done,total,name: calls.append((done,total)))
+        self.assertEqual(list(las_files),["tutorial_1_graph_A","tutorial_1_graph_B"])
+        self.assertEqual(list(errors),["broken"])
+        self.assertEqual(calls[-1],(3,3))
+
+    def test_raise(self):
+        with self.assertRaises(Exception):
+            pphys.load(self.source,self.cache)
+
+    def test_workers(self):
+        errors = {}
+        serial = pphys.load(self.source,self.cache / "serial",errors={})
+        parallel = pphys.load(self.source,self.cache / "parallel",workers=2,errors=errors)
+        self.assertEqual(list(serial),list(parallel))
+        self.assertEqual(list(errors),["broken"])
+        self.assertEqual(len(list((self.cache / "parallel").glob("*.pkl"))),2)
+        self.assertEqual(len(list((self.cache / "parallel").glob("*.manifest"))),2)
+
+    def test_lazy(self):
+        las_files = pphys.load(self.source,self.cache,lazy=True,maxsize=1)
+        self.assertEqual(list(las_files),["broken","tutorial_1_graph_A","tutorial_1_graph_B"])
+        self.assertEqual(las_files.materialized,[])
+        self.assertFalse(self.cache.exists() and any(self.cache.glob("*.pkl")))
+        las_files["tutorial_1_graph_A"]
+        las_files["tutorial_1_graph_B"]
+        self.assertEqual(las_files.materialized,["tutorial_1_graph_B"])
+        with self.assertRaises(Exception):
+            las_files["broken"]
+
+    def test_lazy_errors(self):
+        errors,calls = {},[]
+        las_files = pphys.load(self.source,self.cache,lazy=True,errors=errors,
+            progress=lambda done,total,name: calls.append((done,total,name)))
+        self.assertIsNone(las_files.get("missing"))
+        self.assertIsNone(las_files.get("broken"))
+        self.assertEqual(list(errors),["broken"])
+        las_files["tutorial_1_graph_A"]
+        las_files["tutorial_1_graph_A"]
+        self.assertEqual(calls,[(1,3,"broken"),(2,3,"tutorial_1_graph_A")])
+
+    def test_compact(self):
+        shutil.copy(self.source / "tutorial_1_graph_A.las",self.source / "copy.las")
+        las_files = pphys.load(self.source,self.cache,errors={})
+        store = pphys.load(self.source,self.cache,errors={},compact=True)
+        self.assertIsInstance(store,pphys.CompactStore)
+        self.assertIs(store["copy"].index,store["tutorial_1_graph_A"].index)
+        for name,las in las_files.items():
+            self.assertEqual(store[name].keys(),las.keys())
+            numpy.testing.assert_allclose(store[name].data,las.data,rtol=1e-6)
+        self.assertEqual(store["tutorial_1_graph_B"].data.dtype,numpy.float64)
+        store.compress()
+        self.assertLess(store.nbytes,0.6*sum(curve.data.nbytes for las in las_files.values() for curve in las.curves))
+
+    def test_compact_curve(self):
+        las = pphys.load(self.source,self.cache,errors={})["tutorial_1_graph_A"]
+        values = las.curves[1].data.copy()
+        curve = pphys.compact(las).curves[1]
+        self.assertIsNot(las.curves[1],curve)
+        numpy.testing.assert_array_equal(las.curves[1].data,values)
+        curve.data[0] = 7.
+        self.assertEqual(curve.data[0],7.)
+        curve.compress()
+        self.assertEqual(curve.data[0],7.)
+        curve.data = numpy.array([1.5,numpy.nan,2.5])
+        numpy.testing.assert_array_equal(curve.data,[1.5,numpy.nan,2.5])
+        curve.compress()
+        self.assertEqual(curve.nbytes,9)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import os
+import pathlib
+import shutil
+import tempfile
+import unittest
+
+from unittest import mock
+
+import numpy
+
+import pphys
+
+DOCS = pathlib.Path(__file__).parents[1] / "docs"
+
+class TestCacheManager(unittest.TestCase):
+
+    def setUp(self):
+        self.temp = pathlib.Path(tempfile.mkdtemp())
+        self.source = self.temp / "source"
+        self.source.mkdir()
+        for las_file in sorted(DOCS.glob("tutorial_*.LAS")):
+            shutil.copy(las_file,self.source / f"{las_file.stem}.las")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp)
+
+    def test_stats(self):
+        manager = pphys.CacheManager(self.temp / "cache")
+        manager.load(self.source)
+        manager.read(self.source / "tutorial_1_graph_A.las")
+        stats = manager.stats()
+        self.assertEqual(stats["entries"],6)
+        self.assertEqual(stats["misses"],6)
+        self.assertEqual(stats["hits"],1)
+        self.assertGreater(stats["nbytes"],0)
+
+    def test_prune(self):
+        manager = pphys.CacheManager(self.temp / "cache")
+        manager.load(self.source)
+        manager.read(self.source / "tutorial_1_graph_A.las")
+        budget = manager.entries()[-1]["nbytes"]
+        evicted = manager.prune(budget)
+        self.assertEqual(len(evicted),5)
+        entries = manager.entries()
+        self.assertEqual(len(entries),1)
+        self.assertEqual(pathlib.Path(entries[0]["path"]).name,"tutorial_1_graph_A.las")
+
+    def test_evicted(self):
+        pphys.CacheManager(self.temp / "cache",backend="columnar").load(self.source)
+        manager = pphys.CacheManager(self.temp / "cache",backend="columnar",budget=1)
+        las_files = manager.load(self.source)
+        self.assertEqual(manager.entries(),[])
+        for name,las in las_files.items():
+            reference = pphys.read(self.source / f"{name}.las",self.temp)
+            numpy.testing.assert_array_equal(las.curves[1].data,reference.curves[1].data)
+
+    def test_replaced(self):
+        manager = pphys.CacheManager(self.temp / "cache",budget=1<<30)
+        manager.load(self.source)
+        las_file = self.source / "tutorial_1_graph_A.las"
+        stat = las_file.stat()
+        os.utime(las_file,ns=(stat.st_atime_ns,stat.st_mtime_ns+10**9))
+        manager.read(las_file)
+        self.assertEqual(manager._nbytes,sum(entry["nbytes"] for entry in manager.entries()))
+
+    def test_readonly(self):
+        manager = pphys.CacheManager(self.temp / "cache")
+        manager.load(self.source)
+        with mock.patch("pphys._cache.atomic",side_effect=PermissionError):
+            las_data = manager.read(self.source / "tutorial_1_graph_A.las")
+        self.assertGreater(las_data.index.size,0)
+        self.assertEqual(manager.stats()["hits"],0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import os
+import pathlib
+import shutil
+import tempfile
+import unittest
+
+import numpy
+
+import pphys
+
+from pphys._read import get_cache_file
+
+DOCS = pathlib.Path(__file__).parents[1] / "docs"
+
+class TestRead(unittest.TestCase):
+
+    def setUp(self):
+        self.temp = pathlib.Path(tempfile.mkdtemp())
+        self.file = self.temp / "tutorial_1_graph_A.las"
+        shutil.copy(DOCS / "tutorial_1_graph_A.LAS",self.file)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp)
+
+    def assertSameLas(self,las1,las2):
+        self.assertEqual(las1.keys(),las2.keys())
+        for curve1,curve2 in zip(las1.curves,las2.curves):
+            self.assertEqual(curve1.unit,curve2.unit)
+            numpy.testing.assert_array_equal(curve1.data,curve2.data)
+        for item1,item2 in zip(las1.well,las2.well):
+            self.assertEqual(item1.mnemonic,item2.mnemonic)
+            self.assertEqual(item1.value,item2.value)
+
+    def test_pickle(self):
+        las1 = pphys.read(self.file,self.temp)
+        las2 = pphys.read(self.file,self.temp)
+        self.assertTrue(get_cache_file(self.file,self.temp).exists())
+        self.assertSameLas(las1,las2)
+
+    def test_columnar(self):
+        las1 = pphys.read(self.file,self.temp,backend="columnar")
+        las2 = pphys.read(self.file,self.temp,backend="columnar")
+        cache_file = get_cache_file(self.file,self.temp,"columnar")
+        self.assertTrue(cache_file.exists())
+        self.assertTrue(cache_file.with_suffix(".npy").exists())
+        self.assertSameLas(las1,las2)
+
+    def test_replaced(self):
+        index = pphys.read(self.file,self.temp,backend="columnar").index.copy()
+        las1 = pphys.read(self.file,self.temp,backend="columnar") # curves not read yet
+        with open(self.file,"a") as f:
+            f.write(" 1840.05 1 2 3 4 5\n")
+        las2 = pphys.read(self.file,self.temp,backend="columnar")
+        self.assertEqual(las2.index.size,index.size+1)
+        numpy.testing.assert_array_equal(las1.index,index)
+
+    def test_mmap(self):
+        las1 = pphys.read(self.file,self.temp)
+        las2 = pphys.read(self.file,self.temp,backend="columnar",mmap=True)
+        self.assertIsInstance(las2.index,numpy.memmap)
+        self.assertSameLas(las1,las2)
+        numpy.testing.assert_array_equal(
+            las1["GAMMAKT"][las1.mask(1790,1791)],las2.crop(1790,1791,"GAMMAKT"))
+
+    def test_invalidation(self):
+        las1 = pphys.read(self.file,self.temp)
+        with open(self.file,"a") as f:
+            f.write(" 1840.05 1 2 3 4 5\n")
+        las2 = pphys.read(self.file,self.temp)
+        self.assertEqual(las2.index.size,las1.index.size+1)
+        las3 = pphys.read(self.file,self.temp,ignore_data=True)
+        self.assertEqual(las3.index.size,0)
+
+    def test_checksum(self):
+        pphys.read(self.file,self.temp,checksum="blake2")
+        cache_file = get_cache_file(self.file,self.temp)
+        mtime = cache_file.stat().st_mtime_ns
+        shutil.copy(DOCS / "tutorial_1_graph_A.LAS",self.file)
+        pphys.read(self.file,self.temp,checksum="blake2")
+        self.assertEqual(cache_file.stat().st_mtime_ns,mtime)
+
+    def test_permissions(self):
+        umask = os.umask(0o022)
+        try:
+            pphys.read(self.file,self.temp,backend="columnar")
+        finally:
+            os.umask(umask)
+        cache_file = get_cache_file(self.file,self.temp,"columnar")
+        for entry_file in (cache_file,cache_file.with_suffix(".npy"),cache_file.with_name(f"{cache_file.name}.manifest")):
+            self.assertEqual(entry_file.stat().st_mode&0o777,0o644)
+
+    def test_backend(self):
+        with self.assertRaises(ValueError):
+            pphys.read(self.file,self.temp,backend="parquet")
+        with self.assertRaises(ValueError):
+            pphys.read(self.file,self.temp,mmap=True)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+
+import numpy
+
+from scipy.optimize import root_scalar
+
+from pphys.insight._roots import roots
+
+def cubic(x,a,b):
+    return x**3+a*x-b
+
+def cubic_derivative(x,a,b):
+    return 3*x**2+a
+
+class TestRoots(unittest.TestCase):
+
+    def test_newton(self):
+        a = numpy.linspace(0.5,3.,20)
+        result = roots(cubic,cubic_derivative,a,2.)
+        reference = [root_scalar(cubic,method="newton",x0=1.,fprime=cubic_derivative,args=(value,2.)).root for value in a]
+        numpy.testing.assert_allclose(result.root,reference,rtol=0,atol=1e-12)
+        self.assertTrue(result.converged.all())
+        self.assertEqual(result.root.shape,a.shape)
+
+    def test_bracket(self):
+        # plain Newton steps diverge for arctan from far initial guesses
+        shift = numpy.array([0.,0.5,-0.5])
+        result = roots(lambda x,c: numpy.arctan(x-c),lambda x,c: 1/(1+(x-c)**2),shift,
+            x0=5.,bracket=(-10.,10.))
+        numpy.testing.assert_allclose(result.root,shift,atol=1e-10)
+        self.assertEqual(result.failures,0)
+
+    def test_bracket_2d(self):
+        value = numpy.linspace(0.1,0.9,12).reshape(3,4)
+        result = roots(lambda x,c: x**3-c,lambda x,c: 3*x**2,value,x0=numpy.full((3,4),.25),bracket=(0.,1.))
+        self.assertEqual(result.root.shape,(3,4))
+        numpy.testing.assert_allclose(result.root,numpy.cbrt(value),atol=1e-10)
+
+    def test_invalid(self):
+        result = roots(cubic,cubic_derivative,numpy.array([1.,numpy.nan]),numpy.array([[2.],[3.]]),warn=False)
+        self.assertEqual(result.root.shape,(2,2))
+        self.assertTrue(numpy.isnan(result.root[:,1]).all())
+        self.assertTrue(result.converged[:,0].all())
+        self.assertEqual(result.failures,0)
+
+if __name__ == "__main__":
+    unittest.main()
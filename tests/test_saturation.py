@@ -0,0 +1,162 @@
+import unittest
+
+import lasio
+import numpy
+
+from scipy.optimize import root_scalar
+
+from pphys.insight._montecarlo import montecarlo
+from pphys.insight._trim import clipstats
+
+from pphys.insight.saturation._archie import archie
+from pphys.insight.saturation._hingle import hingle, intervals
+from pphys.insight.saturation._pickett import envelope, pickett
+from pphys.insight.saturation.shalyform import simandoux, totalshale, indonesia, laminated, dispersed, dualwater, waxman, compare
+
+def waxman_forward(sw,por,qv,rw,rt,b,a,m,n):
+    return sw**n+b*qv*rw*sw**(n-1)-(a/por**m)*(rw/rt)
+
+def waxman_derivative(sw,por,qv,rw,rt,b,a,m,n):
+    return n*sw**(n-1)+(n-1)*b*qv*rw*sw**(n-2)
+
+class TestSaturation(unittest.TestCase):
+
+    def setUp(self):
+        rng = numpy.random.default_rng(0)
+        self.porosity = rng.uniform(0.05,0.3,200)
+        self.vshale = rng.uniform(0.01,0.5,200)
+        self.rwater = rng.uniform(0.02,0.1,200)
+        self.rshale = rng.uniform(1.,5.,200)
+        self.rtotal = rng.uniform(1.,100.,200)
+
+    def test_simandoux(self):
+        for n in (2.,2.3):
+            model = simandoux(archie(n=n))
+            saturation = model.sw(self.porosity,self.vshale,self.rwater,self.rshale,self.rtotal,lower=None,upper=None)
+            reference = [root_scalar(model.sw_forward,method="newton",x0=1,fprime=model.sw_derivative,
+                args=(*sample,1.,2.,n)).root for sample in zip(self.porosity,self.vshale,self.rwater,self.rshale,self.rtotal)]
+            numpy.testing.assert_allclose(saturation,reference,rtol=1e-12)
+        model = totalshale(archie(n=2.3))
+        saturation = model.sw(self.porosity,self.vshale,self.rwater,self.rshale,self.rtotal,lower=None,upper=None)
+        reference = [root_scalar(model.sw_forward,method="newton",x0=1,fprime=model.sw_derivative,
+            args=(*sample,1.,2.,2.3)).root for sample in zip(self.porosity,self.vshale,self.rwater,self.rshale,self.rtotal)]
+        numpy.testing.assert_allclose(saturation,reference,rtol=1e-12)
+
+    def test_kernels(self):
+        model = archie(a=0.8,m=1.9,n=2.3)
+        phim = self.porosity**model.m
+        shalepower = 1-self.vshale/2
+        swnshale = self.vshale**(-2*shalepower)*(self.rshale/self.rtotal)
+        qvalue = self.vshale/2
+        term1 = (qvalue*(self.rshale-self.rwater)/(2*self.rshale))**2
+        term2 = qvalue*(self.rshale+self.rwater)/(2*self.rshale)
+        cases = (
+            (model.sw,(self.porosity,self.rwater,self.rtotal),
+                (model.a/phim*self.rwater/self.rtotal)**(1/model.n)),
+            (indonesia(model).sw,(self.porosity,self.vshale,self.rwater,self.rshale,self.rtotal),
+                ((model.a/phim*self.rwater/self.rtotal)**(-1/2)+swnshale**(-1/2))**(-2/model.n)),
+            (laminated(model).sw,(self.porosity,self.vshale,self.rwater,1e3,self.rtotal),
+                ((self.rwater/self.rtotal-self.vshale*self.rwater/1e3)*model.a/phim*(1-self.vshale)**(model.m-1))**(1/model.n)),
+            (dispersed(model).sw_dewitte,(self.porosity,qvalue,self.rwater,self.rshale,self.rtotal),
+                ((model.a*self.rwater/(phim*self.rtotal)+term1)**(1/2)-term2)/(1-qvalue)),
+            )
+        for function,args,expected in cases:
+            stats,out = clipstats(),numpy.empty(200)
+            numpy.testing.assert_allclose(function(*args,lower=None,upper=None),expected,rtol=1e-12)
+            self.assertIs(function(*args,out=out,stats=stats),out)
+            numpy.testing.assert_allclose(out,numpy.clip(expected,0,1),rtol=1e-12)
+            self.assertEqual(stats.upper,numpy.count_nonzero(expected>1))
+
+    def test_compare(self):
+        model = archie(n=2.2)
+        saturation = compare(model,self.porosity,self.vshale,self.rwater,self.rshale,self.rtotal,
+            models=("archie","indonesia","simandoux","dualwater"),phishale=0.1)
+        self.assertEqual(saturation.shape,(4,200))
+        water = dualwater(model)
+        swbound = water.swbound_woodhouse(self.porosity,self.vshale,0.1)
+        expected = (
+            model.sw(self.porosity,self.rwater,self.rtotal),
+            indonesia(model).sw(self.porosity,self.vshale,self.rwater,self.rshale,self.rtotal),
+            simandoux(model).sw(self.porosity,self.vshale,self.rwater,self.rshale,self.rtotal),
+            water.swt(self.porosity,swbound,water.rwbound(self.rshale,0.1),self.rwater,self.rtotal),
+            )
+        for values,reference in zip(saturation,expected):
+            numpy.testing.assert_allclose(values,reference,atol=1e-7)
+
+    def test_montecarlo(self):
+        engine = montecarlo(simandoux,dict(n=("normal",2.,0.1),rwater=("uniform",0.02,0.04)),
+            realizations=50,seed=0,budget=8*16*50*30)
+        logs = dict(porosity=self.porosity,vshale=self.vshale,rshale=3.,rtotal=self.rtotal)
+        self.assertEqual(len(list(engine.chunks(logs))),7)
+        curves = engine.percentiles(logs)
+        realizations = [simandoux(archie(n=n)).sw(rwater=rwater,**logs)
+            for n,rwater in zip(engine.ensemble["n"].ravel(),engine.ensemble["rwater"].ravel())]
+        numpy.testing.assert_allclose(curves,numpy.percentile(realizations,(10,50,90),axis=0),rtol=1e-12)
+
+    def test_envelope(self):
+        rng = numpy.random.default_rng(1)
+        zones = numpy.repeat(["A","B","C"],1000)
+        m,arw = numpy.array([1.8,2.,2.2]),numpy.array([0.02,0.05,0.08])
+        code = numpy.repeat(numpy.arange(3),1000)
+        porosity = rng.uniform(0.05,0.3,3000)
+        saturation = numpy.where(rng.random(3000)<0.3,1.,rng.uniform(0.1,1.,3000))
+        rtotal = arw[code]/porosity**m[code]/saturation**2
+        rtotal[::97] = 1e-3 # outliers below the wet line
+        fit = envelope(porosity,rtotal,zones)
+        numpy.testing.assert_array_equal(fit.zones,["A","B","C"])
+        numpy.testing.assert_allclose(fit.m,m,rtol=1e-10)
+        numpy.testing.assert_allclose(fit.arw,arw,rtol=1e-10)
+        numpy.testing.assert_array_equal(fit.index,code)
+        fit = envelope(porosity,rtotal,zones,m=m)
+        numpy.testing.assert_allclose(fit.arw,arw,rtol=1e-10)
+        self.assertEqual(fit.archie().m.shape,(3,))
+        plot = pickett(lasio.CurveItem("PHIT",unit="v/v",data=porosity[code==1]),
+            lasio.CurveItem("RT",unit="ohm.m",data=rtotal[code==1]))
+        plot.autofit(a=0.8)
+        self.assertEqual(plot.archie["n"],2.)
+        self.assertAlmostEqual(plot.archie["a"]*plot.archie["Rw"],0.05)
+        self.assertAlmostEqual(plot.slope,-0.5)
+
+    def test_hingle(self):
+        rng = numpy.random.default_rng(2)
+        depth = numpy.arange(3000)*0.5
+        table = dict(top=[0.,500.,1000.],bottom=[499.,999.,1400.])
+        code = intervals(depth,table["top"],table["bottom"])
+        self.assertEqual((code==-1).sum(),201)
+        rhoma = numpy.array([2.65,2.71,2.87])[code]
+        porosity = rng.uniform(0.03,0.25,3000)
+        saturation = numpy.where(rng.random(3000)<0.3,1.,rng.uniform(0.1,1.,3000))
+        rhob = rhoma-porosity*(rhoma-1.)
+        plot = hingle(rhob,0.05/porosity**2/saturation**2,n=2.,depth=depth)
+        fit = plot.fit(table)
+        numpy.testing.assert_array_equal(fit.zones,[0,1,2])
+        numpy.testing.assert_allclose(fit.matrix,[2.65,2.71,2.87],rtol=1e-10)
+        values = plot.saturation(fit)
+        numpy.testing.assert_allclose(values[code>=0],saturation[code>=0],rtol=1e-10)
+        self.assertTrue(numpy.isnan(values[code<0]).all())
+        fit = plot.fit(table,matrix=[2.65,2.71,2.87])
+        numpy.testing.assert_allclose(fit.matrix,[2.65,2.71,2.87],rtol=1e-10)
+        self.assertAlmostEqual(plot.matrix,2.65)
+
+    def test_waxman(self):
+        qvalue = numpy.random.default_rng(3).uniform(0.,1.,200)
+        for n in (2.,2.3):
+            model = waxman(archie(m=1.9,n=n))
+            bvalue = model.bvalue(self.rwater,80.)
+            saturation = model.sw(self.porosity,qvalue,self.rwater,self.rtotal,bvalue,lower=None,upper=None)
+            reference = [root_scalar(waxman_forward,method="newton",x0=1,fprime=waxman_derivative,
+                args=(*sample,1.,1.9,n)).root for sample in zip(self.porosity,qvalue,self.rwater,self.rtotal,bvalue)]
+            numpy.testing.assert_allclose(saturation,reference,rtol=1e-12)
+            qvn = model.qvn_juhasz(self.porosity,self.vshale,0.1)
+            bqv = qvn*model.bqvshale_juhasz(self.rwater,1.,0.1)
+            numpy.testing.assert_allclose(model.sw_juhasz(self.porosity,self.vshale,self.rwater,1.,self.rtotal,0.1),
+                model.sw(self.porosity,bqv,self.rwater,self.rtotal,1.),rtol=1e-12)
+        engine = montecarlo(waxman,dict(n=("normal",2.,0.1),rwater=("uniform",0.02,0.04)),
+            realizations=20,seed=0,method="sw_juhasz")
+        logs = dict(porosity=self.porosity,vshale=self.vshale,rshale=1.,rtotal=self.rtotal,phishale=0.1)
+        realizations = [waxman(archie(n=n)).sw_juhasz(rwater=rwater,**logs)
+            for n,rwater in zip(engine.ensemble["n"].ravel(),engine.ensemble["rwater"].ravel())]
+        numpy.testing.assert_allclose(engine.percentiles(logs),numpy.percentile(realizations,(10,50,90),axis=0),rtol=1e-10)
+
+if __name__ == "__main__":
+    unittest.main()
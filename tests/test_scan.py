@@ -0,0 +1,35 @@
+import pathlib
+import shutil
+import tempfile
+import unittest
+
+import pphys
+
+DOCS = pathlib.Path(__file__).parents[1] / "docs"
+
+class TestScan(unittest.TestCase):
+
+    def setUp(self):
+        self.temp = pathlib.Path(tempfile.mkdtemp())
+        for las_file in sorted(DOCS.glob("tutorial_*.LAS")):
+            shutil.copy(las_file,self.temp / f"{las_file.stem}.las")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp)
+
+    def test_query(self):
+        well_index = pphys.scan(self.temp)
+        self.assertEqual(len(well_index),6)
+        wells = well_index.query(curves=["RHOB","NPHI"],top=2030,bottom=2080,unit="m")
+        self.assertEqual(wells["name"].tolist(),["tutorial_6_graph_B"])
+        self.assertEqual(len(well_index.query(top=2000,bottom=2500)),0)
+
+    def test_index_file(self):
+        index_path = self.temp / "index.json"
+        pphys.scan(self.temp,index_path)
+        well_index = pphys.WellIndex.load(index_path)
+        self.assertEqual(len(well_index),6)
+        self.assertEqual(well_index.wells.loc[0,"strt"],1786.0)
+
+if __name__ == "__main__":
+    unittest.main()
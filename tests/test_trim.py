@@ -0,0 +1,64 @@
+import unittest
+
+from unittest import mock
+
+import numpy
+
+from pphys.insight._trim import trim, clipstats
+
+@trim
+def scale(values,factor=1.):
+    return values*factor
+
+@trim
+def threaded(values,out=None):
+    return numpy.multiply(values,2.,out=out)
+
+calls = []
+
+@trim
+def fused(values,lower=0,upper=1):
+    calls.append((lower,upper))
+    return values if lower is None and upper is None else numpy.clip(values,lower,upper)
+
+class TestTrim(unittest.TestCase):
+
+    def test_clip(self):
+        values = numpy.array([-0.5,0.2,numpy.nan,1.5])
+        numpy.testing.assert_array_equal(scale(values),[0.,0.2,numpy.nan,1.])
+        numpy.testing.assert_array_equal(scale(values,lower=None,upper=0.1),[-0.5,0.1,numpy.nan,0.1])
+        numpy.testing.assert_array_equal(scale(values,lower=None,upper=None),values)
+
+    def test_scalar(self):
+        self.assertEqual(scale(1.5),1.)
+        self.assertEqual(scale(0.5,factor=3.,upper=None),1.5)
+        self.assertEqual(scale(numpy.array(-2.)),0.)
+
+    def test_out(self):
+        values = numpy.array([0.1,0.4,0.7])
+        out = numpy.empty(3)
+        self.assertIs(scale(values,factor=2.,out=out),out)
+        numpy.testing.assert_allclose(out,[0.2,0.8,1.])
+        self.assertIs(threaded(values,out=out,upper=None),out)
+        numpy.testing.assert_allclose(out,[0.2,0.8,1.4])
+
+    def test_stats(self):
+        stats = clipstats()
+        scale(numpy.array([-0.5,0.2,numpy.nan,1.5,2.]),stats=stats)
+        scale(0.5,stats=stats)
+        self.assertEqual(stats,clipstats(size=6,lower=1,upper=2,invalid=1))
+        self.assertEqual(stats.clipped,3)
+
+    def test_fused(self):
+        calls.clear()
+        values = numpy.array([-0.5,0.2,1.5])
+        with mock.patch("numpy.clip",wraps=numpy.clip) as clip:
+            numpy.testing.assert_array_equal(fused(values,upper=0.5),[0.,0.2,0.5])
+        self.assertEqual(clip.call_count,1)
+        stats = clipstats()
+        numpy.testing.assert_array_equal(fused(values,stats=stats),[0.,0.2,1.])
+        self.assertEqual(stats,clipstats(size=3,lower=1,upper=1))
+        self.assertEqual(calls,[(0,0.5),(None,None)])
+
+if __name__ == "__main__":
+    unittest.main()
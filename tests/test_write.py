@@ -0,0 +1,70 @@
+import gzip
+import pathlib
+import shutil
+import tempfile
+import unittest
+
+import lasio
+import numpy
+import pandas
+
+import pphys
+
+DOCS = pathlib.Path(__file__).parents[1] / "docs"
+
+class TestWrite(unittest.TestCase):
+
+    def setUp(self):
+        self.temp = pathlib.Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.temp)
+
+    def test_lasfile(self):
+        las = lasio.read(DOCS / "tutorial_6_graph_B.LAS")
+        las.data[5,3] = numpy.nan
+        pphys.write(self.temp / "well.las",las)
+        written = lasio.read(self.temp / "well.las")
+        self.assertEqual(written.keys(),las.keys())
+        self.assertEqual(written.well.STEP.value,0.05)
+        self.assertEqual(written.curves.RHOB.unit,"gm/cc")
+        numpy.testing.assert_allclose(written.data,las.data,atol=5e-5,equal_nan=True)
+
+    def test_gzip(self):
+        frame = pandas.DataFrame(dict(DEPT=[1000.,1000.5,1001.5],SW=[0.25,numpy.inf,0.5]))
+        pphys.write(self.temp / "well.las.gz",frame,well=dict(WELL="A-1"),precision=[2,3])
+        with gzip.open(self.temp / "well.las.gz","rt") as f:
+            written = lasio.read(f)
+        self.assertEqual(written.well.WELL.value,"A-1")
+        self.assertEqual(written.well.STEP.value,0)
+        numpy.testing.assert_array_equal(written["SW"],[0.25,numpy.nan,0.5])
+
+    def test_format(self):
+        rng = numpy.random.default_rng(0)
+        values = numpy.column_stack((numpy.arange(1000.,1200.,0.25),rng.normal(0,300,(800,3)),
+            -rng.random(800)*1e-5,rng.integers(-9999,9999,800)/8,numpy.zeros(800)))
+        for precision in (4,[2,3,0,1,5,3,1]):
+            pphys.write(self.temp / "well.las",values,mnemonics=list("DABCEFG"),precision=precision,null=-9999)
+            decimals = numpy.broadcast_to(precision,7)
+            rowfmt = " ".join(f"%10.{d}f" for d in decimals)+"\n"
+            text = (self.temp / "well.las").read_text()
+            self.assertEqual(text[text.index("\n",text.index("~A"))+1:],"".join(rowfmt % tuple(row) for row in values))
+
+    def test_sign(self):
+        values = numpy.array([[1000.,-0.5,-0.000009,-0.4],[1000.5,-0.25,0.000009,-99.5]])
+        overflow = numpy.column_stack((values,[123456789.,-1234567.]))
+        for values,precision,width in ((values,[2,8,6,0],10),(values,[2,8,6,0],7),(values,[1,8,6,2],8),(overflow,[2,8,6,0,3],10)):
+            mnemonics = list("DABCE")[:values.shape[1]]
+            pphys.write(self.temp / "well.las",values,mnemonics=mnemonics,precision=precision,width=width,null=-9999)
+            rowfmt = " ".join(f"%{width}.{d}f" for d in precision)+"\n"
+            text = (self.temp / "well.las").read_bytes()
+            self.assertEqual(text[text.index(b"\n",text.index(b"~A"))+1:],"".join(rowfmt % tuple(row) for row in values).encode())
+        written = lasio.read(self.temp / "well.las")
+        numpy.testing.assert_array_equal(written["A"],[-0.5,-0.25])
+
+    def test_null(self):
+        with self.assertRaises(ValueError):
+            pphys.write(self.temp / "well.las",numpy.ones((3,2)),mnemonics=["DEPT","SW"],precision=1)
+
+if __name__ == "__main__":
+    unittest.main()